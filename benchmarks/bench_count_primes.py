@@ -0,0 +1,47 @@
+"""
+Parallel Prime Counting Benchmark
+=================================
+Measures how primes.count_primes scales with the number of worker
+processes and reports speedup and scaling efficiency per worker count.
+
+Usage:
+    python benchmarks/bench_count_primes.py [limit] [max_workers]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from primes import count_primes
+
+
+def main() -> None:
+    """Run count_primes with 1, 2, 4, ... workers and print the scaling."""
+    limit = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 9
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != max_workers:
+        worker_counts.append(max_workers)
+
+    print(f"pi({limit}) on {os.cpu_count()} CPU(s)")
+    print(f"{'workers':>8} {'count':>12} {'time (s)':>10} {'speedup':>8} {'efficiency':>11}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count = count_primes(limit, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{workers:>8} {count:>12} {elapsed:>10.3f} "
+              f"{speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Distance Benchmark
+==================
+Compares calling distance() once per pair of tuples with the batched
+functions of the geometry module (and NumPy arrays, when installed), and
+scanning every point with querying a PointIndex.
+
+Usage:
+    python benchmarks/bench_distances.py [points]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from geometry import (
+    PointIndex, distance, distances_from, min_distances, pairwise_distances, points_array,
+)
+
+
+def timed(function, *args) -> float:
+    """Return the seconds taken by one call."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print timings for pairwise, one-to-many and nearest-neighbour distances."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    a = [(rng.random(), rng.random()) for _ in range(count)]
+    b = [(rng.random(), rng.random()) for _ in range(count)]
+    packed_a, packed_b = points_array(a), points_array(b)
+    small = count // 200 or 1
+
+    rows = [
+        ("pairwise", "tuples", timed(lambda: [distance(p, q) for p, q in zip(a, b)])),
+        ("pairwise", "array('d')", timed(pairwise_distances, packed_a, packed_b)),
+        ("one-to-many", "tuples", timed(lambda: [distance((0.5, 0.5), p) for p in a])),
+        ("one-to-many", "array('d')", timed(distances_from, (0.5, 0.5), packed_a)),
+        (f"nearest ({small})", "tuples",
+         timed(lambda: [min(distance(p, q) for q in a[:small] if q is not p) for p in a[:small]])),
+        (f"nearest ({small})", "array('d')", timed(min_distances, points_array(a[:small]))),
+    ]
+    queries = [(rng.random(), rng.random()) for _ in range(100)]
+    start = time.perf_counter()
+    index = PointIndex(zip(a, range(count)))
+    rows += [
+        ("index build", "PointIndex", time.perf_counter() - start),
+        ("100 nearest", "scan", timed(lambda: [min(distances_from(q, packed_a)) for q in queries])),
+        ("100 nearest", "PointIndex", timed(lambda: [index.nearest(q) for q in queries])),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array_a, array_b = np.array(a), np.array(b)
+        rows += [
+            ("pairwise", "numpy", timed(pairwise_distances, array_a, array_b)),
+            ("one-to-many", "numpy", timed(distances_from, (0.5, 0.5), array_a)),
+            (f"nearest ({small})", "numpy", timed(min_distances, array_a[:small])),
+        ]
+
+    print(f"{count} points")
+    print(f"{'operation':>16} {'input':>11} {'time (s)':>9}")
+    for operation, kind, elapsed in sorted(rows, key=lambda row: row[0]):
+        print(f"{operation:>16} {kind:>11} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Expression Evaluation Benchmark
+===============================
+Compares evaluating one expression over many rows by parsing it every
+time (cache cleared), by reusing the compiled Expression row by row, and
+by evaluate_batch over whole columns (NumPy arrays when installed).
+
+Usage:
+    python benchmarks/bench_expressions.py [rows]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from expressions import Expression, compile_expression
+
+SOURCE = "(price - discount) * quantity * (1 + tax / 100)"
+
+
+def main() -> None:
+    """Print rows per second for each approach."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    columns = {
+        "price": [rng.uniform(1, 100) for _ in range(count)],
+        "discount": [rng.uniform(0, 1) for _ in range(count)],
+        "quantity": [rng.randint(1, 10) for _ in range(count)],
+        "tax": [rng.choice([0, 7, 19]) for _ in range(count)],
+    }
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    expression = compile_expression(SOURCE)
+    approaches = {
+        "parse every row": lambda: [Expression(SOURCE).evaluate(row) for row in rows],
+        "compiled, per row": lambda: [expression.evaluate(row) for row in rows],
+        "evaluate_batch": lambda: expression.evaluate_batch(columns),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        arrays = {name: np.array(column) for name, column in columns.items()}
+        approaches["numpy columns"] = lambda: expression.evaluate_batch(arrays)
+
+    print(f"{count} rows of {SOURCE}")
+    print(f"{'method':>18} {'time (s)':>9} {'Mrows/s':>8}")
+    expected = None
+    for label, run in approaches.items():
+        start = time.perf_counter()
+        values = list(run())
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = values
+        assert all(abs(a - b) <= 1e-9 * abs(b) for a, b in zip(values, expected)), label
+        print(f"{label:>18} {elapsed:>9.3f} {count / elapsed / 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
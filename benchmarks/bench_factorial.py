@@ -0,0 +1,52 @@
+"""
+Factorial Benchmark
+===================
+Compares the prime-swing factorial in combinatorics.py with the simple
+left-to-right loop and with math.factorial as the reference.
+
+Usage:
+    python benchmarks/bench_factorial.py [max_exponent]
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from combinatorics import factorial, factorial_mod
+from loops import factorial_naive
+
+# The loop version above this n takes too long to be worth waiting for.
+NAIVE_MAX_N = 10 ** 5
+
+
+def time_call(func, *args) -> tuple[float, object]:
+    """Return (seconds, result) for one call."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Time n! for n = 10^3 .. 10^max_exponent."""
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"{'n':>9} {'swing (s)':>10} {'math (s)':>10} {'loop (s)':>10} {'mod (s)':>9}")
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        swing_time, swing = time_call(factorial, n)
+        math_time, reference = time_call(math.factorial, n)
+        assert swing == reference, f"factorial({n}) does not match math.factorial"
+        mod_time, _ = time_call(factorial_mod, n, 2 ** 61 - 1)
+        if n <= NAIVE_MAX_N:
+            loop_time, _ = time_call(factorial_naive, n)
+            loop_text = f"{loop_time:>10.4f}"
+        else:
+            loop_text = f"{'skipped':>10}"
+        print(f"{n:>9} {swing_time:>10.4f} {math_time:>10.4f} {loop_text} {mod_time:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
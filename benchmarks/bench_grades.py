@@ -0,0 +1,55 @@
+"""
+Grade Classification Benchmark
+==============================
+Compares grading scores one at a time with the if/elif chain against the
+bisect classifier and the bulk classify_many (table lookups, and NumPy
+searchsorted when installed).
+
+Usage:
+    python benchmarks/bench_grades.py [scores]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from control_flow import classify, classify_many, get_grade_naive
+
+
+def main() -> None:
+    """Print scores per second for each approach."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    scores = [rng.randint(0, 100) for _ in range(count)]
+    approaches = {
+        "if/elif chain": lambda: [get_grade_naive(score) for score in scores],
+        "bisect": lambda: [classify(score) for score in scores],
+        "classify_many": lambda: classify_many(scores),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array = np.array(scores)
+        approaches["numpy searchsorted"] = lambda: classify_many(array)
+
+    print(f"{count} scores")
+    print(f"{'method':>19} {'time (s)':>9} {'Mscores/s':>10}")
+    expected = None
+    for label, run in approaches.items():
+        start = time.perf_counter()
+        grades = list(run())
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = grades
+        assert grades == expected, label
+        print(f"{label:>19} {elapsed:>9.3f} {count / elapsed / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Prime Benchmark
+===============
+Compares the segmented sieve behind loops.find_prime_numbers with the
+original trial-division implementation.
+
+Usage:
+    python benchmarks/bench_primes.py [max_exponent]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from loops import find_prime_numbers, find_prime_numbers_naive
+
+# Trial division above this limit takes minutes to hours, so it is skipped.
+NAIVE_MAX_LIMIT = 10 ** 6
+
+
+def time_call(func, *args) -> tuple[float, int]:
+    """Return (seconds, number of primes) for one call."""
+    start = time.perf_counter()
+    primes = func(*args)
+    return time.perf_counter() - start, len(primes)
+
+
+def main() -> None:
+    """Run the benchmark for 10^4, 10^6 and 10^8 (or up to max_exponent)."""
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    print(f"{'limit':>12} {'primes':>10} {'sieve (s)':>10} {'trial (s)':>10} {'speedup':>8}")
+    for exponent in range(4, max_exponent + 1, 2):
+        limit = 10 ** exponent
+        sieve_time, count = time_call(find_prime_numbers, limit)
+        if limit <= NAIVE_MAX_LIMIT:
+            naive_time, _ = time_call(find_prime_numbers_naive, limit)
+            print(f"{limit:>12} {count:>10} {sieve_time:>10.4f} "
+                  f"{naive_time:>10.4f} {naive_time / sieve_time:>7.1f}x")
+        else:
+            print(f"{limit:>12} {count:>10} {sieve_time:>10.4f} {'skipped':>10} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
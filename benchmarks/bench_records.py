@@ -0,0 +1,69 @@
+"""
+Record Memory Benchmark
+=======================
+Compares the memory used by person records stored as tuples, dicts,
+__slots__ Person objects and a columnar RecordTable.
+
+Usage:
+    python benchmarks/bench_records.py [records]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from records import Person, RecordTable
+
+JOBS = ["Engineer", "Teacher", "Doctor", "Artist", "Chef"]
+
+
+def people(count: int):
+    """Yield (name, age, job) rows with a few thousand distinct names."""
+    for i in range(count):
+        yield f"user{i % 5000}", 18 + i % 60, JOBS[i % len(JOBS)]
+
+
+def measure(build) -> tuple[object, int, float]:
+    """Return (result, bytes still allocated, seconds) for build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main() -> None:
+    """Print memory per record for each representation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    builders = {
+        "tuples": lambda: list(people(count)),
+        "dicts": lambda: [{"name": n, "age": a, "job": j} for n, a, j in people(count)],
+        "Person slots": lambda: [Person(n, a, j) for n, a, j in people(count)],
+        "RecordTable": lambda: RecordTable({"name": "str", "age": "B", "job": "str"}, people(count)),
+    }
+    print(f"{count} records")
+    print(f"{'storage':>13} {'MiB':>8} {'bytes/record':>13} {'build (s)':>10} {'sort (s)':>9}")
+    for label, build in builders.items():
+        records, size, elapsed = measure(build)
+        start = time.perf_counter()
+        if isinstance(records, RecordTable):
+            records.sort("age")
+        elif label == "dicts":
+            records.sort(key=lambda record: record["age"])
+        elif label == "tuples":
+            records.sort(key=lambda record: record[1])
+        else:
+            records.sort(key=lambda record: record.age)
+        sort_time = time.perf_counter() - start
+        print(f"{label:>13} {size / 2 ** 20:>8.1f} {size / count:>13.1f} {elapsed:>10.2f} {sort_time:>9.2f}")
+        del records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Sketch Benchmark
+================
+Compares memory use and accuracy of the exact set() approach with the
+HyperLogLog sketch for counting unique emails.
+
+Usage:
+    python benchmarks/bench_sketches.py [max_exponent]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from sketches import HyperLogLog
+
+
+def emails(count: int):
+    """Yield `count` emails in which every address appears twice."""
+    for i in range(count):
+        yield f"user{i // 2}@example.com"
+
+
+def measure(build) -> tuple[int, int, float]:
+    """Return (result, peak bytes, seconds) for build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def count_with_set(count: int) -> int:
+    return len(set(emails(count)))
+
+
+def count_with_sketch(count: int, error_rate: float) -> int:
+    sketch = HyperLogLog(error_rate)
+    sketch.update(emails(count))
+    return sketch.count()
+
+
+def main() -> None:
+    """Print memory and relative error for several stream sizes."""
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"{'items':>9} {'method':>14} {'result':>9} {'error':>7} {'peak KiB':>10} {'time (s)':>9}")
+    for exponent in range(4, max_exponent + 1):
+        count = 10 ** exponent
+        exact, peak, elapsed = measure(lambda: count_with_set(count))
+        print(f"{count:>9} {'set':>14} {exact:>9} {0:>7.2%} {peak / 1024:>10.0f} {elapsed:>9.3f}")
+        for error_rate in (0.05, 0.01, 0.005):
+            estimate, peak, elapsed = measure(lambda: count_with_sketch(count, error_rate))
+            error = abs(estimate - exact) / exact
+            print(f"{count:>9} {f'HLL {error_rate:.1%}':>14} {estimate:>9} {error:>7.2%} "
+                  f"{peak / 1024:>10.0f} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Word Count Benchmark
+====================
+Generates a text file and measures the throughput (MB/s) of the
+map-reduce word counter in words.py for several worker counts.
+
+Usage:
+    python benchmarks/bench_word_count.py [size_mb] [max_workers]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add exercises folder to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "exercises"))
+
+from words import count_words_in_files
+
+VOCABULARY = [f"word{i}" for i in range(5000)] + ["the", "a", "and", "of", "to"] * 200
+
+
+def write_sample_file(path: str, size_mb: int) -> None:
+    """Write about size_mb megabytes of random words, 12 words per line."""
+    rng = random.Random(42)
+    target = size_mb * 1024 * 1024
+    with open(path, "w") as f:
+        written = 0
+        while written < target:
+            line = " ".join(rng.choices(VOCABULARY, k=12)) + "\n"
+            f.write(line)
+            written += len(line)
+
+
+def main() -> None:
+    """Count the sample file with 1, 2, 4, ... workers and print MB/s."""
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sample.txt")
+        write_sample_file(path, size_mb)
+        size = os.path.getsize(path) / (1024 * 1024)
+        # Several chunks per worker so every worker has something to do
+        chunk_size = max(1, int(size * 1024 * 1024) // (4 * max_workers))
+
+        print(f"{size:.0f} MB file on {os.cpu_count()} CPU(s)")
+        print(f"{'workers':>8} {'time (s)':>10} {'MB/s':>8} {'MB/s per worker':>16}")
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            count_words_in_files([path], workers=workers, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>8} {elapsed:>10.2f} {size / elapsed:>8.1f} "
+                  f"{size / elapsed / workers:>16.1f}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
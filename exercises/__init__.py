@@ -0,0 +1,118 @@
+"""
+Python Basics exercises as a library
+====================================
+The most useful functions from the exercise modules, available from one
+place:
+
+    import exercises
+    exercises.factorial(20)
+    exercises.is_palindrome("radar")
+
+Nothing is imported up front. The first time a name is used, only the
+submodule that defines it is imported (PEP 562 module __getattr__), so a
+program that needs one function does not pay for all the others.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # loops.py
+    "sum_numbers": "loops",
+    "factorial": "loops",
+    "find_prime_numbers": "loops",
+    # primes.py
+    "iter_primes": "primes",
+    "count_primes": "primes",
+    "segmented_sieve": "primes",
+    "prime_array": "primes",
+    "PrimeBitset": "primes",
+    "PrimeTable": "primes",
+    # series.py
+    "sum_range": "series",
+    "sum_powers": "series",
+    "sum_numbers_many": "series",
+    # combinatorics.py
+    "factorial_mod": "combinatorics",
+    "binomial": "combinatorics",
+    "permutations": "combinatorics",
+    "FactorialTable": "combinatorics",
+    # functions.py
+    "add": "functions",
+    "power": "functions",
+    "is_even": "functions",
+    "is_palindrome": "functions",
+    "get_min_max": "functions",
+    "celsius_to_fahrenheit": "functions",
+    # words.py
+    "word_stats": "words",
+    "word_stats_stream": "words",
+    "sketch_word_stats": "words",
+    "count_words_in_files": "words",
+    "word_stats_files": "words",
+    "count_words_mmap": "words",
+    # geometry.py
+    "distance": "geometry",
+    "pairwise_distances": "geometry",
+    "distances_from": "geometry",
+    "iter_distance_blocks": "geometry",
+    "min_distances": "geometry",
+    "PointIndex": "geometry",
+    # records.py
+    "Point": "records",
+    "Color": "records",
+    "Person": "records",
+    "Student": "records",
+    "RecordTable": "records",
+    # stats.py
+    "RunningStats": "stats",
+    "stream_stats": "stats",
+    "file_stats": "stats",
+    # rules.py
+    "DecisionTable": "rules",
+    # expressions.py
+    "Expression": "expressions",
+    "compile_expression": "expressions",
+    "evaluate_batch": "expressions",
+    # inputs.py
+    "ScriptedInput": "inputs",
+    "run_sessions": "inputs",
+    # sketches.py
+    "count_unique": "sketches",
+    "HyperLogLog": "sketches",
+    "CountMinSketch": "sketches",
+    "HeavyHitters": "sketches",
+    "BloomFilter": "sketches",
+    "dedup": "sketches",
+    # control_flow.py
+    "get_grade": "control_flow",
+    "check_number": "control_flow",
+    "weather_advice": "control_flow",
+    "classify": "control_flow",
+    "classify_many": "control_flow",
+    "classify_numbers": "control_flow",
+}
+
+_SUBMODULES = frozenset({
+    "combinatorics", "control_flow", "expressions", "functions", "geometry",
+    "inputs", "lists", "loops", "primes", "records", "rules", "series", "sketches",
+    "stats", "tuples", "variables", "words",
+})
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines `name` on first use."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups no longer go through __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
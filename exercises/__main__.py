@@ -0,0 +1,39 @@
+"""
+Command-line entry point: call one exercise function.
+
+Usage:
+    python -m exercises factorial 20
+    python -m exercises is_palindrome "'radar'"
+
+Arguments are parsed as Python literals when possible and passed as
+strings otherwise. Only the submodule that defines the function is
+imported.
+"""
+
+import ast
+import sys
+
+import exercises
+
+
+def parse_argument(text: str):
+    """Return text as a Python literal, or unchanged if it is not one."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def main(argv: list[str]) -> int:
+    """Run exercises.<name>(*args) and print the result."""
+    if not argv or argv[0] not in exercises.__all__:
+        print("Usage: python -m exercises <function> [args...]")
+        print("Functions: " + ", ".join(exercises.__all__))
+        return 2
+    function = getattr(exercises, argv[0])
+    print(function(*[parse_argument(arg) for arg in argv[1:]]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
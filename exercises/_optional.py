@@ -0,0 +1,22 @@
+"""
+Helpers for optional dependencies.
+
+NumPy is never imported here: if the caller passed an ndarray, NumPy is
+already in sys.modules, so looking it up there costs nothing and keeps
+importing the exercises fast when NumPy is not used.
+"""
+
+import sys
+
+
+def loaded_numpy():
+    """Return the numpy module if it has already been imported, else None."""
+    return sys.modules.get("numpy")
+
+
+def numpy_for(*values):
+    """Return the numpy module if every value is a NumPy array, else None."""
+    np = sys.modules.get("numpy")
+    if np is not None and values and all(isinstance(value, np.ndarray) for value in values):
+        return np
+    return None
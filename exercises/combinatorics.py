@@ -0,0 +1,235 @@
+"""
+Python Basics: Fast Factorials
+==============================
+This module computes factorials of large numbers quickly. Multiplying
+1 * 2 * ... * n left to right makes one huge number grow step by step,
+which is slow for big n. Here the work is reorganized so that numbers of
+similar size are multiplied together.
+
+Topics covered:
+- Product trees (binary splitting)
+- The prime-swing factorial algorithm
+- Modular arithmetic with factorials
+- A memoized factorial table with LRU eviction (binomial, permutations)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, namedtuple
+from math import isqrt, prod
+
+try:
+    from .primes import segmented_sieve
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from primes import segmented_sieve
+
+# 0! .. 20! (20! is the largest factorial that fits in 64 bits)
+_SMALL_FACTORIALS = [1]
+for _i in range(1, 21):
+    _SMALL_FACTORIALS.append(_SMALL_FACTORIALS[-1] * _i)
+del _i
+
+# Below this many factors a plain loop beats splitting further
+_PRODUCT_LEAF_SIZE = 16
+
+
+def product_tree(values: list[int]) -> int:
+    """Multiply a list of integers by splitting it in halves.
+
+    Balanced splitting keeps both operands of every multiplication about
+    the same size, which is what makes big-integer products fast.
+    """
+    if len(values) <= _PRODUCT_LEAF_SIZE:
+        return prod(values)
+    middle = len(values) // 2
+    return product_tree(values[:middle]) * product_tree(values[middle:])
+
+
+def range_product(low: int, high: int) -> int:
+    """Return low * (low + 1) * ... * (high - 1) using binary splitting."""
+    if high - low <= _PRODUCT_LEAF_SIZE:
+        return prod(range(low, high))
+    middle = (low + high) // 2
+    return range_product(low, middle) * range_product(middle, high)
+
+
+def _swing(n: int, primes: list[int]) -> int:
+    """Return the swinging factorial n! / ((n // 2)!)**2 from its prime factors."""
+    factors = []
+    root = isqrt(n)
+    for p in primes[:bisect_right(primes, n)]:
+        if p > n // 2:
+            factors.append(p)  # n // p == 1: p appears exactly once
+        elif p > n // 3:
+            continue  # n // p == 2: p does not appear
+        elif p > root:
+            if n // p & 1:
+                factors.append(p)
+        else:
+            q, power = n, 1
+            while q := q // p:
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+    return product_tree(factors)
+
+
+def _prime_swing_factorial(n: int, primes: list[int]) -> int:
+    if n < len(_SMALL_FACTORIALS):
+        return _SMALL_FACTORIALS[n]
+    return _prime_swing_factorial(n // 2, primes) ** 2 * _swing(n, primes)
+
+
+def factorial(n: int) -> int:
+    """Return n! using the prime-swing algorithm.
+
+    n! = ((n // 2)!)**2 * swing(n), where swing(n) is built from the primes
+    up to n (taken from primes.segmented_sieve) and multiplied with a
+    product tree.
+    """
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if n < len(_SMALL_FACTORIALS):
+        return _SMALL_FACTORIALS[n]
+    return _prime_swing_factorial(n, segmented_sieve(n))
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """Return n! % m without building the full factorial.
+
+    If n >= m then m itself is one of the factors, so the result is 0.
+    Otherwise the factors are multiplied in small chunks, reducing mod m
+    after each chunk so the numbers never grow large.
+    """
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if m < 1:
+        raise ValueError("modulus must be positive")
+    if n >= m or m == 1:
+        return 0
+    result = 1
+    for low in range(2, n + 1, 64):
+        result = result * prod(range(low, min(low + 64, n + 1))) % m
+    return result
+
+
+FactorialCacheInfo = namedtuple(
+    "FactorialCacheInfo", ["hits", "misses", "evictions", "entries", "bits"]
+)
+
+
+class FactorialTable:
+    """Memoized factorials that extend incrementally from cached values.
+
+    A miss for n! starts from the largest cached k! with k < n, so after
+    900! is cached, 1000! only multiplies 901 * ... * 1000 onto it. When no
+    close entry exists, the prime-swing factorial() is used instead.
+
+    Memory is capped two ways: at most `max_entries` values and at most
+    `max_bits` bits in total. The least recently used entries are evicted
+    first.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bits: int = 1 << 24) -> None:
+        if max_entries < 1 or max_bits < 1:
+            raise ValueError("cache limits must be positive")
+        self.max_entries = max_entries
+        self.max_bits = max_bits
+        self._cache: OrderedDict[int, int] = OrderedDict()
+        self._keys: list[int] = []  # cached n values, sorted
+        self._bits = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def factorial(self, n: int) -> int:
+        """Return n!, reusing and updating the cache."""
+        if n < 0:
+            raise ValueError("factorial() not defined for negative values")
+        if n < len(_SMALL_FACTORIALS):
+            return _SMALL_FACTORIALS[n]
+        value = self._cache.get(n)
+        if value is not None:
+            self.hits += 1
+            self._cache.move_to_end(n)
+            return value
+        self.misses += 1
+        index = bisect_left(self._keys, n)
+        base = self._keys[index - 1] if index else 0
+        if base >= n // 2:
+            # Extending from a close entry is cheaper than starting over
+            self._cache.move_to_end(base)
+            value = self._cache[base] * range_product(base + 1, n + 1)
+        else:
+            value = factorial(n)
+        self._store(n, value)
+        return value
+
+    def binomial(self, n: int, k: int) -> int:
+        """Return n choose k (0 when k > n)."""
+        if n < 0 or k < 0:
+            raise ValueError("n and k must be non-negative integers")
+        if k > n:
+            return 0
+        return self.factorial(n) // (self.factorial(k) * self.factorial(n - k))
+
+    def permutations(self, n: int, k: int) -> int:
+        """Return the number of ordered selections of k items from n (0 when k > n)."""
+        if n < 0 or k < 0:
+            raise ValueError("n and k must be non-negative integers")
+        if k > n:
+            return 0
+        return self.factorial(n) // self.factorial(n - k)
+
+    def cache_info(self) -> FactorialCacheInfo:
+        """Return hit/miss/eviction counters and the current cache size."""
+        return FactorialCacheInfo(
+            self.hits, self.misses, self.evictions, len(self._cache), self._bits
+        )
+
+    def clear(self) -> None:
+        """Drop all cached values and reset the counters."""
+        self._cache.clear()
+        self._keys.clear()
+        self._bits = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def _store(self, n: int, value: int) -> None:
+        bits = value.bit_length()
+        if bits > self.max_bits:
+            return  # a single value larger than the whole budget is not cached
+        self._cache[n] = value
+        insort(self._keys, n)
+        self._bits += bits
+        while len(self._cache) > self.max_entries or self._bits > self.max_bits:
+            old_n, old_value = self._cache.popitem(last=False)
+            del self._keys[bisect_left(self._keys, old_n)]
+            self._bits -= old_value.bit_length()
+            self.evictions += 1
+
+
+# Shared table used by loops.factorial and functions.factorial
+_default_table = FactorialTable()
+
+
+def cached_factorial(n: int) -> int:
+    """Return n! from the shared factorial table."""
+    return _default_table.factorial(n)
+
+
+def binomial(n: int, k: int) -> int:
+    """Return n choose k using the shared factorial table."""
+    return _default_table.binomial(n, k)
+
+
+def permutations(n: int, k: int) -> int:
+    """Return n! / (n - k)! using the shared factorial table."""
+    return _default_table.permutations(n, k)
+
+
+def factorial_cache_info() -> FactorialCacheInfo:
+    """Return the counters of the shared factorial table."""
+    return _default_table.cache_info()
@@ -7,112 +7,343 @@ This module demonstrates control flow structures in Python:
 - Logical operators
 - Nested conditions
 - Conditional expressions (ternary operator)
+- Replacing long if/elif chains with a sorted threshold table (bisect)
+- Classifying streams of numbers in chunks, stored column by column
 """
 
-print("=== IF/ELIF/ELSE Statements ===")
-
-# Basic if statement
-age: int = 20
-
-if age >= 18:
-    print(f"Age {age}: You are an adult.")
-else:
-    print(f"Age {age}: You are a minor.")
-
-# if/elif/else chain
-print("\n=== Grade Classification ===")
-score: int = 85
-
-if score >= 90:
-    grade = "A"
-elif score >= 80:
-    grade = "B"
-elif score >= 70:
-    grade = "C"
-elif score >= 60:
-    grade = "D"
-else:
-    grade = "F"
-
-print(f"Score: {score} -> Grade: {grade}")
-
-# Comparison operators
-print("\n=== Comparison Operators ===")
-x: int = 10
-y: int = 20
-
-print(f"x = {x}, y = {y}")
-print(f"x == y: {x == y}")  # Equal
-print(f"x != y: {x != y}")  # Not equal
-print(f"x > y: {x > y}")    # Greater than
-print(f"x < y: {x < y}")    # Less than
-print(f"x >= y: {x >= y}")  # Greater or equal
-print(f"x <= y: {x <= y}")  # Less or equal
-
-# Logical operators
-print("\n=== Logical Operators ===")
-is_student: bool = True
-has_id: bool = True
-age: int = 22
-
-print(f"is_student: {is_student}, has_id: {has_id}, age: {age}")
-print(f"is_student AND has_id: {is_student and has_id}")
-print(f"is_student OR has_id: {is_student or has_id}")
-print(f"NOT is_student: {not is_student}")
-print(f"is_student AND age >= 18: {is_student and age >= 18}")
-
-# Nested conditions
-print("\n=== Nested Conditions ===")
-temperature: int = 25
-is_raining: bool = False
-
-if temperature > 30:
-    print("It's hot outside!")
-    if is_raining:
-        print("But it's raining, take an umbrella.")
-    else:
-        print("Great day for the beach!")
-elif temperature > 20:
-    print("The weather is pleasant.")
-    if is_raining:
-        print("Light rain, take a jacket.")
-else:
-    print("It's cold outside!")
-
-# Conditional expression (ternary operator)
-print("\n=== Conditional Expression ===")
-age: int = 17
-status: str = "adult" if age >= 18 else "minor"
-print(f"Age {age}: You are a {status}")
-
-# Interactive example
-print("\n=== Interactive: Number Checker ===")
+import os
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import filterfalse, islice, repeat
+from operator import and_, gt, lt, sub
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+
 try:
-    number: int = int(input("Enter a number: "))
+    from ._optional import numpy_for
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import numpy_for
+
+# (lowest score, grade) pairs in ascending order; lower scores get "F"
+GRADE_THRESHOLDS = ((60, "D"), (70, "C"), (80, "B"), (90, "A"))
+
+# Numbers per chunk when classifying a stream
+DEFAULT_CHUNK_SIZE = 65536
+
+# Range buckets used by check_number and classify_numbers
+BUCKET_1_TO_10, BUCKET_11_TO_100, BUCKET_OUTSIDE = 0, 1, 2
+BUCKET_LABELS = ("between 1 and 10", "between 11 and 100", "outside the range 1-100")
+SIGN_LABELS = {-1: "negative", 0: "zero", 1: "positive"}
+_BUCKETS = {n: BUCKET_1_TO_10 if n <= 10 else BUCKET_11_TO_100 for n in range(1, 101)}
+
+
+def get_grade_naive(score: int) -> str:
+    """Return the letter grade (A-F) for a score with an if/elif chain."""
+    if score >= 90:
+        grade = "A"
+    elif score >= 80:
+        grade = "B"
+    elif score >= 70:
+        grade = "C"
+    elif score >= 60:
+        grade = "D"
+    else:
+        grade = "F"
+    return grade
+
+
+@lru_cache(maxsize=32)
+def _compile_thresholds(thresholds: tuple, default: str) -> tuple[list, list, dict]:
+    """Return (bounds, labels, table) for a threshold table.
+
+    labels[bisect_right(bounds, score)] is the label of a score, and table
+    maps each integer score 0-100 straight to its label.
+    """
+    bounds = [bound for bound, _ in thresholds]
+    if bounds != sorted(bounds):
+        raise ValueError("thresholds must be in ascending order")
+    labels = [default] + [label for _, label in thresholds]
+    table = {score: labels[bisect_right(bounds, score)] for score in range(101)}
+    return bounds, labels, table
+
+
+def _threshold_table(thresholds: Sequence, default: str) -> tuple[list, list, dict]:
+    """Compile thresholds given as any sequence of pairs (e.g. a list of lists)."""
+    try:
+        return _compile_thresholds(thresholds, default)
+    except TypeError:  # unhashable: convert to a tuple of tuples for the cache
+        return _compile_thresholds(tuple(map(tuple, thresholds)), default)
+
+
+def classify(score: float, thresholds: Sequence = GRADE_THRESHOLDS, default: str = "F") -> str:
+    """Return the label of the highest threshold that score reaches.
+
+    thresholds is a sequence of (lowest score, label) pairs in ascending
+    order (compiled once and cached); scores below all of them get
+    `default`. Finding the label is a binary search, however many
+    thresholds there are.
+    """
+    bounds, labels, _ = _threshold_table(thresholds, default)
+    return labels[bisect_right(bounds, score)]
+
+
+def classify_many(scores: Iterable, thresholds: Sequence = GRADE_THRESHOLDS, default: str = "F"):
+    """Return [classify(score) for score in scores], computed in bulk.
+
+    A NumPy array is classified with numpy.searchsorted and gives an array
+    of labels. Other inputs give a list: whole scores from 0 to 100 come
+    from a precomputed table and only the rest are binary-searched.
+    """
+    bounds, labels, table = _threshold_table(thresholds, default)
+    np = numpy_for(scores)
+    if np is not None:
+        return np.asarray(labels)[np.searchsorted(bounds, scores, side="right")]
+    scores = scores if isinstance(scores, (list, tuple)) else list(scores)
+    result = list(map(table.get, scores))
+    if None in result:
+        for i, label in enumerate(result):
+            if label is None:
+                result[i] = labels[bisect_right(bounds, scores[i])]
+    return result
+
+
+def get_grade(score: int) -> str:
+    """Return the letter grade (A-F) for a score."""
+    return classify(score)
+
+
+def weather_advice(temperature: int, is_raining: bool) -> list[str]:
+    """Return advice lines for the given weather."""
+    advice = []
+    if temperature > 30:
+        advice.append("It's hot outside!")
+        if is_raining:
+            advice.append("But it's raining, take an umbrella.")
+        else:
+            advice.append("Great day for the beach!")
+    elif temperature > 20:
+        advice.append("The weather is pleasant.")
+        if is_raining:
+            advice.append("Light rain, take a jacket.")
+    else:
+        advice.append("It's cold outside!")
+    return advice
+
+
+def check_number(number: int) -> list[str]:
+    """Describe the sign, parity and range of a number."""
+    messages = []
     
     # Check multiple conditions
     if number > 0:
-        print(f"{number} is positive")
+        messages.append(f"{number} is positive")
     elif number < 0:
-        print(f"{number} is negative")
+        messages.append(f"{number} is negative")
     else:
-        print(f"{number} is zero")
+        messages.append(f"{number} is zero")
     
     # Check even or odd
     if number % 2 == 0:
-        print(f"{number} is even")
+        messages.append(f"{number} is even")
     else:
-        print(f"{number} is odd")
+        messages.append(f"{number} is odd")
     
     # Check range
     if 1 <= number <= 10:
-        print(f"{number} is between 1 and 10")
+        messages.append(f"{number} is between 1 and 10")
     elif 11 <= number <= 100:
-        print(f"{number} is between 11 and 100")
+        messages.append(f"{number} is between 11 and 100")
+    else:
+        messages.append(f"{number} is outside the range 1-100")
+    return messages
+
+
+class NumberClasses(NamedTuple):
+    """Columnar classification of many numbers, one entry per number.
+
+    sign is -1, 0 or 1, parity is 0 (even) or 1 (odd) and bucket is one of
+    the BUCKET_* constants. The columns are array('b')/array('B'), or
+    NumPy arrays when the input was a NumPy array.
+    """
+    sign: array
+    parity: array
+    bucket: array
+
+    def __len__(self) -> int:
+        return len(self.sign)
+
+    def describe(self, index: int) -> tuple[str, str, str]:
+        """Return the (sign, parity, range) labels of one number."""
+        return (
+            SIGN_LABELS[int(self.sign[index])],
+            "odd" if self.parity[index] else "even",
+            BUCKET_LABELS[int(self.bucket[index])],
+        )
+
+
+def _classify_chunk(numbers) -> NumberClasses:
+    """Classify one chunk (a list of ints or a NumPy integer array)."""
+    np = numpy_for(numbers)
+    if np is not None:
+        bucket = np.full(len(numbers), BUCKET_OUTSIDE, dtype=np.uint8)
+        bucket[(numbers >= 11) & (numbers <= 100)] = BUCKET_11_TO_100
+        bucket[(numbers >= 1) & (numbers <= 10)] = BUCKET_1_TO_10
+        return NumberClasses(
+            np.sign(numbers).astype(np.int8),
+            (numbers & 1).astype(np.uint8),
+            bucket,
+        )
+    # map() with operator functions runs the per-number work in C
+    return NumberClasses(
+        array("b", map(sub, map(gt, numbers, repeat(0)), map(lt, numbers, repeat(0)))),
+        array("B", map(and_, numbers, repeat(1))),
+        array("B", map(_BUCKETS.get, numbers, repeat(BUCKET_OUTSIDE))),
+    )
+
+
+def iter_classify_numbers(
+    numbers: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[NumberClasses]:
+    """Yield a NumberClasses for each chunk of up to chunk_size numbers."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if numpy_for(numbers) is not None:
+        for start in range(0, len(numbers), chunk_size):
+            yield _classify_chunk(numbers[start:start + chunk_size])
+        return
+    iterator = iter(numbers)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield _classify_chunk(chunk)
+
+
+def classify_numbers(numbers: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> NumberClasses:
+    """Classify the sign, parity and range of every number, like check_number.
+
+    Any iterable of ints is processed chunk_size numbers at a time, and
+    the results are returned as three columns (see NumberClasses).
+    """
+    np = numpy_for(numbers)
+    if np is not None:
+        chunks = list(iter_classify_numbers(numbers, chunk_size))
+        if not chunks:
+            return _classify_chunk(numbers)
+        return NumberClasses(*(np.concatenate(column) for column in zip(*chunks)))
+    result = NumberClasses(array("b"), array("B"), array("B"))
+    for chunk in iter_classify_numbers(numbers, chunk_size):
+        for column, part in zip(result, chunk):
+            column.extend(part)
+    return result
+
+
+def classify_numbers_file(
+    path: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[NumberClasses]:
+    """Classify newline-delimited integers in a file, one chunk at a time.
+
+    Only chunk_size lines are held in memory at once; blank lines are
+    skipped.
+    """
+    with open(path) as f:
+        yield from iter_classify_numbers(map(int, filterfalse(str.isspace, f)), chunk_size)
+
+
+def demonstrate_if_statements() -> None:
+    """Demonstrate basic if/else."""
+    print("=== IF/ELIF/ELSE Statements ===")
+    
+    # Basic if statement
+    age: int = 20
+    
+    if age >= 18:
+        print(f"Age {age}: You are an adult.")
     else:
-        print(f"{number} is outside the range 1-100")
-        
-except ValueError:
-    print("Error: Please enter a valid integer.")
+        print(f"Age {age}: You are a minor.")
+
+
+def demonstrate_grade_classification() -> None:
+    """Demonstrate an if/elif/else chain."""
+    print("\n=== Grade Classification ===")
+    score: int = 85
+    grade = get_grade_naive(score)
+    print(f"Score: {score} -> Grade: {grade}")
+    # The same thresholds as data, searched with bisect and applied in bulk
+    print(f"Scores [95, 72, 58] -> Grades: {classify_many([95, 72, 58])}")
+
+
+def demonstrate_comparison_operators() -> None:
+    """Demonstrate comparison operators."""
+    print("\n=== Comparison Operators ===")
+    x: int = 10
+    y: int = 20
+    
+    print(f"x = {x}, y = {y}")
+    print(f"x == y: {x == y}")  # Equal
+    print(f"x != y: {x != y}")  # Not equal
+    print(f"x > y: {x > y}")    # Greater than
+    print(f"x < y: {x < y}")    # Less than
+    print(f"x >= y: {x >= y}")  # Greater or equal
+    print(f"x <= y: {x <= y}")  # Less or equal
+
+
+def demonstrate_logical_operators() -> None:
+    """Demonstrate and, or and not."""
+    print("\n=== Logical Operators ===")
+    is_student: bool = True
+    has_id: bool = True
+    age: int = 22
+    
+    print(f"is_student: {is_student}, has_id: {has_id}, age: {age}")
+    print(f"is_student AND has_id: {is_student and has_id}")
+    print(f"is_student OR has_id: {is_student or has_id}")
+    print(f"NOT is_student: {not is_student}")
+    print(f"is_student AND age >= 18: {is_student and age >= 18}")
+
+
+def demonstrate_nested_conditions() -> None:
+    """Demonstrate conditions inside conditions."""
+    print("\n=== Nested Conditions ===")
+    temperature: int = 25
+    is_raining: bool = False
+    
+    for line in weather_advice(temperature, is_raining):
+        print(line)
+
+
+def demonstrate_conditional_expression() -> None:
+    """Demonstrate the ternary operator."""
+    print("\n=== Conditional Expression ===")
+    age: int = 17
+    status: str = "adult" if age >= 18 else "minor"
+    print(f"Age {age}: You are a {status}")
+
+
+def number_checker(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Interactive example: describe a number typed by the user.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
+    print("\n=== Interactive: Number Checker ===")
+    try:
+        number: int = int(ask("Enter a number: "))
+        for line in check_number(number):
+            print(line)
+    except ValueError:
+        print("Error: Please enter a valid integer.")
+
+
+def main(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Run all control flow demonstrations."""
+    demonstrate_if_statements()
+    demonstrate_grade_classification()
+    demonstrate_comparison_operators()
+    demonstrate_logical_operators()
+    demonstrate_nested_conditions()
+    demonstrate_conditional_expression()
+    number_checker(ask)
+    
+    print("\n=== Program Complete ===")
+
 
-print("\n=== Program Complete ===")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
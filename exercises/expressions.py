@@ -0,0 +1,304 @@
+"""
+Python Basics: Expression Engine
+================================
+The calculator in functions.py handles one "number operator number" step
+per prompt. This module evaluates whole arithmetic expressions such as
+"2 * (price - discount) ** 2". An expression is parsed once into a short
+list of stack-machine instructions (reverse Polish notation), compiled
+expressions are cached by their source text, and one compiled expression
+can be evaluated over whole columns of variable values at a time.
+
+Topics covered:
+- Tokenizing with a regular expression
+- Recursive-descent parsing and operator precedence
+- Compiling to stack-machine bytecode (with constant folding)
+- Caching with functools.lru_cache
+- Column-wise (batch) evaluation, optionally with NumPy
+"""
+
+import re
+from functools import lru_cache
+from itertools import repeat
+from math import log2
+from operator import add, floordiv, mod, mul, neg, pow, sub, truediv
+from typing import Any, Iterable, Mapping, NamedTuple, Optional
+
+try:
+    from ._optional import loaded_numpy, numpy_for
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import loaded_numpy, numpy_for
+
+# Compiled expressions kept in the cache, least recently used dropped first
+CACHE_SIZE = 1024
+
+BINARY_OPERATORS = {
+    "+": add, "-": sub, "*": mul, "/": truediv, "//": floordiv, "%": mod, "**": pow,
+}
+
+# Constant integer results above this many bits are not folded at compile
+# time (the same limit CPython's own constant folder uses)
+MAX_FOLD_BITS = 128
+
+# Default limit on integer results for Expression.evaluate_bounded
+MAX_RESULT_BITS = 1 << 16
+
+# Instruction kinds
+CONST, NAME, UNARY, BINARY = range(4)
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<op>\*\*|//|[-+*/%()])
+    )""", re.VERBOSE)
+
+
+class Token(NamedTuple):
+    kind: str  # "number", "name", "op" or "end"
+    text: str
+    position: int
+
+
+def tokenize(source: str) -> list[Token]:
+    """Split an expression into tokens, ending with an "end" token."""
+    tokens = []
+    position = 0
+    end = len(source.rstrip())
+    while position < end:
+        match = _TOKEN.match(source, position)
+        if match is None:
+            bad = len(source) - len(source[position:].lstrip())
+            raise ValueError(f"unexpected character {source[bad]!r} at position {bad}")
+        kind = match.lastgroup
+        tokens.append(Token(kind, match.group(kind), match.start(kind)))
+        position = match.end()
+    tokens.append(Token("end", "", end))
+    return tokens
+
+
+def _number(text: str):
+    return float(text) if any(c in text for c in ".eE") else int(text)
+
+
+def _int_result_bits(op, left, right) -> int:
+    """Estimate the bit length of an int * or ** result without computing it."""
+    if not (isinstance(left, int) and isinstance(right, int)):
+        return 0
+    if op is mul:
+        return left.bit_length() + right.bit_length()
+    if op is pow and right > 0:
+        if abs(left) <= 1:  # 0, 1 and -1 stay that small
+            return left.bit_length()
+        return int(right * log2(abs(left))) + 1
+    return 0
+
+
+class _Parser:
+    """Recursive-descent parser that emits instructions as it goes.
+
+    Grammar, lowest precedence first (** binds tighter than unary minus on
+    its left, so -2 ** 2 == -4 as in Python):
+
+        expression := term (("+" | "-") term)*
+        term       := unary (("*" | "/" | "//" | "%") unary)*
+        unary      := ("-" | "+") unary | power
+        power      := atom ("**" unary)?
+        atom       := number | name | "(" expression ")"
+    """
+
+    def __init__(self, source: str) -> None:
+        self.tokens = tokenize(source)
+        self.index = 0
+        self.code: list[tuple] = []
+
+    def parse(self) -> tuple[tuple, ...]:
+        if self.tokens[0].kind == "end":
+            raise ValueError("empty expression")
+        self.expression()
+        token = self.tokens[self.index]
+        if token.kind != "end":
+            raise ValueError(f"unexpected {token.text!r} at position {token.position}")
+        return tuple(self.code)
+
+    def _accept(self, *texts: str) -> Optional[str]:
+        token = self.tokens[self.index]
+        if token.kind == "op" and token.text in texts:
+            self.index += 1
+            return token.text
+        return None
+
+    def _emit_binary(self, symbol: str) -> None:
+        op = BINARY_OPERATORS[symbol]
+        left, right = self.code[-2:]
+        if (left[0] == CONST and right[0] == CONST
+                and _int_result_bits(op, left[1], right[1]) <= MAX_FOLD_BITS):
+            try:
+                # Both operands are known: compute the result now
+                self.code[-2:] = [(CONST, op(left[1], right[1]))]
+                return
+            except ArithmeticError:  # e.g. 1 / 0: leave it to raise when evaluated
+                pass
+        self.code.append((BINARY, op))
+
+    def expression(self) -> None:
+        self.term()
+        while symbol := self._accept("+", "-"):
+            self.term()
+            self._emit_binary(symbol)
+
+    def term(self) -> None:
+        self.unary()
+        while symbol := self._accept("*", "/", "//", "%"):
+            self.unary()
+            self._emit_binary(symbol)
+
+    def unary(self) -> None:
+        symbol = self._accept("-", "+")
+        if symbol is None:
+            self.power()
+            return
+        self.unary()
+        if symbol == "-":
+            last = self.code[-1]
+            if last[0] == CONST:
+                self.code[-1] = (CONST, -last[1])
+            else:
+                self.code.append((UNARY, neg))
+
+    def power(self) -> None:
+        self.atom()
+        if self._accept("**"):
+            self.unary()
+            self._emit_binary("**")
+
+    def atom(self) -> None:
+        token = self.tokens[self.index]
+        if token.kind == "number":
+            self.code.append((CONST, _number(token.text)))
+        elif token.kind == "name":
+            self.code.append((NAME, token.text))
+        elif self._accept("("):
+            self.expression()
+            if not self._accept(")"):
+                token = self.tokens[self.index]
+                raise ValueError(f"expected ')' at position {token.position}")
+            return
+        elif token.kind == "end":
+            raise ValueError("unexpected end of expression")
+        else:
+            raise ValueError(f"unexpected {token.text!r} at position {token.position}")
+        self.index += 1
+
+
+class Expression:
+    """A parsed arithmetic expression, ready to be evaluated many times.
+
+    `code` is the list of stack-machine instructions and `names` the
+    variables it reads, in order of first use.
+    """
+
+    def __init__(self, source: str) -> None:
+        try:
+            code = _Parser(source).parse()
+        except RecursionError:
+            raise ValueError("expression is nested too deeply") from None
+        self.source = source
+        self.code = code
+        self.names = tuple(dict.fromkeys(arg for kind, arg in code if kind == NAME))
+
+    def evaluate(self, bindings: Optional[Mapping[str, Any]] = None, **values):
+        """Return the value for one set of variables (a mapping or keywords)."""
+        if bindings:
+            values = {**bindings, **values}
+        return self._run(values, None)
+
+    def evaluate_bounded(
+        self, bindings: Optional[Mapping[str, Any]] = None, max_bits: int = MAX_RESULT_BITS,
+    ):
+        """Like evaluate(), but raise OverflowError instead of computing an
+        integer * or ** result longer than max_bits (e.g. 9 ** 9 ** 9).
+        """
+        return self._run(bindings or {}, max_bits)
+
+    def _run(self, values: Mapping[str, Any], max_bits: Optional[int]):
+        stack: list = []
+        push, pop = stack.append, stack.pop
+        for kind, arg in self.code:
+            if kind == CONST:
+                push(arg)
+            elif kind == NAME:
+                push(values[arg])
+            elif kind == BINARY:
+                right = pop()
+                if max_bits is not None and _int_result_bits(arg, stack[-1], right) > max_bits:
+                    raise OverflowError("integer result too large")
+                stack[-1] = arg(stack[-1], right)
+            else:
+                stack[-1] = arg(stack[-1])
+        return stack[0]
+
+    def evaluate_batch(self, columns: Mapping[str, Iterable]):
+        """Return the value for every row of the given variable columns.
+
+        Each instruction is applied to whole columns with map(), so the
+        per-row work runs in C. When any column is a NumPy array, all
+        columns are converted to arrays and the result is an array (NumPy
+        gives inf/nan where plain division would raise ZeroDivisionError).
+        """
+        if any(map(numpy_for, columns.values())):
+            np = loaded_numpy()
+            data = {name: np.asarray(columns[name]) for name in self.names}
+            return self._run_columns(data, None)
+        data = {name: list(columns[name]) for name in self.names}
+        rows = len(next(iter(data.values()))) if data else len(next(iter(columns.values()), ()))
+        return self._run_columns(data, rows)
+
+    def _run_columns(self, data: Mapping[str, Any], rows: Optional[int]):
+        """Run the code over columns; rows is None for NumPy arrays."""
+        # Stack entries are (is_column, value): scalars stay scalars
+        stack: list[tuple[bool, Any]] = []
+        for kind, arg in self.code:
+            if kind == CONST:
+                stack.append((False, arg))
+            elif kind == NAME:
+                stack.append((True, data[arg]))
+            elif kind == UNARY:
+                is_column, value = stack[-1]
+                if is_column and rows is not None:
+                    value = list(map(arg, value))
+                else:
+                    value = arg(value)
+                stack[-1] = (is_column, value)
+            else:
+                right_column, right = stack.pop()
+                left_column, left = stack[-1]
+                if rows is None or not (left_column or right_column):
+                    value = arg(left, right)
+                else:
+                    left = left if left_column else repeat(left)
+                    right = right if right_column else repeat(right)
+                    value = list(map(arg, left, right))
+                stack[-1] = (left_column or right_column, value)
+        is_column, value = stack[0]
+        if is_column:
+            return value
+        return [value] * rows if rows is not None else value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(source: str) -> Expression:
+    """Parse an expression, reusing the cached result for a repeated source."""
+    return Expression(source)
+
+
+def evaluate(source: str, bindings: Optional[Mapping[str, Any]] = None, **values):
+    """Evaluate an expression string, e.g. evaluate("2 * (x + 1)", x=3) == 8."""
+    return compile_expression(source).evaluate(bindings, **values)
+
+
+def evaluate_batch(source: str, columns: Mapping[str, Iterable]):
+    """Evaluate an expression string for every row of the given columns."""
+    return compile_expression(source).evaluate_batch(columns)
@@ -12,32 +12,35 @@ This module demonstrates Python functions:
 - Docstrings
 """
 
-print("=== Basic Function Definition ===")
+from typing import Callable, Iterable, Optional
+
+try:
+    from .combinatorics import cached_factorial
+    from .expressions import compile_expression
+    from .records import Student
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from combinatorics import cached_factorial
+    from expressions import compile_expression
+    from records import Student
+
 
 # Simple function without parameters
 def greet():
     """Print a greeting message."""
     print("Hello, World!")
 
-greet()
 
 # Function with parameters
 def greet_person(name: str):
     """Greet a person by name."""
     print(f"Hello, {name}!")
 
-greet_person("Alejandro")
-greet_person("Maria")
-
-print("\n=== Functions with Return Values ===")
 
 # Function that returns a value
 def add(a: int, b: int) -> int:
     """Add two numbers and return the result."""
     return a + b
 
-result = add(5, 3)
-print(f"5 + 3 = {result}")
 
 # Function with multiple operations
 def calculate_area(length: float, width: float) -> float:
@@ -45,21 +48,25 @@ def calculate_area(length: float, width: float) -> float:
     area = length * width
     return area
 
-rectangle_area = calculate_area(5.0, 3.0)
-print(f"Area of rectangle (5.0 x 3.0): {rectangle_area}")
-
-print("\n=== Functions with Multiple Return Values ===")
 
-def get_min_max(numbers: list[int]) -> tuple[int, int]:
-    """Return the minimum and maximum values from a list."""
-    return min(numbers), max(numbers)
+def get_min_max(numbers: Iterable[int]) -> tuple[int, int]:
+    """Return the minimum and maximum values from any iterable, in one pass.
 
-nums = [3, 7, 1, 9, 4]
-minimum, maximum = get_min_max(nums)
-print(f"Numbers: {nums}")
-print(f"Min: {minimum}, Max: {maximum}")
+    Only < is used, so any comparable values work (numbers, strings, ...).
+    """
+    iterator = iter(numbers)
+    for first in iterator:
+        break
+    else:
+        raise ValueError("get_min_max() arg is an empty iterable")
+    smallest = largest = first
+    for value in iterator:
+        if value < smallest:
+            smallest = value
+        elif largest < value:
+            largest = value
+    return smallest, largest
 
-print("\n=== Default Parameters ===")
 
 def power(base: int, exponent: int = 2) -> int:
     """
@@ -68,37 +75,16 @@ def power(base: int, exponent: int = 2) -> int:
     """
     return base ** exponent
 
-print(f"power(3): {power(3)}")           # Uses default exponent (2)
-print(f"power(3, 3): {power(3, 3)}")     # Uses provided exponent (3)
-print(f"power(2, 4): {power(2, 4)}")     # 2^4 = 16
 
 def greet_with_time(name: str, time: str = "day") -> str:
     """Greet someone with time of day."""
     return f"Good {time}, {name}!"
 
-print(greet_with_time("Alejandro"))
-print(greet_with_time("Alejandro", "morning"))
-print(greet_with_time("Alejandro", "evening"))
-
-print("\n=== Keyword Arguments ===")
 
 def create_profile(name: str, age: int, city: str, country: str) -> str:
     """Create a user profile string."""
     return f"{name}, {age} years old, from {city}, {country}"
 
-# Positional arguments
-profile1 = create_profile("Ana", 25, "Bogotá", "Colombia")
-print(profile1)
-
-# Keyword arguments (order doesn't matter)
-profile2 = create_profile(country="Mexico", name="Carlos", age=30, city="CDMX")
-print(profile2)
-
-# Mix of positional and keyword
-profile3 = create_profile("Luis", 28, city="Madrid", country="Spain")
-print(profile3)
-
-print("\n=== Variable Number of Arguments (*args) ===")
 
 def sum_all(*numbers: int) -> int:
     """Sum any number of arguments."""
@@ -107,9 +93,6 @@ def sum_all(*numbers: int) -> int:
         total += num
     return total
 
-print(f"sum_all(1, 2, 3): {sum_all(1, 2, 3)}")
-print(f"sum_all(10, 20, 30, 40): {sum_all(10, 20, 30, 40)}")
-print(f"sum_all(5): {sum_all(5)}")
 
 def print_items(*items):
     """Print all items passed to the function."""
@@ -117,9 +100,6 @@ def print_items(*items):
     for i, item in enumerate(items, 1):
         print(f"  {i}. {item}")
 
-print_items("apple", "banana", "cherry")
-
-print("\n=== Variable Keyword Arguments (**kwargs) ===")
 
 def print_info(**info):
     """Print key-value pairs of information."""
@@ -127,65 +107,27 @@ def print_info(**info):
     for key, value in info.items():
         print(f"  {key}: {value}")
 
-print_info(name="Alejandro", age=20, city="Medellín")
-print()
-print_info(language="Python", version="3.12", type="Programming")
-
-print("\n=== Lambda Functions ===")
-
-# Lambda function (anonymous function)
-square = lambda x: x ** 2
-print(f"square(5): {square(5)}")
-
-# Lambda with multiple parameters
-multiply = lambda x, y: x * y
-print(f"multiply(4, 5): {multiply(4, 5)}")
-
-# Lambda in sorted()
-students = [
-    {"name": "Ana", "grade": 85},
-    {"name": "Carlos", "grade": 92},
-    {"name": "Diana", "grade": 78}
-]
-
-sorted_students = sorted(students, key=lambda s: s["grade"], reverse=True)
-print("\nStudents sorted by grade:")
-for student in sorted_students:
-    print(f"  {student['name']}: {student['grade']}")
-
-print("\n=== Practical Examples ===")
 
 def is_even(number: int) -> bool:
     """Check if a number is even."""
     return number % 2 == 0
 
+
 def is_palindrome(text: str) -> bool:
     """Check if a string is a palindrome."""
     cleaned = text.lower().replace(" ", "")
     return cleaned == cleaned[::-1]
 
+
 def factorial(n: int) -> int:
-    """Calculate factorial of n."""
-    if n == 0 or n == 1:
-        return 1
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    """Calculate factorial of n (shared factorial table from combinatorics.py)."""
+    return cached_factorial(n)
+
 
 def celsius_to_fahrenheit(celsius: float) -> float:
     """Convert Celsius to Fahrenheit."""
     return (celsius * 9/5) + 32
 
-# Test practical functions
-print(f"is_even(4): {is_even(4)}")
-print(f"is_even(7): {is_even(7)}")
-print(f"is_palindrome('radar'): {is_palindrome('radar')}")
-print(f"is_palindrome('hello'): {is_palindrome('hello')}")
-print(f"factorial(5): {factorial(5)}")
-print(f"25°C to Fahrenheit: {celsius_to_fahrenheit(25)}°F")
-
-print("\n=== Nested Functions ===")
 
 def outer_function(text: str):
     """Demonstrate nested functions."""
@@ -197,19 +139,20 @@ def outer_function(text: str):
     print(f"Outer function says: {text}")
     inner_function()
 
-outer_function("Hello from nested functions!")
 
-print("\n=== Interactive Calculator ===")
+def calculator_naive(ask: Optional[Callable[[str], str]] = None):
+    """Simple interactive calculator: one number, operator and number.
 
-def calculator():
-    """Simple interactive calculator."""
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
     print("Simple Calculator")
     print("Operations: +, -, *, /")
     
     try:
-        num1 = float(input("Enter first number: "))
-        operation = input("Enter operation (+, -, *, /): ")
-        num2 = float(input("Enter second number: "))
+        num1 = float(ask("Enter first number: "))
+        operation = ask("Enter operation (+, -, *, /): ")
+        num2 = float(ask("Enter second number: "))
         
         if operation == "+":
             result = num1 + num2
@@ -232,6 +175,159 @@ def calculator():
     except ValueError:
         print("Error: Please enter valid numbers!")
 
-calculator()
 
-print("\n=== Program Complete ===")
\ No newline at end of file
+def calculator(ask: Optional[Callable[[str], str]] = None):
+    """Interactive calculator for whole expressions such as 2 * (3 + 4).
+
+    The expression is parsed and evaluated by the expressions module.
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
+    print("Simple Calculator")
+    print("Operations: +, -, *, /, //, %, ** and parentheses")
+    source = ask("Enter an expression: ")
+    try:
+        expression = compile_expression(source)
+        if expression.names:
+            print(f"Error: Unknown name '{expression.names[0]}'!")
+            return
+        result = expression.evaluate_bounded()
+    except ZeroDivisionError:
+        print("Error: Division by zero!")
+        return
+    except (ValueError, OverflowError, MemoryError) as error:
+        print(f"Error: Invalid expression ({error})!")
+        return
+    
+    print(f"Result: {source.strip()} = {result}")
+
+
+def demonstrate_basic_functions() -> None:
+    """Demonstrate defining and calling functions."""
+    print("=== Basic Function Definition ===")
+    greet()
+    greet_person("Alejandro")
+    greet_person("Maria")
+
+
+def demonstrate_return_values() -> None:
+    """Demonstrate functions that return one or more values."""
+    print("\n=== Functions with Return Values ===")
+    result = add(5, 3)
+    print(f"5 + 3 = {result}")
+    
+    rectangle_area = calculate_area(5.0, 3.0)
+    print(f"Area of rectangle (5.0 x 3.0): {rectangle_area}")
+    
+    print("\n=== Functions with Multiple Return Values ===")
+    nums = [3, 7, 1, 9, 4]
+    minimum, maximum = get_min_max(nums)
+    print(f"Numbers: {nums}")
+    print(f"Min: {minimum}, Max: {maximum}")
+
+
+def demonstrate_default_parameters() -> None:
+    """Demonstrate default parameter values."""
+    print("\n=== Default Parameters ===")
+    print(f"power(3): {power(3)}")           # Uses default exponent (2)
+    print(f"power(3, 3): {power(3, 3)}")     # Uses provided exponent (3)
+    print(f"power(2, 4): {power(2, 4)}")     # 2^4 = 16
+    
+    print(greet_with_time("Alejandro"))
+    print(greet_with_time("Alejandro", "morning"))
+    print(greet_with_time("Alejandro", "evening"))
+
+
+def demonstrate_keyword_arguments() -> None:
+    """Demonstrate positional and keyword arguments."""
+    print("\n=== Keyword Arguments ===")
+    
+    # Positional arguments
+    profile1 = create_profile("Ana", 25, "Bogotá", "Colombia")
+    print(profile1)
+    
+    # Keyword arguments (order doesn't matter)
+    profile2 = create_profile(country="Mexico", name="Carlos", age=30, city="CDMX")
+    print(profile2)
+    
+    # Mix of positional and keyword
+    profile3 = create_profile("Luis", 28, city="Madrid", country="Spain")
+    print(profile3)
+
+
+def demonstrate_variable_arguments() -> None:
+    """Demonstrate *args and **kwargs."""
+    print("\n=== Variable Number of Arguments (*args) ===")
+    print(f"sum_all(1, 2, 3): {sum_all(1, 2, 3)}")
+    print(f"sum_all(10, 20, 30, 40): {sum_all(10, 20, 30, 40)}")
+    print(f"sum_all(5): {sum_all(5)}")
+    
+    print_items("apple", "banana", "cherry")
+    
+    print("\n=== Variable Keyword Arguments (**kwargs) ===")
+    print_info(name="Alejandro", age=20, city="Medellín")
+    print()
+    print_info(language="Python", version="3.12", type="Programming")
+
+
+def demonstrate_lambda_functions() -> None:
+    """Demonstrate anonymous (lambda) functions."""
+    print("\n=== Lambda Functions ===")
+    
+    # Lambda function (anonymous function)
+    square = lambda x: x ** 2
+    print(f"square(5): {square(5)}")
+    
+    # Lambda with multiple parameters
+    multiply = lambda x, y: x * y
+    print(f"multiply(4, 5): {multiply(4, 5)}")
+    
+    # Lambda in sorted()
+    students = [
+        Student("Ana", 85),
+        Student("Carlos", 92),
+        Student("Diana", 78)
+    ]
+    
+    sorted_students = sorted(students, key=lambda s: s.grade, reverse=True)
+    print("\nStudents sorted by grade:")
+    for name, grade in sorted_students:
+        print(f"  {name}: {grade}")
+
+
+def demonstrate_practical_examples() -> None:
+    """Demonstrate small practical helper functions."""
+    print("\n=== Practical Examples ===")
+    print(f"is_even(4): {is_even(4)}")
+    print(f"is_even(7): {is_even(7)}")
+    print(f"is_palindrome('radar'): {is_palindrome('radar')}")
+    print(f"is_palindrome('hello'): {is_palindrome('hello')}")
+    print(f"factorial(5): {factorial(5)}")
+    print(f"25°C to Fahrenheit: {celsius_to_fahrenheit(25)}°F")
+
+
+def demonstrate_nested_functions() -> None:
+    """Demonstrate a function defined inside another function."""
+    print("\n=== Nested Functions ===")
+    outer_function("Hello from nested functions!")
+
+
+def main(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Run all function demonstrations."""
+    demonstrate_basic_functions()
+    demonstrate_return_values()
+    demonstrate_default_parameters()
+    demonstrate_keyword_arguments()
+    demonstrate_variable_arguments()
+    demonstrate_lambda_functions()
+    demonstrate_practical_examples()
+    demonstrate_nested_functions()
+    
+    print("\n=== Interactive Calculator ===")
+    calculator(ask)
+    
+    print("\n=== Program Complete ===")
+
+
+if __name__ == "__main__":
+    main()
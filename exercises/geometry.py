@@ -0,0 +1,356 @@
+"""
+Python Basics: Points and Distances
+===================================
+The tuples module measures the distance between two (x, y) tuples. This
+module does the same for many points at once: points are stored as N x 2
+arrays, a NumPy array when the caller already uses NumPy and otherwise a
+flat array('d') of interleaved x, y values.
+
+Topics covered:
+- Distance between two points with math.hypot
+- Row-by-row and one-to-many distances on packed arrays
+- All-pairs distances in blocks, without building the N x N matrix
+- A KD-tree point index with a dict-like interface
+- Optional NumPy support
+"""
+
+import heapq
+from array import array
+from collections.abc import Mapping, MutableMapping
+from itertools import chain, filterfalse, repeat
+from math import dist, hypot, inf, sqrt
+from typing import Iterable, Iterator
+
+try:
+    from ._optional import numpy_for
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import numpy_for
+
+# Rows and columns per block of the all-pairs distance matrix
+DEFAULT_BLOCK_SIZE = 1024
+
+# Points per KD-tree leaf (scanned linearly)
+LEAF_SIZE = 16
+
+# Inserts buffered before a PointIndex rebuilds its tree
+PENDING_LIMIT = 256
+
+
+def distance(p1: tuple, p2: tuple) -> float:
+    """Return the straight-line distance between two (x, y) points."""
+    return hypot(p2[0] - p1[0], p2[1] - p1[1])
+
+
+def points_array(points: Iterable) -> array:
+    """Pack (x, y) pairs into a flat array('d'): x0, y0, x1, y1, ..."""
+    if isinstance(points, array) and points.typecode == "d":
+        packed = points
+    else:
+        packed = array("d", chain.from_iterable(points))
+    if len(packed) % 2:
+        raise ValueError("points must have two coordinates each")
+    return packed
+
+
+def _columns(points) -> tuple[array, array]:
+    """Return the x and y coordinates of packed points as two arrays."""
+    packed = points_array(points)
+    return packed[0::2], packed[1::2]
+
+
+def pairwise_distances(a, b):
+    """Return the distance between a[i] and b[i] for every row i.
+
+    NumPy (N, 2) arrays give an ndarray; anything else gives an array('d').
+    """
+    np = numpy_for(a, b)
+    if np is not None:
+        if a.shape != b.shape:
+            raise ValueError("a and b must have the same number of points")
+        return np.hypot(a[:, 0] - b[:, 0], a[:, 1] - b[:, 1])
+    ax, ay = _columns(a)
+    bx, by = _columns(b)
+    if len(ax) != len(bx):
+        raise ValueError("a and b must have the same number of points")
+    return array("d", map(dist, zip(ax, ay), zip(bx, by)))
+
+
+def distances_from(point: tuple, points):
+    """Return the distance from one point to each of many points."""
+    x, y = point
+    np = numpy_for(points)
+    if np is not None:
+        return np.hypot(points[:, 0] - x, points[:, 1] - y)
+    xs, ys = _columns(points)
+    return array("d", map(dist, zip(xs, ys), repeat((x, y))))
+
+
+def iter_distance_blocks(a, b=None, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[tuple]:
+    """Yield (row, column, block) tiles of the distances from a to b.
+
+    block[i][j] is the distance from a[row + i] to b[column + j]; with b
+    omitted, a is compared with itself. Only one block_size x block_size
+    tile exists at a time, so memory stays constant for any N. NumPy inputs
+    give 2-D ndarray tiles, other inputs give lists of array('d') rows.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    b = a if b is None else b
+    np = numpy_for(a, b)
+    if np is not None:
+        for row in range(0, len(a), block_size):
+            rows = a[row:row + block_size]
+            for column in range(0, len(b), block_size):
+                columns = b[column:column + block_size]
+                yield row, column, np.hypot(
+                    rows[:, 0, None] - columns[None, :, 0],
+                    rows[:, 1, None] - columns[None, :, 1],
+                )
+        return
+    for row, column, points, columns in _tuple_blocks(a, b, block_size):
+        yield row, column, [array("d", map(dist, columns, repeat(point))) for point in points]
+
+
+def _tuple_blocks(a, b, block_size: int) -> Iterator[tuple]:
+    """Yield (row, column, a points, b points) with the points as tuples."""
+    ax, ay = _columns(a)
+    bx, by = _columns(b)
+    for row in range(0, len(ax), block_size):
+        points = list(zip(ax[row:row + block_size], ay[row:row + block_size]))
+        for column in range(0, len(bx), block_size):
+            # math.dist on small tuples beats per-coordinate arithmetic
+            yield row, column, points, list(zip(bx[column:column + block_size], by[column:column + block_size]))
+
+
+def min_distances(a, b=None, block_size: int = DEFAULT_BLOCK_SIZE):
+    """Return, for every point of a, the distance to its nearest point of b.
+
+    With b omitted, each point's nearest *other* point of a is used. The
+    all-pairs distances are reduced one block at a time.
+    """
+    same = b is None
+    np = numpy_for(a) if same else numpy_for(a, b)
+    if np is not None:
+        nearest = np.full(len(a), np.inf)
+        for row, column, block in iter_distance_blocks(a, b, block_size):
+            if same:
+                # Ignore each point's distance to itself
+                diagonal = np.arange(max(row, column), min(row + block.shape[0], column + block.shape[1]))
+                block[diagonal - row, diagonal - column] = np.inf
+            window = nearest[row:row + block.shape[0]]
+            np.minimum(window, block.min(axis=1), out=window)
+        return nearest
+    nearest = array("d", repeat(inf, len(points_array(a)) // 2))
+    for row, column, points, columns in _tuple_blocks(a, a if same else b, block_size):
+        for index, point in enumerate(points, row):
+            if same and column <= index < column + len(columns):
+                distances = list(map(dist, columns, repeat(point)))
+                distances[index - column] = inf
+                smallest = min(distances)
+            else:
+                smallest = min(map(dist, columns, repeat(point)))
+            if smallest < nearest[index]:
+                nearest[index] = smallest
+    return nearest
+
+
+class PointIndex(MutableMapping):
+    """A dict keyed by (x, y) points that also answers spatial queries.
+
+    The points live in a KD-tree stored implicitly in flat arrays: the
+    range [lo, hi) of a node has its splitting point in the middle,
+    alternating x and y by depth, so no node objects are needed. Loading n
+    points takes O(n log n) using lists presorted by x and by y. New points
+    go to a small buffer that is merged into the tree once it grows, and
+    deleted points are marked dead until the next rebuild.
+    """
+
+    def __init__(self, items=(), leaf_size: int = LEAF_SIZE) -> None:
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive")
+        self.leaf_size = leaf_size
+        self._pending: dict = {}
+        self._load(items.items() if isinstance(items, Mapping) else items)
+
+    def _load(self, items: Iterable) -> None:
+        # A dict keeps the last value of repeated points, like dict(items)
+        merged = dict(items)
+        values = list(merged.values())
+        xs = [float(x) for x, _ in merged]
+        ys = [float(y) for _, y in merged]
+        del merged
+        by_x = sorted(range(len(xs)), key=xs.__getitem__)
+        by_y = sorted(range(len(ys)), key=ys.__getitem__)
+        order = [0] * len(by_x)
+        stack = [(0, by_x, by_y, 0)]
+        while stack:
+            start, sorted_x, sorted_y, depth = stack.pop()
+            size = len(sorted_x)
+            if size <= self.leaf_size:
+                order[start:start + size] = sorted_x
+                continue
+            primary, other = (sorted_x, sorted_y) if depth % 2 == 0 else (sorted_y, sorted_x)
+            middle = size // 2
+            median = primary[middle]
+            order[start + middle] = median
+            # Split the other sorted list the same way, keeping its order
+            left_set = set(primary[:middle])
+            other_left = list(filter(left_set.__contains__, other))
+            other_right = list(filterfalse(left_set.__contains__, other))
+            other_right.remove(median)
+            left, right = primary[:middle], primary[middle + 1:]
+            if depth % 2:
+                left, other_left, right, other_right = other_left, left, other_right, right
+            stack.append((start, left, other_left, depth + 1))
+            stack.append((start + middle + 1, right, other_right, depth + 1))
+        self._xs = array("d", map(xs.__getitem__, order))
+        self._ys = array("d", map(ys.__getitem__, order))
+        self._values = list(map(values.__getitem__, order))
+        self._alive = bytearray(b"\x01") * len(order)
+        self._dead = 0
+
+    def _live_items(self) -> Iterator[tuple]:
+        for i, alive in enumerate(self._alive):
+            if alive:
+                yield (self._xs[i], self._ys[i]), self._values[i]
+        yield from self._pending.items()
+
+    def rebuild(self) -> None:
+        """Merge buffered inserts into the tree and drop deleted points."""
+        items = list(self._live_items())
+        self._pending = {}
+        self._load(items)
+
+    def _find(self, x: float, y: float):
+        """Return the tree position of a live point, or None."""
+        xs, ys, alive, leaf_size = self._xs, self._ys, self._alive, self.leaf_size
+        stack = [(0, len(xs), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= leaf_size:
+                for i in range(lo, hi):
+                    if xs[i] == x and ys[i] == y and alive[i]:
+                        return i
+                continue
+            middle = lo + (hi - lo) // 2
+            if xs[middle] == x and ys[middle] == y and alive[middle]:
+                return middle
+            value, split = (x, xs[middle]) if depth % 2 == 0 else (y, ys[middle])
+            if value <= split:
+                stack.append((lo, middle, depth + 1))
+            if value >= split:
+                stack.append((middle + 1, hi, depth + 1))
+        return None
+
+    def __getitem__(self, point: tuple):
+        if point in self._pending:
+            return self._pending[point]
+        position = self._find(*point)
+        if position is None:
+            raise KeyError(point)
+        return self._values[position]
+
+    def __setitem__(self, point: tuple, value) -> None:
+        position = self._find(*point)
+        if position is not None:
+            self._values[position] = value
+            return
+        self._pending[point] = value
+        if len(self._pending) > max(PENDING_LIMIT, len(self._xs) // 4):
+            self.rebuild()
+
+    def __delitem__(self, point: tuple) -> None:
+        if point in self._pending:
+            del self._pending[point]
+            return
+        position = self._find(*point)
+        if position is None:
+            raise KeyError(point)
+        self._alive[position] = 0
+        self._dead += 1
+
+    def __len__(self) -> int:
+        return len(self._xs) - self._dead + len(self._pending)
+
+    def __iter__(self) -> Iterator[tuple]:
+        for point, _ in self._live_items():
+            yield point
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} points)"
+
+    def _search(self, point: tuple, visit, radius2: float) -> None:
+        """Walk the tree nearest side first, calling visit(d2, position).
+
+        Points within sqrt(radius2) are visited; visit returns the new
+        squared radius, and subtrees farther away than it are skipped.
+        """
+        px, py = point
+        xs, ys, alive, leaf_size = self._xs, self._ys, self._alive, self.leaf_size
+        stack = [(0, len(xs), 0, 0.0)]
+        while stack:
+            lo, hi, depth, bound = stack.pop()
+            if bound > radius2:
+                continue
+            if hi - lo <= leaf_size:
+                for i in range(lo, hi):
+                    if alive[i]:
+                        d2 = (xs[i] - px) ** 2 + (ys[i] - py) ** 2
+                        if d2 <= radius2:
+                            radius2 = visit(d2, i)
+                continue
+            middle = lo + (hi - lo) // 2
+            if alive[middle]:
+                d2 = (xs[middle] - px) ** 2 + (ys[middle] - py) ** 2
+                if d2 <= radius2:
+                    radius2 = visit(d2, middle)
+            diff = px - xs[middle] if depth % 2 == 0 else py - ys[middle]
+            far_bound = max(bound, diff * diff)
+            if diff < 0:
+                stack.append((middle + 1, hi, depth + 1, far_bound))
+                stack.append((lo, middle, depth + 1, bound))
+            else:
+                stack.append((lo, middle, depth + 1, far_bound))
+                stack.append((middle + 1, hi, depth + 1, bound))
+
+    def nearest(self, point: tuple, k: int = 1) -> list[tuple]:
+        """Return the k closest points as (distance, (x, y), value), closest first."""
+        if k < 1:
+            raise ValueError("k must be positive")
+        # Max-heap of the k best (-d2, tiebreak, key, value) found so far
+        heap: list = []
+        px, py = point
+        for j, ((x, y), value) in enumerate(self._pending.items()):
+            entry = (-((x - px) ** 2 + (y - py) ** 2), -len(self._xs) - j, (x, y), value)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        def visit(d2: float, i: int) -> float:
+            entry = (-d2, -i, (self._xs[i], self._ys[i]), self._values[i])
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            return -heap[0][0] if len(heap) == k else inf
+
+        self._search(point, visit, -heap[0][0] if len(heap) == k else inf)
+        return [(sqrt(-d2), key, value) for d2, _, key, value in sorted(heap, reverse=True)]
+
+    def within(self, point: tuple, radius: float) -> list[tuple]:
+        """Return every point within `radius` as (distance, (x, y), value), closest first."""
+        if radius < 0:
+            raise ValueError("radius must not be negative")
+        radius2 = radius * radius
+        px, py = point
+        found = [(d2, key, value) for key, value in self._pending.items()
+                 if (d2 := (key[0] - px) ** 2 + (key[1] - py) ** 2) <= radius2]
+
+        def visit(d2: float, i: int) -> float:
+            found.append((d2, (self._xs[i], self._ys[i]), self._values[i]))
+            return radius2
+
+        self._search(point, visit, radius2)
+        found.sort(key=lambda item: item[0])
+        return [(sqrt(d2), key, value) for d2, key, value in found]
@@ -0,0 +1,182 @@
+"""
+Python Basics: Input Providers
+==============================
+The interactive examples ask questions with input(), which waits for a
+person at the keyboard. Each of them also accepts an `ask` argument: any
+callable that takes a prompt and returns the answer. This module provides
+such callables for the terminal, for prepared answers (a list or a replay
+file) and for asyncio streams, plus a harness that runs many scripted
+sessions concurrently and times each one.
+
+Topics covered:
+- Passing behaviour in as a function (dependency injection)
+- Replaying recorded answers for regression runs
+- Bridging blocking code and asyncio with threads
+- Measuring per-session latency
+"""
+
+import asyncio
+import contextvars
+import io
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+Ask = Callable[[str], str]
+
+
+class StdinInput:
+    """Ask the person at the terminal, exactly like input()."""
+
+    def __call__(self, prompt: str = "") -> str:
+        return input(prompt)
+
+
+class ScriptedInput:
+    """Answer prompts from a prepared sequence of answers.
+
+    Every (prompt, answer) pair is recorded in `transcript`. When the
+    answers run out, EOFError is raised, as input() does at end of file.
+    """
+
+    def __init__(self, answers: Iterable[str]) -> None:
+        self._answers = iter(answers)
+        self.transcript: list[tuple[str, str]] = []
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike]) -> "ScriptedInput":
+        """Replay answers from a text file, one answer per line."""
+        with open(path) as f:
+            return cls(f.read().splitlines())
+
+    def __call__(self, prompt: str = "") -> str:
+        answer = next(self._answers, None)
+        if answer is None:
+            raise EOFError(f"no scripted answer for prompt {prompt!r}")
+        self.transcript.append((prompt, answer))
+        return answer
+
+
+class AsyncStreamInput:
+    """Answer prompts with lines read from an asyncio.StreamReader.
+
+    The interactive examples are ordinary blocking functions, so they run
+    in a worker thread; each call schedules readline() on the event loop
+    and waits for its result, leaving the loop free to serve other
+    sessions in the meantime.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, loop: asyncio.AbstractEventLoop,
+        timeout: Optional[float] = None, encoding: str = "utf-8",
+    ) -> None:
+        self.reader = reader
+        self.loop = loop
+        self.timeout = timeout
+        self.encoding = encoding
+
+    def __call__(self, prompt: str = "") -> str:
+        future = asyncio.run_coroutine_threadsafe(self.reader.readline(), self.loop)
+        line = future.result(self.timeout)
+        if not line:
+            raise EOFError(f"stream closed before an answer to {prompt!r}")
+        return line.decode(self.encoding).rstrip("\r\n")
+
+
+class SessionResult(NamedTuple):
+    """Outcome of one scripted session."""
+    value: Any  # what the session function returned
+    output: str  # everything it printed
+    seconds: float  # wall-clock time from start to finish
+    error: Optional[BaseException]
+
+
+# Where print() output of the current session goes (None: the real stdout)
+_session_output: contextvars.ContextVar = contextvars.ContextVar("session_output", default=None)
+
+
+class _SessionStdout(io.TextIOBase):
+    """A stdout replacement that keeps each session's output separate."""
+
+    def __init__(self, stdout) -> None:
+        self._stdout = stdout
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        buffer = _session_output.get()
+        return (self._stdout if buffer is None else buffer).write(text)
+
+    def flush(self) -> None:
+        if _session_output.get() is None:
+            self._stdout.flush()
+
+
+@contextmanager
+def _capture_session_output() -> Iterator[None]:
+    previous = sys.stdout
+    sys.stdout = _SessionStdout(previous)
+    try:
+        yield
+    finally:
+        sys.stdout = previous
+
+
+def _run_one(session: Callable[[Ask], Any], ask: Ask) -> SessionResult:
+    """Run one session in the current thread, capturing its output."""
+    buffer = io.StringIO()
+    _session_output.set(buffer)
+    value, error = None, None
+    start = time.perf_counter()
+    try:
+        value = session(ask)
+    except Exception as exc:
+        error = exc
+    elapsed = time.perf_counter() - start
+    return SessionResult(value, buffer.getvalue(), elapsed, error)
+
+
+async def run_sessions_async(
+    session: Callable[[Ask], Any],
+    scripts: Iterable[Union[Iterable[str], Ask]],
+    concurrency: int = 100,
+) -> list[SessionResult]:
+    """Run session(ask) once per script, up to `concurrency` at a time.
+
+    A script is a list of answers (replayed with ScriptedInput) or any ask
+    callable, such as an AsyncStreamInput. Sessions run in a pool of
+    worker threads; their printed output is captured per session.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(script, pool) -> SessionResult:
+        ask = script if callable(script) else ScriptedInput(script)
+        async with semaphore:
+            # Each session gets its own context, so its output buffer is private
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(pool, context.run, _run_one, session, ask)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool, _capture_session_output():
+        return await asyncio.gather(*(run(script, pool) for script in scripts))
+
+
+def run_sessions(
+    session: Callable[[Ask], Any],
+    scripts: Iterable[Iterable[str]],
+    concurrency: int = 100,
+) -> list[SessionResult]:
+    """Run scripted sessions concurrently and return their results in order.
+
+    For example, run_sessions(lambda ask: number_checker(ask=ask),
+    [["7"], ["-3"], ["oops"]]) runs three number-checker sessions.
+    """
+    return asyncio.run(run_sessions_async(session, scripts, concurrency))
@@ -14,6 +14,34 @@ Topics covered:
 - Practical examples
 """
 
+from typing import Callable, Optional
+
+try:
+    from .primes import (
+        DEFAULT_SEGMENT_SIZE, PrimeBitset, PrimeTable, count_primes,
+        iter_primes, prime_array, segmented_sieve,
+    )
+    from .series import sum_numbers_many, sum_powers, sum_range
+    from .combinatorics import cached_factorial, factorial_mod
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from primes import (
+        DEFAULT_SEGMENT_SIZE, PrimeBitset, PrimeTable, count_primes,
+        iter_primes, prime_array, segmented_sieve,
+    )
+    from series import sum_numbers_many, sum_powers, sum_range
+    from combinatorics import cached_factorial, factorial_mod
+
+# The loop examples, plus the engine functions they are built on
+__all__ = [
+    "demonstrate_for_loops", "demonstrate_while_loops", "demonstrate_loop_control",
+    "demonstrate_nested_loops", "demonstrate_loop_else", "demonstrate_practical_examples",
+    "sum_numbers", "sum_numbers_naive", "sum_numbers_many", "sum_powers",
+    "factorial", "factorial_naive", "factorial_mod",
+    "find_prime_numbers", "find_prime_numbers_naive",
+    "iter_primes", "count_primes", "PrimeTable",
+    "interactive_example", "main",
+]
+
 
 def demonstrate_for_loops() -> None:
     """Demonstrate basic for loop concepts."""
@@ -186,6 +214,15 @@ def demonstrate_loop_else() -> None:
 
 
 def sum_numbers(n: int) -> int:
+    """Calculate sum of numbers from 1 to n.
+
+    Uses the closed form n * (n + 1) / 2 via series.sum_range, so it runs in
+    constant time; sum_numbers_naive shows the loop it replaces.
+    """
+    return sum_range(1, n + 1)
+
+
+def sum_numbers_naive(n: int) -> int:
     """Calculate sum of numbers from 1 to n using a loop."""
     total = 0
     for i in range(1, n + 1):
@@ -194,6 +231,16 @@ def sum_numbers(n: int) -> int:
 
 
 def factorial(n: int) -> int:
+    """Calculate factorial of n.
+
+    Uses the shared factorial table in combinatorics.py, which reuses
+    cached results and falls back to the prime-swing algorithm;
+    factorial_naive shows the simple loop it replaces.
+    """
+    return cached_factorial(n)
+
+
+def factorial_naive(n: int) -> int:
     """Calculate factorial using a loop."""
     result = 1
     for i in range(1, n + 1):
@@ -201,8 +248,30 @@ def factorial(n: int) -> int:
     return result
 
 
-def find_prime_numbers(limit: int) -> list[int]:
-    """Find all prime numbers up to a given limit."""
+def find_prime_numbers(
+    limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE, output: str = "list"
+):
+    """Find all prime numbers up to a given limit.
+
+    Uses the segmented sieve from primes.py; `segment_size` controls how
+    many odd candidates are sieved at once (tune it to your L2 cache).
+
+    `output` selects the result format:
+    - "list": a list[int] (default)
+    - "array": a compact array('I'), or array('Q') for limits >= 2**32
+    - "bitset": a PrimeBitset with `in`, len(), iteration, rank and select
+    """
+    if output == "list":
+        return segmented_sieve(limit, segment_size)
+    if output == "array":
+        return prime_array(limit, segment_size)
+    if output == "bitset":
+        return PrimeBitset.build(limit, segment_size)
+    raise ValueError(f"unknown output format: {output!r}")
+
+
+def find_prime_numbers_naive(limit: int) -> list[int]:
+    """Find all prime numbers up to a given limit using trial division."""
     primes = []
     for num in range(2, limit + 1):
         is_prime = True
@@ -258,8 +327,12 @@ def demonstrate_practical_examples() -> None:
     print(f"  Vowel count: {count}")
 
 
-def interactive_example() -> None:
-    """Interactive loop example with user input."""
+def interactive_example(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Interactive loop example with user input.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
     print("\n" + "=" * 50)
     print("INTERACTIVE EXAMPLE: NUMBER GUESSING")
     print("=" * 50)
@@ -273,7 +346,7 @@ def interactive_example() -> None:
     
     while attempts < max_attempts:
         try:
-            guess = int(input(f"\nAttempt {attempts + 1}/{max_attempts} - Enter your guess: "))
+            guess = int(ask(f"\nAttempt {attempts + 1}/{max_attempts} - Enter your guess: "))
             attempts += 1
             
             if guess == secret_number:
@@ -290,8 +363,13 @@ def interactive_example() -> None:
         print(f"\n😔 Game over! The number was {secret_number}.")
 
 
-def main() -> None:
-    """Run all loop demonstrations."""
+def main(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Run all loop demonstrations.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
+
     print("\n" + "🐍" * 25)
     print("WELCOME TO PYTHON LOOPS TUTORIAL")
     print("🐍" * 25)
@@ -305,9 +383,9 @@ def main() -> None:
     
     # Ask user if they want to play the interactive game
     print("\n" + "=" * 50)
-    play_game = input("\nWould you like to play the number guessing game? (y/n): ")
+    play_game = ask("\nWould you like to play the number guessing game? (y/n): ")
     if play_game.lower() == 'y':
-        interactive_example()
+        interactive_example(ask)
     
     print("\n" + "=" * 50)
     print("✅ Tutorial completed!")
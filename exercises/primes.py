@@ -0,0 +1,524 @@
+"""
+Python Basics: Prime Engine
+===========================
+This module contains the prime number engine used by loops.py.
+
+Instead of testing every number by trial division, it uses a segmented
+Sieve of Eratosthenes: the range is processed in fixed-size windows
+(segments) so memory stays bounded no matter how large the limit is.
+
+Topics covered:
+- Sieve of Eratosthenes
+- bytearray flags and slice assignment
+- Segmenting work into cache-sized chunks
+- Counting primes in parallel with a process pool
+- Compact results: array('I') and an odd-only bitset
+- A persistent, memory-mapped prime table on disk
+"""
+
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+from itertools import compress
+from math import isqrt
+from typing import Iterator, Optional, Union
+
+# Number of odd candidates sieved per segment (one byte each).
+# 256 KiB fits comfortably in the L2 cache of most modern CPUs.
+DEFAULT_SEGMENT_SIZE = 1 << 18
+
+# Bytes per block of the bitset rank index (32768 odd numbers per block)
+BITSET_BLOCK_BYTES = 4096
+
+# Lookup tables for working with packed bits
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+_BIT_POSITIONS = tuple(
+    tuple(bit for bit in range(8) if i >> bit & 1) for i in range(256)
+)
+_FLAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def simple_sieve(limit: int) -> list[int]:
+    """Return all primes <= limit using a plain (non-segmented) sieve.
+
+    Only used for small limits, e.g. the base primes up to sqrt(n).
+    """
+    if limit < 2:
+        return []
+    # flags[i] represents the odd number 2*i + 1
+    size = (limit + 1) // 2
+    flags = bytearray([1]) * size
+    flags[0] = 0  # 1 is not prime
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return [2] + [2 * i + 1 for i in compress(range(size), flags)]
+
+
+def sieve_segment(low: int, high: int, base_primes: list[int]) -> bytearray:
+    """Sieve the odd numbers in [low, high) and return their prime flags.
+
+    `low` must be odd. flags[i] is 1 when low + 2*i is prime.
+    `base_primes` must contain every prime up to sqrt(high - 1).
+    """
+    size = (high - low + 1) // 2
+    flags = bytearray([1]) * size
+    for p in base_primes:
+        if p == 2:
+            continue
+        square = p * p
+        if square >= high:
+            break
+        # First odd multiple of p inside the segment, but never below p*p
+        start = max(square, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        index = (start - low) // 2
+        if index < size:
+            flags[index::p] = bytes(len(range(index, size, p)))
+    if low == 1 and size:
+        flags[0] = 0  # 1 is not prime
+    return flags
+
+
+def iter_segments(
+    low: int, high: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> Iterator[tuple[int, bytearray]]:
+    """Yield (segment_low, flags) pairs covering the odd numbers in [low, high).
+
+    Each segment holds at most `segment_size` odd candidates, so peak memory
+    is one segment plus the base primes up to sqrt(high).
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be positive")
+    if low % 2 == 0:
+        low += 1
+    if low >= high:
+        return
+    base_primes = simple_sieve(isqrt(high - 1))
+    span = 2 * segment_size
+    for seg_low in range(low, high, span):
+        seg_high = min(seg_low + span, high)
+        yield seg_low, sieve_segment(seg_low, seg_high, base_primes)
+
+
+def segmented_sieve(
+    limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> list[int]:
+    """Return all primes <= limit using a segmented sieve."""
+    if limit < 2:
+        return []
+    primes = [2]
+    for seg_low, flags in iter_segments(3, limit + 1, segment_size):
+        primes.extend([seg_low + 2 * i for i in compress(range(len(flags)), flags)])
+    return primes
+
+
+def prime_array(limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> array:
+    """Return all primes <= limit packed in an array('I') (or 'Q' above 2**32).
+
+    Each prime costs 4 (or 8) bytes instead of a full Python int.
+    """
+    primes = array("I" if limit < 2 ** 32 else "Q")
+    if limit < 2:
+        return primes
+    primes.append(2)
+    for seg_low, flags in iter_segments(3, limit + 1, segment_size):
+        primes.extend([seg_low + 2 * i for i in compress(range(len(flags)), flags)])
+    return primes
+
+
+def pack_flags(flags: bytes) -> bytes:
+    """Pack one 0/1 flag per byte into one bit per flag.
+
+    Flag i becomes bit (i % 8) of byte (i // 8).
+    """
+    if not flags:
+        return b""
+    digits = flags.translate(_FLAGS_TO_DIGITS)[::-1]
+    return int(digits, 2).to_bytes((len(flags) + 7) // 8, "little")
+
+
+class PrimeBitset:
+    """Odd-only prime bitset: bit i is set when 2*i + 1 is prime.
+
+    Storing only odd numbers needs one bit per two integers, about 6 MB for
+    all primes below 10**8. A per-block index of prime counts makes rank
+    (pi(n)) and select (the k-th prime) fast without unpacking the bits.
+
+    `bits` can be any sliceable bytes-like object, e.g. bytes or an mmap.
+    """
+
+    def __init__(
+        self,
+        bits: Union[bytes, bytearray],
+        limit: int,
+        block_counts: Optional[array] = None,
+    ) -> None:
+        self._bits = bits
+        self.limit = limit
+        self._size = min(len(bits), (limit - 1) // 16 + 1) if limit > 0 else 0
+        if block_counts is None:
+            block_counts = self._build_block_counts()
+        # block_counts[b] = odd primes stored before block b; the last entry is the total
+        self._block_counts = block_counts
+
+    @classmethod
+    def build(
+        cls, limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> "PrimeBitset":
+        """Sieve all primes <= limit into a new bitset."""
+        # Segments must hold whole bytes so their packed bits can be joined
+        segment_size = max(8, segment_size // 8 * 8)
+        bits = bytearray()
+        for _, flags in iter_segments(1, max(limit, 0) + 1, segment_size):
+            bits += pack_flags(flags)
+        return cls(bytes(bits), limit)
+
+    def _build_block_counts(self) -> array:
+        counts = array("Q", [0])
+        for start in range(0, self._size, BITSET_BLOCK_BYTES):
+            end = min(start + BITSET_BLOCK_BYTES, self._size)
+            counts.append(counts[-1] + sum(self._bits[start:end].translate(_POPCOUNT)))
+        return counts
+
+    def __len__(self) -> int:
+        return self._block_counts[-1] + (1 if self.limit >= 2 else 0)
+
+    def __contains__(self, n: object) -> bool:
+        if not isinstance(n, int) or n < 2 or n > self.limit:
+            return False
+        if n % 2 == 0:
+            return n == 2
+        i = n // 2
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        if self.limit >= 2:
+            yield 2
+        for start in range(0, self._size, BITSET_BLOCK_BYTES):
+            block = self._bits[start:start + BITSET_BLOCK_BYTES]
+            for offset in compress(range(len(block)), block):
+                base = 16 * (start + offset) + 1
+                for bit in _BIT_POSITIONS[block[offset]]:
+                    yield base + 2 * bit
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(limit={self.limit}, primes={len(self)})"
+
+    def rank(self, n: int) -> int:
+        """Return the number of primes <= n (the prime-counting function)."""
+        if n < 2:  # no primes, whatever the limit (even an empty bitset)
+            return 0
+        if n > self.limit:
+            raise ValueError(f"{n} is beyond the bitset limit {self.limit}")
+        i = (n - 1) // 2  # index of the largest odd number <= n
+        byte, bit = divmod(i, 8)
+        block_start = byte // BITSET_BLOCK_BYTES * BITSET_BLOCK_BYTES
+        count = self._block_counts[byte // BITSET_BLOCK_BYTES]
+        count += sum(self._bits[block_start:byte].translate(_POPCOUNT))
+        count += _POPCOUNT[self._bits[byte] & ((2 << bit) - 1)]
+        return 1 + count
+
+    def select(self, k: int) -> int:
+        """Return the k-th prime (select(1) == 2)."""
+        if k < 1 or k > len(self):
+            raise IndexError(f"there is no prime number {k} in this bitset")
+        if k == 1:
+            return 2
+        target = k - 1  # position among the odd primes
+        block = bisect_left(self._block_counts, target) - 1
+        remaining = target - self._block_counts[block]
+        start = block * BITSET_BLOCK_BYTES
+        for offset, value in enumerate(self._bits[start:start + BITSET_BLOCK_BYTES]):
+            count = _POPCOUNT[value]
+            if remaining <= count:
+                bit = _BIT_POSITIONS[value][remaining - 1]
+                return 16 * (start + offset) + 2 * bit + 1
+            remaining -= count
+        raise AssertionError("block index is inconsistent with the bits")
+
+    def primes_in(self, start: int, stop: int) -> Iterator[int]:
+        """Yield the primes p with start <= p < stop, in order."""
+        if stop > 2 and stop - 1 > self.limit:
+            raise ValueError(f"{stop - 1} is beyond the bitset limit {self.limit}")
+        if start <= 2 < stop:
+            yield 2
+        first = max(start, 3) // 2  # index of the first odd number >= start
+        end = stop // 2  # index one past the last odd number < stop
+        last_byte = (end + 7) >> 3
+        for chunk_start in range(first >> 3, last_byte, BITSET_BLOCK_BYTES):
+            chunk = self._bits[chunk_start:min(chunk_start + BITSET_BLOCK_BYTES, last_byte)]
+            for offset in compress(range(len(chunk)), chunk):
+                base = 8 * (chunk_start + offset)
+                for bit in _BIT_POSITIONS[chunk[offset]]:
+                    if first <= base + bit < end:
+                        yield 2 * (base + bit) + 1
+
+
+def iter_primes(
+    start: int = 2,
+    stop: Optional[int] = None,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+) -> Iterator[int]:
+    """Lazily yield the primes p with start <= p < stop.
+
+    With stop=None the generator never ends. Only the current segment and
+    the base primes up to sqrt of its upper end are kept in memory, so
+    ranges far from zero are sieved without touching the numbers below them.
+    The first segments are small so the first few primes arrive quickly.
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be positive")
+    if start <= 2 and (stop is None or stop > 2):
+        yield 2
+    low = max(start, 3)
+    if low % 2 == 0:
+        low += 1
+    base_limit = 0
+    base_primes: list[int] = []
+    span = 2 * min(segment_size, 1024)
+    while stop is None or low < stop:
+        high = low + span if stop is None else min(low + span, stop)
+        needed = isqrt(high - 1)
+        if needed > base_limit:
+            # Grow geometrically so the base primes are rebuilt O(log n) times
+            base_limit = max(needed, 2 * base_limit)
+            if stop is not None:
+                base_limit = min(base_limit, isqrt(stop - 1))
+            base_primes = simple_sieve(base_limit)
+        flags = sieve_segment(low, high, base_primes)
+        for i in compress(range(len(flags)), flags):
+            yield low + 2 * i
+        low = high if high % 2 else high + 1
+        span = min(2 * span, 2 * segment_size)
+
+
+# Base primes read from shared memory inside each worker process
+_worker_base_primes: list[int] = []
+
+
+def _init_count_worker(shm_name: str, count: int) -> None:
+    """Read the shared base primes once per worker process."""
+    global _worker_base_primes
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        packed = array("I")
+        packed.frombytes(shm.buf[:count * 4])
+        _worker_base_primes = packed.tolist()
+    finally:
+        shm.close()
+
+
+def _count_range(low: int, high: int, segment_size: int) -> int:
+    """Count the odd primes in [low, high) using the worker's base primes."""
+    return _count_odd_primes(low, high, _worker_base_primes, segment_size)
+
+
+def _count_odd_primes(
+    low: int, high: int, base_primes: list[int], segment_size: int
+) -> int:
+    """Count the odd primes in [low, high) one segment at a time."""
+    if low % 2 == 0:
+        low += 1
+    total = 0
+    span = 2 * segment_size
+    for seg_low in range(low, high, span):
+        total += sieve_segment(seg_low, min(seg_low + span, high), base_primes).count(1)
+    return total
+
+
+def count_primes(
+    limit: int,
+    workers: Optional[int] = None,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+) -> int:
+    """Return the number of primes <= limit, i.e. pi(limit).
+
+    With workers=1 (or a small limit) the count runs in this process.
+    Otherwise the range is split into chunks that are sieved in a
+    ProcessPoolExecutor; workers=None uses one worker per CPU core.
+    The base primes up to sqrt(limit) are placed in shared memory once
+    instead of being pickled for every task.
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be positive")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    if limit < 2:
+        return 0
+    base_primes = simple_sieve(isqrt(limit))
+    span = 2 * segment_size
+    if workers == 1 or limit < 2 * span:
+        return 1 + _count_odd_primes(3, limit + 1, base_primes, segment_size)
+
+    # Several chunks per worker keep the pool busy when chunks finish unevenly
+    chunk_count = 4 * (workers or os.cpu_count() or 1)
+    chunk = max(span, -(-(limit - 2) // chunk_count // span) * span)
+    lows = list(range(3, limit + 1, chunk))
+
+    # Imported here so that importing this module stays fast
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    packed = array("I", base_primes)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(packed) * 4, 1))
+    try:
+        shm.buf[:len(packed) * 4] = packed.tobytes()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_count_worker,
+            initargs=(shm.name, len(packed)),
+        ) as pool:
+            counts = pool.map(
+                _count_range,
+                lows,
+                [min(low + chunk, limit + 1) for low in lows],
+                [segment_size] * len(lows),
+            )
+            return 1 + sum(counts)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+class PrimeTable:
+    """Persistent prime table stored as a packed odd-only bitset on disk.
+
+    File layout (all integers little-endian):
+        bits | block index (uint64 counts) | trailer
+    The trailer holds the bit length, block size, format version and the
+    magic bytes b"PRMT". Because the bits start at offset 0, the whole file
+    is memory-mapped and queried in place; only the small block index is
+    read into memory when the table is opened.
+
+    Opening a table with a larger limit than the file covers sieves just the
+    missing range, writes the extended table to a temporary file and swaps
+    it in, so an interrupted grow never corrupts the existing table.
+    """
+
+    MAGIC = b"PRMT"
+    VERSION = 1
+    _TRAILER = struct.Struct("<QHH4s")
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], limit: int = 0) -> None:
+        self.path = os.fspath(path)
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._bitset: Optional[PrimeBitset] = None
+        if not os.path.exists(self.path):
+            self._write_table(self.path, b"", array("Q", [0]))
+        self._open()
+        if limit > self.limit:
+            self.ensure(limit)
+
+    def __enter__(self) -> "PrimeTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r}, limit={self.limit})"
+
+    @property
+    def limit(self) -> int:
+        """Largest number covered by the table."""
+        return self._bitset.limit
+
+    def close(self) -> None:
+        """Release the memory mapping and the file handle."""
+        self._bitset = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def is_prime(self, n: int) -> bool:
+        """Return True if n is prime (n must be <= limit)."""
+        self._check(n)
+        return n in self._bitset
+
+    def primes_in(self, start: int, stop: int) -> Iterator[int]:
+        """Yield the primes p with start <= p < stop (stop - 1 must be <= limit)."""
+        return self._bitset.primes_in(start, stop)
+
+    def pi(self, n: int) -> int:
+        """Return the number of primes <= n (n must be <= limit)."""
+        return self._bitset.rank(n)
+
+    def nth_prime(self, k: int) -> int:
+        """Return the k-th prime stored in the table (nth_prime(1) == 2)."""
+        return self._bitset.select(k)
+
+    def ensure(self, limit: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> None:
+        """Grow the table so it covers every number <= limit."""
+        if limit <= self.limit:
+            return
+        # Grow in whole index blocks; each byte covers 16 integers
+        block_span = 16 * BITSET_BLOCK_BYTES
+        new_size = -(-(limit + 1) // block_span) * BITSET_BLOCK_BYTES
+        old_size = self._size
+        counts = array("Q", self._bitset._block_counts)
+        # Segments hold whole index blocks so their counts line up with the file
+        block_odds = 8 * BITSET_BLOCK_BYTES
+        segment_size = max(1, segment_size // block_odds) * block_odds
+
+        import shutil
+
+        tmp_path = self.path + ".tmp"
+        shutil.copyfile(self.path, tmp_path)
+        with open(tmp_path, "r+b") as f:
+            f.truncate(old_size)
+            f.seek(old_size)
+            for _, flags in iter_segments(16 * old_size + 1, 16 * new_size, segment_size):
+                bits = pack_flags(flags)
+                f.write(bits)
+                for start in range(0, len(bits), BITSET_BLOCK_BYTES):
+                    block = bits[start:start + BITSET_BLOCK_BYTES]
+                    counts.append(counts[-1] + sum(block.translate(_POPCOUNT)))
+            f.write(counts.tobytes())
+            f.write(self._TRAILER.pack(new_size, BITSET_BLOCK_BYTES, self.VERSION, self.MAGIC))
+            f.flush()
+            os.fsync(f.fileno())
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._open()
+
+    def _check(self, n: int) -> None:
+        if n >= 2 and n > self.limit:
+            raise ValueError(f"{n} is beyond the table limit {self.limit}")
+
+    def _open(self) -> None:
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        trailer_start = len(self._map) - self._TRAILER.size
+        if trailer_start < 0:
+            self.close()
+            raise ValueError(f"{self.path} is not a prime table")
+        size, block_bytes, version, magic = self._TRAILER.unpack(self._map[trailer_start:])
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a prime table")
+        if version != self.VERSION or block_bytes != BITSET_BLOCK_BYTES:
+            self.close()
+            raise ValueError(f"{self.path} uses unsupported table version {version}")
+        counts = array("Q")
+        counts.frombytes(self._map[size:trailer_start])
+        self._size = size
+        self._bitset = PrimeBitset(self._map, 16 * size - 1 if size else 0, counts)
+
+    @classmethod
+    def _write_table(cls, path: str, bits: bytes, counts: array) -> None:
+        with open(path, "wb") as f:
+            f.write(bits)
+            f.write(counts.tobytes())
+            f.write(cls._TRAILER.pack(len(bits), BITSET_BLOCK_BYTES, cls.VERSION, cls.MAGIC))
@@ -0,0 +1,238 @@
+"""
+Python Basics: Compact Records
+==============================
+A tuple or dict per record carries a lot of per-object overhead, which
+adds up when there are millions of records. This module offers two
+compact alternatives: small classes with __slots__ for single records, and
+a table that stores each field as one column (numbers in an array, strings
+as codes into a shared list of interned values).
+
+Topics covered:
+- __slots__ classes that unpack and sort like tuples
+- Struct-of-arrays storage with the array module
+- Interning repeated strings (dictionary encoding)
+- Sorting columns with a shared permutation
+"""
+
+import sys
+from array import array
+from itertools import starmap
+from operator import attrgetter
+from typing import Iterable, Iterator, Mapping, Optional, Union
+
+
+class Record:
+    """Base class for fixed-field records stored in __slots__.
+
+    Subclasses list their fields in __slots__. Instances have no __dict__,
+    unpack and iterate like tuples, and compare field by field so lists of
+    them can be sorted.
+    """
+
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = tuple(cls.__dict__.get("__slots__", ()))
+        if fields:  # a subclass without new slots keeps its parent's fields
+            cls._fields = getattr(cls, "_fields", ()) + fields
+            cls._values = attrgetter(*cls._fields)
+
+    def __init__(self, *args, **kwargs) -> None:
+        if len(args) > len(self._fields):
+            raise TypeError(f"{type(self).__name__} takes {len(self._fields)} fields")
+        for name, value in zip(self._fields, args):
+            setattr(self, name, value)
+        for name in self._fields[len(args):]:
+            if name not in kwargs:
+                raise TypeError(f"{type(self).__name__} is missing field {name!r}")
+            setattr(self, name, kwargs.pop(name))
+        if kwargs:
+            raise TypeError(f"unexpected fields: {', '.join(kwargs)}")
+
+    def astuple(self) -> tuple:
+        """Return the field values as a tuple."""
+        values = self._values(self)
+        return values if len(self._fields) > 1 else (values,)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.astuple())
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return self.astuple()[index]
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    def __hash__(self) -> int:
+        return hash(self.astuple())
+
+    def __lt__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.astuple() < other.astuple()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self.astuple()))
+        return f"{type(self).__name__}({fields})"
+
+
+class Point(Record):
+    """An (x, y) point."""
+
+    __slots__ = ("x", "y")
+
+
+class Color(Record):
+    """An RGB colour with 0-255 channels."""
+
+    __slots__ = ("red", "green", "blue")
+
+
+class Person(Record):
+    """A person's name, age and job."""
+
+    __slots__ = ("name", "age", "job")
+
+
+class Student(Record):
+    """A student's name and grade."""
+
+    __slots__ = ("name", "grade")
+
+
+class StringColumn:
+    """A column of strings stored as array codes into a list of unique values.
+
+    Every distinct string is interned and kept once, so a column with few
+    distinct values costs about 4 bytes per row.
+    """
+
+    typecode = "str"
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.codes = array("I")
+        self.values: list[str] = []
+        self._lookup: dict[str, int] = {}
+        for value in values:
+            self.append(value)
+
+    def append(self, value: str) -> None:
+        """Add one string."""
+        code = self._lookup.get(value)
+        if code is None:
+            value = sys.intern(value)  # TypeError for non-strings, before any change
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def take(self, order: Iterable[int]) -> "StringColumn":
+        """Return a column with the rows at the given positions."""
+        column = StringColumn.__new__(StringColumn)
+        column.codes = array("I", map(self.codes.__getitem__, order))
+        column.values, column._lookup = self.values, self._lookup
+        return column
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.values.__getitem__, self.codes)
+
+
+Column = Union[array, StringColumn]
+
+
+def _take(column: Column, order: list[int]) -> Column:
+    if isinstance(column, StringColumn):
+        return column.take(order)
+    return array(column.typecode, map(column.__getitem__, order))
+
+
+class RecordTable:
+    """Store many records as one column per field (struct of arrays).
+
+    `fields` maps each field name to an array typecode ("d", "q", "B", ...)
+    or "str". Rows come back as tuples, or as `record_type(*row)` when a
+    record type is given, so they unpack like the tuples they replace.
+    """
+
+    def __init__(
+        self, fields: Mapping[str, str], rows: Iterable = (),
+        record_type: Optional[type] = None,
+    ) -> None:
+        if not fields:
+            raise ValueError("a table needs at least one field")
+        self.fields = tuple(fields)
+        self.record_type = record_type
+        self._columns: list[Column] = [
+            StringColumn() if typecode == "str" else array(typecode)
+            for typecode in fields.values()
+        ]
+        self.extend(rows)
+
+    def append(self, row: Iterable) -> None:
+        """Add one row (a tuple, Record or any iterable of field values)."""
+        values = tuple(row)
+        if len(values) != len(self._columns):
+            raise ValueError(f"expected {len(self._columns)} values, got {len(values)}")
+        # Check every value first, so a bad one cannot leave the columns
+        # with different lengths
+        for name, column, value in zip(self.fields, self._columns, values):
+            try:
+                if isinstance(column, StringColumn):
+                    if not isinstance(value, str):
+                        raise TypeError(f"expected str, got {type(value).__name__}")
+                else:
+                    array(column.typecode, (value,))
+            except (TypeError, OverflowError) as error:
+                raise type(error)(f"field {name!r}: {error}") from None
+        for column, value in zip(self._columns, values):
+            column.append(value)
+
+    def extend(self, rows: Iterable) -> None:
+        """Add every row of an iterable."""
+        for row in rows:
+            self.append(row)
+
+    def column(self, name: str) -> Column:
+        """Return the storage of one field (an array or a StringColumn)."""
+        return self._columns[self.fields.index(name)]
+
+    def sort(self, key: Union[str, tuple[str, ...]], reverse: bool = False) -> None:
+        """Sort the rows in place by one field or a tuple of fields."""
+        names = (key,) if isinstance(key, str) else key
+        if len(names) == 1:
+            keys = list(self.column(names[0]))
+        else:
+            keys = list(zip(*(self.column(name) for name in names)))
+        # One permutation is computed and applied to every column
+        order = sorted(range(len(self)), key=keys.__getitem__, reverse=reverse)
+        self._columns = [_take(column, order) for column in self._columns]
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        row = tuple(column[index] for column in self._columns)
+        return row if self.record_type is None else self.record_type(*row)
+
+    def __iter__(self) -> Iterator:
+        rows = zip(*self._columns)
+        return rows if self.record_type is None else starmap(self.record_type, rows)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self.fields)}; {len(self)} rows)"
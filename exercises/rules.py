@@ -0,0 +1,190 @@
+"""
+Python Basics: Decision Tables
+==============================
+The decisions in control_flow.py are written as nested if statements, so
+changing a threshold means changing code. A DecisionTable keeps the rules
+as data instead and compiles them into a lookup table: every input is
+mapped to a "cell" between or on the thresholds the rules mention, and the
+outcome of every combination of cells is computed once. Evaluating is then
+a binary search per input plus one list lookup, however many rules there
+are.
+
+Topics covered:
+- Rules as data: (field, operator, value) conditions and an outcome
+- Discretizing inputs with bisect
+- Precomputing every outcome (first matching rule wins)
+- Batch evaluation over columns, optionally with NumPy
+- Replacing rules at runtime
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from itertools import product, repeat
+from operator import add, eq, ge, gt, le, lt, mul
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence, Union
+
+try:
+    from ._optional import numpy_for
+    from .control_flow import GRADE_THRESHOLDS
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import numpy_for
+    from control_flow import GRADE_THRESHOLDS
+
+OPERATORS = {"<": lt, "<=": le, ">": gt, ">=": ge, "==": eq}
+
+# Largest number of cell combinations a table may precompute
+MAX_CELLS = 1 << 20
+
+Condition = tuple[str, str, Any]
+Rule = tuple[Sequence[Condition], Any]
+
+
+class _Compiled(NamedTuple):
+    fields: tuple[str, ...]
+    thresholds: tuple[list, ...]  # sorted thresholds per field
+    strides: tuple[int, ...]
+    outcomes: list
+
+
+def _cell(thresholds: list, value) -> int:
+    """Return the cell of a value: 2i+1 on thresholds[i], 2i just below it."""
+    return bisect_left(thresholds, value) + bisect_right(thresholds, value)
+
+
+def _compile(rules: Sequence[Rule], default) -> _Compiled:
+    values: dict[str, set] = {}
+    for conditions, _ in rules:
+        for field, op, value in conditions:
+            if op not in OPERATORS:
+                raise ValueError(f"unknown operator {op!r}; use one of {', '.join(OPERATORS)}")
+            values.setdefault(field, set()).add(value)
+    fields = tuple(values)
+    thresholds = tuple(sorted(values[field]) for field in fields)
+    sizes = [2 * len(t) + 1 for t in thresholds]
+    total = 1
+    for size in sizes:
+        total *= size
+    if total > MAX_CELLS:
+        raise ValueError(f"rules need {total} cells, more than MAX_CELLS ({MAX_CELLS})")
+    strides = []
+    stride = 1
+    for size in reversed(sizes):
+        strides.append(stride)
+        stride *= size
+    strides.reverse()
+
+    outcomes = [default] * total
+    # Paint the last rule first so earlier rules overwrite it: first match wins
+    for conditions, outcome in reversed(rules):
+        allowed = [range(size) for size in sizes]
+        for field, op, value in conditions:
+            f = fields.index(field)
+            # A threshold sits in cell 2i+1, so comparing a value with it is
+            # the same as comparing cell numbers
+            cell = 2 * thresholds[f].index(value) + 1
+            allowed[f] = [c for c in allowed[f] if OPERATORS[op](c, cell)]
+        for cells in product(*allowed):
+            outcomes[sum(map(mul, cells, strides))] = outcome
+    return _Compiled(fields, thresholds, tuple(strides), outcomes)
+
+
+class DecisionTable:
+    """Ordered rules compiled into a lookup table.
+
+    Each rule is (conditions, outcome), where conditions is a sequence of
+    (field, operator, value) with operator one of <, <=, >, >=, ==. The
+    outcome of the first rule whose conditions all hold is returned, or
+    `default` when none does.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = (), default=None) -> None:
+        self.replace_rules(rules, default)
+
+    def replace_rules(self, rules: Iterable[Rule], default=None) -> None:
+        """Compile a new set of rules and switch to it in one step."""
+        rules = [(tuple(tuple(c) for c in conditions), outcome) for conditions, outcome in rules]
+        compiled = _compile(rules, default)
+        # Evaluations running concurrently see either the old or the new table
+        self.rules, self.default, self._compiled = rules, default, compiled
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "DecisionTable":
+        """Read rules from a JSON file.
+
+        The file holds {"default": ..., "rules": [{"when": [[field, op,
+        value], ...], "then": outcome}, ...]}.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return cls(((rule["when"], rule["then"]) for rule in data["rules"]), data.get("default"))
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Names of the inputs the rules look at."""
+        return self._compiled.fields
+
+    def evaluate(self, inputs: Optional[Mapping[str, Any]] = None, **values):
+        """Return the outcome for one set of inputs (a mapping or keywords)."""
+        if inputs:
+            values = {**inputs, **values}
+        compiled = self._compiled
+        index = 0
+        for field, thresholds, stride in zip(compiled.fields, compiled.thresholds, compiled.strides):
+            index += _cell(thresholds, values[field]) * stride
+        return compiled.outcomes[index]
+
+    def evaluate_many(self, columns: Mapping[str, Iterable]) -> list:
+        """Return the outcomes for many rows given as one column per field.
+
+        Columns that are NumPy arrays are discretized with searchsorted;
+        others with bisect, one field at a time.
+        """
+        compiled = self._compiled
+        indexes = None
+        for field, thresholds, stride in zip(compiled.fields, compiled.thresholds, compiled.strides):
+            column = columns[field]
+            np = numpy_for(column)
+            if np is not None:
+                cells = (np.searchsorted(thresholds, column, side="left")
+                         + np.searchsorted(thresholds, column, side="right")).tolist()
+            else:
+                column = list(column)
+                cells = list(map(add, map(bisect_left, repeat(thresholds), column),
+                                 map(bisect_right, repeat(thresholds), column)))
+            scaled = map(mul, cells, repeat(stride))
+            indexes = list(scaled) if indexes is None else list(map(add, indexes, scaled))
+        if indexes is None:  # no rule looks at any field
+            rows = len(next(iter(columns.values()), ()))
+            return [compiled.outcomes[0]] * rows
+        return list(map(compiled.outcomes.__getitem__, indexes))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self.rules)} rules on {', '.join(self.fields) or 'no fields'})"
+
+
+def threshold_rules(field: str, thresholds: Sequence[tuple]) -> list[Rule]:
+    """Turn ascending (lowest value, label) pairs into ">=" rules, highest first."""
+    return [(((field, ">=", bound),), label) for bound, label in reversed(thresholds)]
+
+
+def age_table(adult_age: int = 18) -> DecisionTable:
+    """Decision table for the adult/minor check in control_flow."""
+    return DecisionTable([((("age", ">=", adult_age),), "adult")], default="minor")
+
+
+def weather_table(hot: float = 30, pleasant: float = 20) -> DecisionTable:
+    """Decision table equivalent to control_flow.weather_advice."""
+    return DecisionTable([
+        ((("temperature", ">", hot), ("is_raining", "==", True)),
+         ("It's hot outside!", "But it's raining, take an umbrella.")),
+        ((("temperature", ">", hot),), ("It's hot outside!", "Great day for the beach!")),
+        ((("temperature", ">", pleasant), ("is_raining", "==", True)),
+         ("The weather is pleasant.", "Light rain, take a jacket.")),
+        ((("temperature", ">", pleasant),), ("The weather is pleasant.",)),
+    ], default=("It's cold outside!",))
+
+
+def grade_table(thresholds: Sequence[tuple] = GRADE_THRESHOLDS) -> DecisionTable:
+    """Decision table equivalent to control_flow.get_grade."""
+    return DecisionTable(threshold_rules("score", thresholds), default="F")
@@ -0,0 +1,88 @@
+"""
+Python Basics: Arithmetic Series
+================================
+This module replaces "add the numbers one by one" loops with closed-form
+formulas, so sums over huge ranges take constant time.
+
+Topics covered:
+- Arithmetic series: sum of range(start, stop, step)
+- Sums of powers (Faulhaber's formula with Bernoulli numbers)
+- Computing many results in one call (optionally with NumPy)
+- Exact big-integer arithmetic with int and Fraction
+"""
+
+from math import comb
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+try:
+    from ._optional import numpy_for
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import numpy_for
+
+# Largest n for which n * (n + 1) still fits in a signed 64-bit integer
+_INT64_SAFE_N = 3_037_000_498
+
+# Bernoulli numbers B_0, B_1, ... (B_1 = +1/2 convention), grown on demand
+_bernoulli: list["Fraction"] = []
+
+
+def range_length(start: int, stop: int, step: int = 1) -> int:
+    """Return len(range(start, stop, step)) without the sys.maxsize limit."""
+    if step == 0:
+        raise ValueError("step must not be zero")
+    if step > 0:
+        return max(0, (stop - start + step - 1) // step)
+    return max(0, (start - stop - step - 1) // -step)
+
+
+def sum_range(start: int, stop: int, step: int = 1) -> int:
+    """Return sum(range(start, stop, step)) in constant time."""
+    count = range_length(start, stop, step)
+    # count terms: start, start + step, ..., start + (count - 1) * step
+    return count * start + step * (count * (count - 1) // 2)
+
+
+def bernoulli(m: int) -> "Fraction":
+    """Return the Bernoulli number B_m (with B_1 = +1/2)."""
+    from fractions import Fraction  # imported on first use; it is slow to import
+
+    if not _bernoulli:
+        _bernoulli.append(Fraction(1))
+    while len(_bernoulli) <= m:
+        k = len(_bernoulli)
+        # Recurrence: sum_{j=0}^{k} C(k+1, j) * B_j = k + 1 for the B_1 = +1/2 convention
+        total = sum(comb(k + 1, j) * _bernoulli[j] for j in range(k))
+        _bernoulli.append(Fraction(k + 1 - total, k + 1))
+    return _bernoulli[m]
+
+
+def sum_powers(n: int, p: int) -> int:
+    """Return 1**p + 2**p + ... + n**p using Faulhaber's formula.
+
+    The cost depends on p, not on n, and the result is exact.
+    """
+    if p < 0:
+        raise ValueError("p must be non-negative")
+    if n <= 0:
+        return 0
+    total = sum(comb(p + 1, j) * bernoulli(j) * n ** (p + 1 - j) for j in range(p + 1))
+    return int(total / (p + 1))
+
+
+def sum_numbers_many(ns):
+    """Return [sum_numbers(n) for n in ns] in one call.
+
+    Non-positive n give 0, like the loop version. A NumPy integer array
+    whose results fit in int64 is computed in a single vectorized step and
+    returned as an array; everything else returns a list of exact ints.
+    """
+    np = numpy_for(ns)
+    if np is not None and ns.dtype.kind in "iu":
+        if ns.size == 0 or int(ns.max()) <= _INT64_SAFE_N:
+            ns = ns.astype(np.int64)
+            return np.where(ns > 0, ns * (ns + 1) // 2, 0)
+        ns = ns.tolist()
+    return [n * (n + 1) // 2 if n > 0 else 0 for n in ns]
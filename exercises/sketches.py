@@ -0,0 +1,359 @@
+"""
+Python Basics: Probabilistic Sketches
+=====================================
+A set that remembers every item gives exact answers but needs memory for
+every item. Sketches trade a small, controllable error for a fixed and
+tiny amount of memory, which is how very large streams are summarized.
+
+Topics covered:
+- HyperLogLog: counting distinct items
+- Count-Min Sketch: estimating how often an item occurs
+- Heavy hitters: the most frequent items of a stream
+- Bloom filters: streaming deduplication that can resume from disk
+- Merging sketches built on separate shards of the data
+"""
+
+import hashlib
+import heapq
+import os
+import struct
+from array import array
+from math import ceil, e, log, log2, sqrt
+from typing import Hashable, Iterable, Iterator, Optional, Union
+
+# Bloom filter file header: magic, version, hashes, bits, capacity, count, fp_rate
+_BLOOM_HEADER = struct.Struct("<4sHHQQQd")
+_BLOOM_MAGIC = b"BLMF"
+_BLOOM_VERSION = 1
+
+
+def _to_bytes(item) -> bytes:
+    """Encode an item for hashing (str as UTF-8, bytes as-is, others via repr)."""
+    if isinstance(item, bytes):
+        return item
+    if isinstance(item, str):
+        return item.encode("utf-8")
+    return repr(item).encode("utf-8")
+
+
+def hash64(item) -> int:
+    """Return a 64-bit hash of an item that is the same in every process.
+
+    The built-in hash() of a str changes between runs, so sketches built
+    by different processes could not be merged with it.
+    """
+    return int.from_bytes(hashlib.blake2b(_to_bytes(item), digest_size=8).digest(), "little")
+
+
+def hash128(item) -> tuple[int, int]:
+    """Return two independent 64-bit hashes of an item."""
+    digest = hashlib.blake2b(_to_bytes(item), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class HyperLogLog:
+    """Estimate the number of distinct items using 2**precision small registers.
+
+    The relative standard error is about 1.04 / sqrt(2**precision), so
+    error_rate=0.01 uses 16 KiB no matter how many items are added.
+    """
+
+    def __init__(self, error_rate: float = 0.01, precision: int = 0) -> None:
+        if not precision:
+            if not 0 < error_rate < 1:
+                raise ValueError("error_rate must be between 0 and 1")
+            precision = ceil(2 * log2(1.04 / error_rate))
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @property
+    def error_rate(self) -> float:
+        """Expected relative standard error of count()."""
+        return 1.04 / sqrt(len(self.registers))
+
+    def add(self, item) -> None:
+        """Add one item."""
+        x = hash64(item)
+        index = x >> (64 - self.precision)
+        rest = x & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1  # leading zeros + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items: Iterable) -> None:
+        """Add every item of an iterable."""
+        for item in items:
+            self.add(item)
+
+    def count(self) -> int:
+        """Return the estimated number of distinct items added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        # registers.count(r) scans in C, much faster than a Python loop
+        harmonic = sum(self.registers.count(r) * 2.0 ** -r for r in range(66 - self.precision))
+        estimate = alpha * m * m / harmonic
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * log(m / zeros)  # small-range correction
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Combine another sketch into this one (union of both streams)."""
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class CountMinSketch:
+    """Estimate item frequencies with a depth x width table of counters.
+
+    An estimate is never too low, and with probability 1 - delta it is at
+    most epsilon * (total count) too high.
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.width = ceil(e / epsilon)
+        self.depth = ceil(log(1 / delta))
+        self.rows = [array("Q", bytes(8 * self.width)) for _ in range(self.depth)]
+        self.total = 0
+
+    def _columns(self, item) -> list[int]:
+        # Double hashing: column_i = h1 + i * h2 behaves like independent hashes
+        h1, h2 = hash128(item)
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, item, count: int = 1) -> int:
+        """Add `count` occurrences of an item and return its new estimate."""
+        self.total += count
+        estimate = None
+        for row, column in zip(self.rows, self._columns(item)):
+            row[column] += count
+            value = row[column]
+            if estimate is None or value < estimate:
+                estimate = value
+        return estimate
+
+    def estimate(self, item) -> int:
+        """Return the estimated number of times an item was added."""
+        return min(row[column] for row, column in zip(self.rows, self._columns(item)))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Add the counters of another sketch with the same dimensions."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge sketches with different dimensions")
+        for row, other_row in zip(self.rows, other.rows):
+            for column, value in enumerate(other_row):
+                if value:
+                    row[column] += value
+        self.total += other.total
+
+
+class HeavyHitters:
+    """Track the k most frequent items of a stream with a Count-Min Sketch.
+
+    Only k candidate items are stored; their counts are CMS estimates.
+    """
+
+    def __init__(self, k: int = 10, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        if k < 1:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.sketch = CountMinSketch(epsilon, delta)
+        self._top: dict[Hashable, int] = {}
+        self._heap: list[tuple[int, int, Hashable]] = []  # (estimate, tiebreak, item), may be stale
+        self._pushes = 0
+
+    def add(self, item, count: int = 1) -> None:
+        """Add `count` occurrences of an item."""
+        estimate = self.sketch.add(item, count)
+        if item in self._top:
+            self._top[item] = estimate
+            self._push(estimate, item)
+        elif len(self._top) < self.k:
+            self._top[item] = estimate
+            self._push(estimate, item)
+        else:
+            smallest, _, weakest = self._peek_smallest()
+            if estimate > smallest:
+                del self._top[weakest]
+                heapq.heappop(self._heap)
+                self._top[item] = estimate
+                self._push(estimate, item)
+
+    def update(self, items: Iterable) -> None:
+        """Add every item of an iterable."""
+        for item in items:
+            self.add(item)
+
+    def items(self) -> list[tuple[Hashable, int]]:
+        """Return (item, estimated count) pairs, most frequent first."""
+        return sorted(self._top.items(), key=lambda pair: pair[1], reverse=True)
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """Combine another tracker built on a different shard of the stream."""
+        self.sketch.merge(other.sketch)
+        candidates = set(self._top) | set(other._top)
+        ranked = heapq.nlargest(
+            self.k, ((self.sketch.estimate(item), item) for item in candidates),
+            key=lambda pair: pair[0],
+        )
+        self._top = {item: estimate for estimate, item in ranked}
+        self._heap = []
+        for estimate, item in ranked:
+            self._push(estimate, item)
+
+    def _push(self, estimate: int, item) -> None:
+        self._pushes += 1
+        heapq.heappush(self._heap, (estimate, self._pushes, item))
+        if len(self._heap) > 4 * self.k:
+            # Drop stale entries so the heap does not grow without bound
+            self._heap = [
+                (count, tiebreak, key) for count, tiebreak, key in self._heap
+                if self._top.get(key) == count
+            ]
+            heapq.heapify(self._heap)
+
+    def _peek_smallest(self) -> tuple[int, int, Hashable]:
+        # Discard entries whose item was evicted or whose count has changed
+        while True:
+            count, tiebreak, item = self._heap[0]
+            if self._top.get(item) == count:
+                return count, tiebreak, item
+            heapq.heappop(self._heap)
+
+
+class BloomFilter:
+    """Remember which items were seen in a fixed bytearray of bits.
+
+    "Not seen" answers are always right; "seen" answers are wrong with
+    probability about fp_rate once `capacity` items have been added. Each
+    item sets num_hashes bits chosen by double hashing.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, fp_rate: float = 0.001) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, ceil(-capacity * log(fp_rate) / log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item) -> list[int]:
+        h1, h2 = hash128(item)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item) -> bool:
+        """Add an item; return True if it was definitely not seen before."""
+        bits = self.bits
+        new = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        """Number of items added that were new to the filter."""
+        return self.count
+
+    def merge(self, other: "BloomFilter") -> None:
+        """Combine another filter with the same size into this one (union)."""
+        if (other.num_bits, other.num_hashes) != (self.num_bits, self.num_hashes):
+            raise ValueError("cannot merge filters with different dimensions")
+        union = int.from_bytes(self.bits, "little") | int.from_bytes(other.bits, "little")
+        self.bits = bytearray(union.to_bytes(len(self.bits), "little"))
+        self.count += other.count
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the filter to a file, replacing it atomically."""
+        temporary = os.fspath(path) + ".tmp"
+        header = _BLOOM_HEADER.pack(
+            _BLOOM_MAGIC, _BLOOM_VERSION, self.num_hashes, self.num_bits,
+            self.capacity, self.count, self.fp_rate,
+        )
+        with open(temporary, "wb") as f:
+            f.write(header)
+            f.write(self.bits)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "BloomFilter":
+        """Read a filter written by save()."""
+        with open(path, "rb") as f:
+            header = f.read(_BLOOM_HEADER.size)
+            bits = f.read()
+        if len(header) != _BLOOM_HEADER.size:
+            raise ValueError(f"{path} is not a Bloom filter file")
+        magic, version, num_hashes, num_bits, capacity, count, fp_rate = _BLOOM_HEADER.unpack(header)
+        if magic != _BLOOM_MAGIC or version != _BLOOM_VERSION or len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"{path} is not a Bloom filter file")
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.fp_rate = capacity, fp_rate
+        bloom.num_bits, bloom.num_hashes = num_bits, num_hashes
+        bloom.bits, bloom.count = bytearray(bits), count
+        return bloom
+
+
+def dedup(
+    items: Iterable, capacity: int = 1_000_000, fp_rate: float = 0.001,
+    verify=None, path: Optional[Union[str, os.PathLike]] = None,
+) -> Iterator:
+    """Yield each item of a stream the first time it is seen.
+
+    Only the Bloom filter is kept in memory, so a false positive drops an
+    item that was actually new. Pass `verify`, any container with `in` and
+    add() (a set, or a disk-backed store), to make the result exact: it is
+    only consulted when the filter says "seen", and every yielded item is
+    added to it. With `path`, the filter is loaded from that file if it
+    exists and saved back when the stream ends, so a restarted process
+    skips the items an earlier run already yielded.
+
+    When resuming with both, `verify` must be the persistent store of the
+    earlier runs (it has to hold every item the filter does, or those
+    items would be yielded again). An empty `verify` next to a non-empty
+    saved filter raises ValueError.
+    """
+    if path is not None and os.path.exists(path):
+        bloom = BloomFilter.load(path)
+        if verify is not None and len(bloom) and not len(verify):
+            raise ValueError(
+                f"the filter at {path} already holds {len(bloom)} items but verify is "
+                "empty; pass the verify store of the earlier run, or verify=None"
+            )
+    else:
+        bloom = BloomFilter(capacity, fp_rate)
+    try:
+        for item in items:
+            if not bloom.add(item):
+                if verify is None or item in verify:
+                    continue
+            if verify is not None:
+                verify.add(item)
+            yield item
+    finally:
+        if path is not None:
+            bloom.save(path)
+
+
+def count_unique(items: Iterable, exact: bool = True, error_rate: float = 0.01) -> int:
+    """Count distinct items exactly with a set, or approximately with HyperLogLog."""
+    if exact:
+        return len(set(items))
+    sketch = HyperLogLog(error_rate)
+    sketch.update(items)
+    return sketch.count()
@@ -0,0 +1,265 @@
+"""
+Python Basics: Streaming Statistics
+===================================
+min(), max() and sum() each walk the data once and need it to be a list
+that can be walked again. RunningStats collects count, sum, min, max,
+mean and variance in a single pass over any iterable, and two RunningStats
+built on separate chunks can be merged into the stats of both. The same
+reducer works on binary files of numbers too large to load.
+
+Topics covered:
+- Welford's online mean and variance
+- Merging partial results (Chan's parallel formula)
+- Reducing a stream in fixed-size chunks with islice
+- Memory-mapped numeric files reduced in a thread or process pool
+- Optional NumPy support
+"""
+
+import mmap
+import os
+from itertools import islice, repeat
+from math import nan, sqrt
+from operator import mul, sub
+from typing import Iterable, Optional, Union
+
+try:
+    from ._optional import loaded_numpy, numpy_for
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from _optional import loaded_numpy, numpy_for
+
+# Values per chunk when reducing a stream
+DEFAULT_CHUNK_SIZE = 4096
+
+# Bytes per task when reducing a numeric file
+DEFAULT_FILE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Supported file formats: raw native-endian 8-byte values
+_TYPECODES = {"int64": "q", "float64": "d"}
+
+
+class RunningStats:
+    """Count, sum, min, max, mean and variance of the values seen so far.
+
+    Sums of ints stay exact ints. mean and variance are NaN and
+    minimum/maximum are None until a value has been added.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared differences from the mean
+
+    def add(self, value) -> None:
+        """Add one value (Welford's update)."""
+        self.count += 1
+        self.total += value
+        if self.count == 1:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def update(self, values: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "RunningStats":
+        """Add every value of an iterable in one pass and return self.
+
+        The stream is consumed chunk_size values at a time; each chunk is
+        summarized with built-in functions and merged in. A NumPy array is
+        summarized in a few vectorized steps.
+        """
+        if numpy_for(values) is not None:
+            return self.merge(_numpy_stats(values))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            self.merge(_chunk_stats(chunk))
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combine the stats of another chunk into this one and return self."""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.total = other.count, other.total
+            self.minimum, self.maximum = other.minimum, other.maximum
+            self._mean, self._m2 = other._mean, other._m2
+            return self
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean."""
+        return self._mean if self.count else nan
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        return self._m2 / self.count if self.count else nan
+
+    @property
+    def sample_variance(self) -> float:
+        """Sample variance (divides by count - 1)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else nan
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation."""
+        return sqrt(self.variance)
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(count={self.count}, total={self.total}, minimum={self.minimum}, "
+                f"maximum={self.maximum}, mean={self.mean}, variance={self.variance})")
+
+
+def _chunk_stats(chunk: list) -> RunningStats:
+    """Summarize a list with C-level built-ins (a stable two-pass variance)."""
+    stats = RunningStats()
+    stats.count = len(chunk)
+    stats.total = sum(chunk)
+    stats.minimum, stats.maximum = min(chunk), max(chunk)
+    stats._mean = stats.total / stats.count
+    deviations = list(map(sub, chunk, repeat(stats._mean)))
+    stats._m2 = sum(map(mul, deviations, deviations))
+    return stats
+
+
+def _exact_int_sum(values) -> int:
+    """Sum an integer array exactly, even when an int64 sum would wrap.
+
+    Each value is split into its high and low 32 bits; neither half can
+    overflow a 64-bit sum, and the exact total is rebuilt as a Python int.
+    """
+    np = loaded_numpy()
+    if values.dtype.kind == "u":
+        values = values.astype(np.uint64, copy=False)
+    else:
+        values = values.astype(np.int64, copy=False)
+    high = int((values >> 32).sum(dtype=values.dtype))
+    low = int((values & 0xFFFFFFFF).sum(dtype=np.uint64))
+    return (high << 32) + low
+
+
+def _numpy_stats(values) -> RunningStats:
+    """Summarize a NumPy array with vectorized reductions.
+
+    Integer totals are exact, like sums of Python ints.
+    """
+    stats = RunningStats()
+    values = values.ravel()
+    if values.size:
+        stats.count = int(values.size)
+        stats.minimum, stats.maximum = values.min().item(), values.max().item()
+        if values.dtype.kind in "iu" and (
+            max(abs(stats.minimum), abs(stats.maximum)) * stats.count >= 1 << 63
+        ):
+            # The plain sum could wrap around
+            stats.total = _exact_int_sum(values)
+        else:
+            stats.total = values.sum().item()
+        stats._mean = float(values.mean())
+        stats._m2 = float(((values - stats._mean) ** 2).sum())
+    return stats
+
+
+def stream_stats(values: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> RunningStats:
+    """Return the RunningStats of an iterable, generator or NumPy array."""
+    return RunningStats().update(values, chunk_size)
+
+
+def merge_stats(parts: Iterable[RunningStats]) -> RunningStats:
+    """Merge the stats of several chunks into a new RunningStats."""
+    merged = RunningStats()
+    for part in parts:
+        merged.merge(part)
+    return merged
+
+
+def _typecode(dtype: str) -> str:
+    try:
+        return _TYPECODES[dtype]
+    except KeyError:
+        raise ValueError(f"dtype must be one of {sorted(_TYPECODES)}") from None
+
+
+def _advise(mapped: mmap.mmap, offset: int, length: int) -> None:
+    """Ask the OS to start reading a byte range in the background."""
+    if hasattr(mapped, "madvise") and length > 0:
+        start = offset - offset % mmap.PAGESIZE
+        mapped.madvise(mmap.MADV_WILLNEED, start, min(offset + length, len(mapped)) - start)
+
+
+def chunk_stats(path: Union[str, os.PathLike], dtype: str, start: int, stop: int) -> RunningStats:
+    """Return the stats of values [start, stop) of a raw int64/float64 file.
+
+    The file is memory-mapped and read through memoryview.cast, so the
+    values are never copied into bytes first. The next chunk of the same
+    size is prefetched so the disk works while this one is reduced.
+    """
+    typecode = _typecode(dtype)
+    if stop <= start:
+        return RunningStats()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        offset, length = start * 8, (stop - start) * 8
+        _advise(mapped, offset, 2 * length)
+        with memoryview(mapped) as whole, whole[offset:offset + length].cast(typecode) as view:
+            np = loaded_numpy()
+            if np is not None:
+                return _numpy_stats(np.frombuffer(view, dtype=dtype))
+            return _chunk_stats(view.tolist())
+
+
+def _chunk_task(task: tuple) -> RunningStats:
+    return chunk_stats(*task)
+
+
+def file_stats(
+    path: Union[str, os.PathLike],
+    dtype: str = "float64",
+    chunk_size: int = DEFAULT_FILE_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> RunningStats:
+    """Return the RunningStats of a raw binary file of int64 or float64 values.
+
+    The file is split into chunk_size-byte tasks that are reduced in a
+    ThreadPoolExecutor or ProcessPoolExecutor (executor="thread" or
+    "process"); each task maps its own range of the file, so only partial
+    stats travel between workers. workers=1 runs everything in this process.
+    """
+    _typecode(dtype)
+    if executor not in ("thread", "process"):
+        raise ValueError("executor must be 'thread' or 'process'")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    if chunk_size < 8:
+        raise ValueError("chunk_size must be at least 8 bytes")
+    size = os.path.getsize(path)
+    if size % 8:
+        raise ValueError(f"{path} is not a whole number of 8-byte values")
+    count, step = size // 8, chunk_size // 8
+    tasks = [(path, dtype, start, min(start + step, count)) for start in range(0, count, step)]
+    if workers == 1 or len(tasks) <= 1:
+        return merge_stats(map(_chunk_task, tasks))
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        return merge_stats(pool.map(_chunk_task, tasks))
@@ -15,6 +15,21 @@ Topics covered:
 - Practical applications
 """
 
+from typing import Callable, Optional
+
+try:
+    from .geometry import PointIndex, distance
+    from .records import Person
+    from .stats import stream_stats
+    from .sketches import count_unique, dedup
+    from .words import word_stats
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from geometry import PointIndex, distance
+    from records import Person
+    from stats import stream_stats
+    from sketches import count_unique, dedup
+    from words import word_stats
+
 
 def demonstrate_tuple_basics() -> None:
     """Demonstrate basic tuple concepts."""
@@ -130,6 +145,10 @@ def demonstrate_tuple_unpacking() -> None:
     name, age, job = person
     print(f"  Tuple: {person}")
     print(f"  Name: {name}, Age: {age}, Job: {job}")
+    # A __slots__ record unpacks the same way but names its fields
+    record = Person(*person)
+    name, age, job = record
+    print(f"  Record: {record} (job field: {record.job})")
     
     # Swapping variables
     print("\n3. Swapping variables:")
@@ -158,7 +177,8 @@ def demonstrate_tuple_unpacking() -> None:
     # Returning multiple values from function
     print("\n6. Function returning multiple values:")
     def get_stats(numbers: tuple) -> tuple:
-        return min(numbers), max(numbers), sum(numbers)
+        stats = stream_stats(numbers)  # min, max and sum in one pass
+        return stats.minimum, stats.maximum, stats.total
     
     data = (5, 10, 15, 20)
     minimum, maximum, total = get_stats(data)
@@ -318,9 +338,6 @@ def demonstrate_practical_examples() -> None:
     point1 = (10, 20)
     point2 = (30, 40)
     
-    def distance(p1: tuple, p2: tuple) -> float:
-        return ((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)**0.5
-    
     dist = distance(point1, point2)
     print(f"  Point 1: {point1}")
     print(f"  Point 2: {point2}")
@@ -335,6 +352,10 @@ def demonstrate_practical_examples() -> None:
     }
     print(f"  Location at (0, 0): {locations[(0, 0)]}")
     print(f"  Location at (1, 0): {locations[(1, 0)]}")
+    # A PointIndex is looked up the same way and also finds nearby points
+    index = PointIndex(locations)
+    _, point, name = index.nearest((0.8, 0.3))[0]
+    print(f"  Closest location to (0.8, 0.3): {name} at {point}")
     
     # 3. Removing duplicates with sets
     print("\n3. Removing duplicates from list:")
@@ -361,10 +382,15 @@ def demonstrate_practical_examples() -> None:
         "user3@email.com",
         "user2@email.com"   # Duplicate
     ]
-    unique_emails = set(email_list)
+    # dedup() streams first-seen items using a Bloom filter instead of a full set
+    unique_emails = list(dedup(email_list, capacity=100))
     print(f"  Total emails: {len(email_list)}")
     print(f"  Unique emails: {len(unique_emails)}")
     print(f"  Duplicates removed: {len(email_list) - len(unique_emails)}")
+    print(f"  First-seen order: {unique_emails}")
+    # For huge lists a HyperLogLog sketch estimates the same number in fixed memory
+    approximate = count_unique(email_list, exact=False)
+    print(f"  Unique emails (HyperLogLog estimate): {approximate}")
     
     # 6. RGB color as tuple
     print("\n6. RGB colors as tuples:")
@@ -376,36 +402,41 @@ def demonstrate_practical_examples() -> None:
     print(f"  Blue: {BLUE}")
 
 
-def interactive_example() -> None:
-    """Interactive example for tuples and sets."""
+def interactive_example(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Interactive example for tuples and sets.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
     print("\n" + "=" * 50)
     print("INTERACTIVE EXAMPLE: UNIQUE WORD COUNTER")
     print("=" * 50)
     
     print("\nEnter a sentence and I'll analyze it:")
-    sentence = input("Your sentence: ")
+    sentence = ask("Your sentence: ")
     
-    # Convert to lowercase and split into words
-    words = sentence.lower().split()
-    
-    # Get unique words using set
-    unique_words = set(words)
+    # Count every word in a single pass (lowercased, split on whitespace)
+    stats = word_stats(sentence)
     
     print(f"\n📊 Analysis:")
-    print(f"  Total words: {len(words)}")
-    print(f"  Unique words: {len(unique_words)}")
-    print(f"  Duplicate words: {len(words) - len(unique_words)}")
-    print(f"\n📝 All unique words: {sorted(unique_words)}")
+    print(f"  Total words: {stats.total}")
+    print(f"  Unique words: {stats.unique}")
+    print(f"  Duplicate words: {stats.duplicates}")
+    print(f"\n📝 All unique words: {sorted(stats.counts)}")
     
     # Count frequency of each word
     print(f"\n🔢 Word frequency:")
-    for word in unique_words:
-        count = words.count(word)
+    for word, count in stats.counts.items():
         print(f"  '{word}': {count} time(s)")
 
 
-def main() -> None:
-    """Run all tuple and set demonstrations."""
+def main(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Run all tuple and set demonstrations.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
+
     print("\n" + "🐍" * 25)
     print("WELCOME TO PYTHON TUPLES & SETS TUTORIAL")
     print("🐍" * 25)
@@ -425,9 +456,9 @@ def main() -> None:
     
     # Ask user if they want to try the interactive example
     print("\n" + "=" * 50)
-    try_interactive = input("\nWould you like to try the word counter? (y/n): ")
+    try_interactive = ask("\nWould you like to try the word counter? (y/n): ")
     if try_interactive.lower() == 'y':
-        interactive_example()
+        interactive_example(ask)
     
     print("\n" + "=" * 50)
     print("✅ Tutorial completed!")
@@ -9,34 +9,64 @@ This module demonstrates basic Python concepts:
 - Type casting
 """
 
+from typing import Callable, Optional
+
 # Basic variables with type hints
 name: str = "Alejandro"
 age: int = 20
 height: float = 1.75
 is_student: bool = True
 
-print("=== Basic Variables ===")
-print(f"Name: {name}")
-print(f"Age: {age}")
-print(f"Height: {height}")
-print(f"Student: {is_student}")
 
-print("\n=== Variable Types ===")
-print(f"type(name): {type(name)}")
-print(f"type(age): {type(age)}")
-print(f"type(height): {type(height)}")
-print(f"type(is_student): {type(is_student)}")
+def demonstrate_basic_variables() -> None:
+    """Print the basic variables defined above."""
+    print("=== Basic Variables ===")
+    print(f"Name: {name}")
+    print(f"Age: {age}")
+    print(f"Height: {height}")
+    print(f"Student: {is_student}")
+
+
+def demonstrate_variable_types() -> None:
+    """Print the type of each basic variable."""
+    print("\n=== Variable Types ===")
+    print(f"type(name): {type(name)}")
+    print(f"type(age): {type(age)}")
+    print(f"type(height): {type(height)}")
+    print(f"type(is_student): {type(is_student)}")
+
+
+def demonstrate_user_input(ask: Optional[Callable[[str], str]] = None) -> int:
+    """Ask for the user's name and age, and return the age.
+
+    `ask` replaces input() (see the inputs module), e.g. for scripted runs.
+    """
+    ask = input if ask is None else ask
+    # User input (input always returns a string)
+    print("\n=== User Input ===")
+    user_name: str = ask("Enter your name: ")
+    
+    user_age_str: str = ask("Enter your age: ")
+    user_age: int = int(user_age_str)  # type casting
+    
+    print(f"Hello {user_name}, next year you will be {user_age + 1} years old.")
+    return user_age
+
+
+def demonstrate_simple_calculation(user_age: int) -> None:
+    """Estimate the birth year from an age."""
+    print("\n=== Simple Calculation ===")
+    birth_year: int = 2025 - user_age
+    print(f"You were born in approximately {birth_year}.")
 
-# User input (input always returns a string)
-print("\n=== User Input ===")
-user_name: str = input("Enter your name: ")
 
-user_age_str: str = input("Enter your age: ")
-user_age: int = int(user_age_str)  # type casting
+def main(ask: Optional[Callable[[str], str]] = None) -> None:
+    """Run all variable demonstrations."""
+    demonstrate_basic_variables()
+    demonstrate_variable_types()
+    user_age = demonstrate_user_input(ask)
+    demonstrate_simple_calculation(user_age)
 
-print(f"Hello {user_name}, next year you will be {user_age + 1} years old.")
 
-# Simple calculation
-print("\n=== Simple Calculation ===")
-birth_year: int = 2025 - user_age
-print(f"You were born in approximately {birth_year}.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Python Basics: Word Statistics
+==============================
+This module counts words in a single pass. The first version of the word
+counter in tuples.py called words.count(word) for every unique word, which
+rescans the whole text each time. A dictionary (Counter) counts every word
+in one pass instead.
+
+Topics covered:
+- Counting with collections.Counter (a hash map)
+- Streaming input line by line
+- Top-k selection with a heap (heapq.nlargest)
+- Approximate statistics with sketches for inputs too big for a Counter
+- Map-reduce word counting over large files with a process pool
+- A zero-copy bytes tokenizer over memory-mapped files
+"""
+
+import heapq
+import mmap
+import os
+import re
+import string
+from collections import Counter
+from operator import itemgetter
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+try:
+    from .sketches import HeavyHitters, HyperLogLog
+except ImportError:  # running as a script or with exercises/ on sys.path
+    from sketches import HeavyHitters, HyperLogLog
+
+
+class WordStats(NamedTuple):
+    """Summary of the words in a text."""
+    total: int
+    unique: int
+    duplicates: int
+    top: list[tuple[str, int]]
+    counts: Counter
+
+
+def count_words(lines: Iterable[str]) -> Counter:
+    """Count lowercase, whitespace-separated words over an iterable of lines."""
+    counts: Counter = Counter()
+    for line in lines:
+        counts.update(line.lower().split())
+    return counts
+
+
+def top_words(counts: Counter, k: int = 10) -> list[tuple[str, int]]:
+    """Return the k most common (word, count) pairs using a heap.
+
+    heapq.nlargest keeps only k items at a time: O(u log k) instead of
+    sorting all u unique words.
+    """
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+def stats_from_counts(counts: Counter, top_k: int = 10) -> WordStats:
+    """Build a WordStats summary from word counts."""
+    total = sum(counts.values())
+    return WordStats(
+        total=total,
+        unique=len(counts),
+        duplicates=total - len(counts),
+        top=top_words(counts, top_k),
+        counts=counts,
+    )
+
+
+def word_stats_stream(lines: Iterable[str], top_k: int = 10) -> WordStats:
+    """Return word statistics for a stream of lines (e.g. an open file).
+
+    Lines are read one at a time, so memory grows with the number of
+    distinct words, not with the size of the input.
+    """
+    return stats_from_counts(count_words(lines), top_k)
+
+
+def word_stats(text: str, top_k: int = 10) -> WordStats:
+    """Return word statistics for a piece of text."""
+    return word_stats_stream([text], top_k)
+
+
+def sketch_word_stats(
+    lines: Iterable[str],
+    top_k: int = 10,
+    error_rate: float = 0.01,
+    epsilon: float = 0.0001,
+) -> WordStats:
+    """Approximate word statistics in fixed memory.
+
+    `total` is exact. `unique` comes from a HyperLogLog (relative error
+    about `error_rate`) and `top` from a Count-Min heavy-hitters tracker
+    (counts may be too high by at most epsilon * total). `counts` only
+    holds the top words, since the full vocabulary is never stored.
+    """
+    distinct = HyperLogLog(error_rate)
+    heavy = HeavyHitters(top_k, epsilon)
+    total = 0
+    for line in lines:
+        for word in line.lower().split():
+            total += 1
+            distinct.add(word)
+            heavy.add(word)
+    unique = min(distinct.count(), total)
+    top = heavy.items()
+    return WordStats(
+        total=total,
+        unique=unique,
+        duplicates=total - unique,
+        top=top,
+        counts=Counter(dict(top)),
+    )
+
+
+# Bytes per map task when counting words in files
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Bytes lowercased and tokenized at a time by the mmap tokenizer
+DEFAULT_WINDOW_SIZE = 4 * 1024 * 1024
+
+_ASCII_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+_TOKEN = re.compile(rb"\S+")
+_WHITESPACE = re.compile(rb"\s")
+# Bytes that str.lower().split() may treat differently from the ASCII
+# tokenizer: non-ASCII text, and the separators \x1c-\x1f
+_NEEDS_STR = re.compile(rb"[\x1c-\x1f\x80-\xff]")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def iter_files(paths: Iterable[PathLike]) -> Iterator[str]:
+    """Yield every file in `paths`, walking directories recursively in sorted order."""
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def chunk_offsets(path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split a file into (start, end) byte ranges that end on a newline.
+
+    Every range except possibly the last ends right after a b"\\n", so no
+    word is cut in half and each range can be counted independently.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    size = os.path.getsize(path)
+    offsets = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()  # move to the end of the current line
+            end = min(f.tell(), size)
+            offsets.append((start, end))
+            start = end
+    return offsets
+
+
+def count_chunk(path: PathLike, start: int, end: int) -> Counter:
+    """Map step: count the words in bytes [start, end) of a file."""
+    return count_words_mmap(path, start, end)
+
+
+def count_tokens(
+    buffer, start: int = 0, end: Optional[int] = None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> Counter:
+    """Count lowercased byte tokens in buffer[start:end] without making a str.
+
+    `buffer` can be bytes, a memoryview or an mmap. It is processed one
+    window at a time: each window is cut at a whitespace byte, lowercased
+    with a bytes.translate table and split with a compiled bytes regex, so
+    peak memory is about one window however large the buffer is. A window
+    with non-ASCII bytes is decoded and split with str.lower().split()
+    instead, so the tokens always match word_stats. Keys of the result are
+    UTF-8 bytes.
+    """
+    if window_size < 1:
+        raise ValueError("window_size must be positive")
+    end = len(buffer) if end is None else end
+    counts: Counter = Counter()
+    position = start
+    while position < end:
+        stop = min(position + window_size, end)
+        if stop < end:
+            # Move the cut forward to whitespace so no token is split in two
+            match = _WHITESPACE.search(buffer, stop, end)
+            stop = match.start() if match else end
+        window = bytes(buffer[position:stop])
+        if _NEEDS_STR.search(window):
+            words = Counter(window.decode("utf-8", errors="replace").lower().split())
+            for word, count in words.items():
+                counts[word.encode("utf-8")] += count
+        else:
+            counts.update(_TOKEN.findall(window.translate(_ASCII_LOWER)))
+        position = stop
+    return counts
+
+
+def decode_counts(counts: Counter) -> Counter:
+    """Decode the bytes keys of a token Counter to str (only unique tokens are decoded)."""
+    decoded: Counter = Counter()
+    for token, count in counts.items():
+        decoded[token.decode("utf-8", errors="replace")] += count
+    return decoded
+
+
+def count_words_mmap(
+    path: PathLike, start: int = 0, end: Optional[int] = None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> Counter:
+    """Count words in bytes [start, end) of a file through a memory map.
+
+    ASCII text is never read into a Python str; only the distinct words
+    are decoded at the end. Windows with other characters fall back to
+    str.lower().split(), so the counts always match word_stats.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return Counter()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            counts = count_tokens(mapped, start, end, window_size)
+    return decode_counts(counts)
+
+
+def merge_counters(counters: list[Counter]) -> Counter:
+    """Reduce step: merge counters pairwise in a balanced tree.
+
+    Merging neighbours level by level keeps both sides of every merge about
+    the same size, instead of folding everything into one growing Counter.
+    """
+    if not counters:
+        return Counter()
+    while len(counters) > 1:
+        merged = []
+        for i in range(0, len(counters) - 1, 2):
+            left, right = counters[i], counters[i + 1]
+            if len(left) < len(right):
+                left, right = right, left
+            left.update(right)
+            merged.append(left)
+        if len(counters) % 2:
+            merged.append(counters[-1])
+        counters = merged
+    return counters[0]
+
+
+def _count_task(task: tuple[str, int, int]) -> Counter:
+    return count_chunk(*task)
+
+
+def count_words_in_files(
+    paths: Iterable[PathLike],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Counter:
+    """Count words across files and directories with a map-reduce pipeline.
+
+    Files are split at newline-aligned byte offsets, each chunk is counted
+    in a ProcessPoolExecutor (workers=None uses every CPU core), and the
+    per-chunk counters are merged in a tree reduction. workers=1 runs
+    everything in this process.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    tasks = [
+        (path, start, end)
+        for path in iter_files(paths)
+        for start, end in chunk_offsets(path, chunk_size)
+    ]
+    if workers == 1 or len(tasks) <= 1:
+        return merge_counters([_count_task(task) for task in tasks])
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge_counters(list(pool.map(_count_task, tasks)))
+
+
+def word_stats_files(
+    paths: Iterable[PathLike],
+    workers: Optional[int] = None,
+    top_k: int = 10,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> WordStats:
+    """Return word statistics for files and directories, counted in parallel."""
+    return stats_from_counts(count_words_in_files(paths, workers, chunk_size), top_k)
@@ -0,0 +1,154 @@
+"""
+Unit tests for combinatorics.py module
+=======================================
+Tests the fast factorial engine.
+"""
+
+import math
+import pytest
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from combinatorics import (
+    product_tree, range_product, factorial, factorial_mod, FactorialTable,
+    binomial, permutations, cached_factorial,
+)
+from loops import factorial_naive
+
+
+class TestProducts:
+    """Tests for product_tree and range_product."""
+    
+    def test_product_tree(self):
+        """Test against math.prod."""
+        values = list(range(1, 200, 3))
+        assert product_tree(values) == math.prod(values)
+        assert product_tree([]) == 1
+    
+    def test_range_product(self):
+        """Test against math.prod over a range."""
+        assert range_product(5, 500) == math.prod(range(5, 500))
+        assert range_product(7, 7) == 1
+
+
+class TestFactorial:
+    """Tests for the prime-swing factorial."""
+    
+    def test_small_values(self):
+        """Test every value up to 300 against math.factorial."""
+        for n in range(0, 300):
+            assert factorial(n) == math.factorial(n)
+    
+    @pytest.mark.parametrize("n", [1000, 4097, 20_011])
+    def test_large_values(self, n):
+        """Test large values against math.factorial."""
+        assert factorial(n) == math.factorial(n)
+    
+    def test_matches_loop(self):
+        """Test against the simple loop version."""
+        assert factorial(777) == factorial_naive(777)
+    
+    def test_negative(self):
+        """Test that negative values are rejected."""
+        with pytest.raises(ValueError):
+            factorial(-1)
+
+
+class TestFactorialMod:
+    """Tests for factorial_mod."""
+    
+    @pytest.mark.parametrize("m", [1, 2, 7, 97, 1000, 1_000_003, 2 ** 61 - 1])
+    def test_matches_full_factorial(self, m):
+        """Test against math.factorial(n) % m."""
+        for n in range(0, 400, 13):
+            assert factorial_mod(n, m) == math.factorial(n) % m
+    
+    def test_n_at_least_m_is_zero(self):
+        """Test that n >= m gives 0."""
+        assert factorial_mod(10 ** 9, 10 ** 6) == 0
+    
+    def test_invalid_arguments(self):
+        """Test negative n and non-positive m."""
+        with pytest.raises(ValueError):
+            factorial_mod(-1, 7)
+        with pytest.raises(ValueError):
+            factorial_mod(5, 0)
+
+
+class TestFactorialTable:
+    """Tests for the memoized FactorialTable."""
+    
+    def test_values_match_math(self):
+        """Test cached and extended values against math.factorial."""
+        table = FactorialTable()
+        for n in [900, 1000, 950, 30, 5000, 1000]:
+            assert table.factorial(n) == math.factorial(n)
+    
+    def test_hit_and_miss_counters(self):
+        """Test that repeated lookups are counted as hits."""
+        table = FactorialTable()
+        table.factorial(900)
+        table.factorial(1000)
+        table.factorial(1000)
+        info = table.cache_info()
+        assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+    
+    def test_small_values_bypass_cache(self):
+        """Test that 0! .. 20! come from the constant table."""
+        table = FactorialTable()
+        assert table.factorial(20) == math.factorial(20)
+        assert table.cache_info().misses == 0
+    
+    def test_entry_limit_evicts_least_recently_used(self):
+        """Test LRU eviction by entry count."""
+        table = FactorialTable(max_entries=2)
+        table.factorial(100)
+        table.factorial(200)
+        table.factorial(100)  # 100 is now the most recently used
+        table.factorial(1000)  # too far from 200 to extend it
+        assert len(table) == 2
+        assert table.cache_info().evictions == 1
+        table.factorial(100)
+        assert table.cache_info().hits == 2  # 100 survived, 200 was evicted
+    
+    def test_bit_limit(self):
+        """Test that the bit budget is respected."""
+        table = FactorialTable(max_bits=20_000)
+        for n in range(100, 2000, 100):
+            table.factorial(n)
+        assert table.cache_info().bits <= 20_000
+        table.factorial(10_000)  # larger than the whole budget: not cached
+        assert 10_000 not in table._cache
+    
+    def test_binomial_and_permutations(self):
+        """Test binomial and permutations against math."""
+        table = FactorialTable()
+        for n in range(0, 60, 7):
+            for k in range(0, n + 3):
+                assert table.binomial(n, k) == math.comb(n, k)
+                assert table.permutations(n, k) == math.perm(n, k)
+    
+    def test_invalid_arguments(self):
+        """Test negative arguments."""
+        table = FactorialTable()
+        with pytest.raises(ValueError):
+            table.binomial(-1, 2)
+        with pytest.raises(ValueError):
+            table.permutations(5, -1)
+        with pytest.raises(ValueError):
+            FactorialTable(max_entries=0)
+    
+    def test_shared_table_helpers(self):
+        """Test the module-level helpers."""
+        assert cached_factorial(50) == math.factorial(50)
+        assert binomial(52, 5) == 2_598_960
+        assert permutations(10, 3) == 720
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Unit tests for control_flow.py module
+======================================
+Tests the grade, weather and number helpers, the bisect classifier and
+the batch number classifier.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from control_flow import (
+    get_grade, get_grade_naive, classify, classify_many,
+    weather_advice, check_number, classify_numbers, iter_classify_numbers,
+    classify_numbers_file, NumberClasses, BUCKET_OUTSIDE,
+)
+
+NUMBERS = [*range(-15, 120), 10 ** 30, -(10 ** 30)]
+
+
+def assert_matches_check_number(numbers, classes):
+    """Check each classification against the messages of check_number."""
+    assert len(classes) == len(numbers)
+    for i, number in enumerate(numbers):
+        sign, parity, bucket = classes.describe(i)
+        assert check_number(number) == [
+            f"{number} is {sign}", f"{number} is {parity}", f"{number} is {bucket}",
+        ]
+
+
+class TestClassify:
+    """Tests for threshold classification."""
+    
+    def test_matches_if_chain(self):
+        """Test that bisect grading agrees with the if/elif chain."""
+        for score in [*range(-10, 111), 59.9, 60.0, 89.99, 90.5]:
+            assert classify(score) == get_grade_naive(score)
+            assert get_grade(score) == get_grade_naive(score)
+    
+    def test_boundaries(self):
+        """Test that a threshold score gets the higher grade."""
+        assert [get_grade(s) for s in (59, 60, 79, 80, 90)] == ["F", "D", "C", "B", "A"]
+    
+    def test_custom_thresholds(self):
+        """Test a different threshold table and default."""
+        levels = ((0, "cold"), (15, "mild"), (25, "hot"))
+        assert classify(-4, levels, default="freezing") == "freezing"
+        assert classify(15, levels) == "mild"
+        assert classify_many([3, 30], levels) == ["cold", "hot"]
+    
+    def test_list_thresholds(self):
+        """Test thresholds given as lists instead of tuples."""
+        assert classify(85, [(60, "D"), (90, "A")]) == "D"
+        assert classify(95, [[60, "D"], [90, "A"]]) == "A"
+        assert classify_many([50, 95], [[60, "D"], [90, "A"]]) == ["F", "A"]
+    
+    def test_unsorted_thresholds(self):
+        """Test that thresholds must be in ascending order."""
+        with pytest.raises(ValueError):
+            classify(50, ((90, "A"), (60, "D")))
+    
+    def test_classify_many(self):
+        """Test table lookups mixed with out-of-table scores."""
+        scores = [95, 72, 58, 59.5, -3, 150, 100, 80.0]
+        assert classify_many(scores) == [get_grade_naive(s) for s in scores]
+        assert classify_many(iter(scores)) == classify_many(scores)
+        assert classify_many([]) == []
+    
+    def test_classify_many_numpy(self):
+        """Test the numpy.searchsorted path."""
+        np = pytest.importorskip("numpy")
+        scores = np.array([95, 72, 58, 59.5, -3, 150, 100, 80.0])
+        assert list(classify_many(scores)) == [get_grade_naive(s) for s in scores.tolist()]
+
+
+class TestHelpers:
+    """Tests for the weather and number helpers."""
+    
+    def test_weather_advice(self):
+        """Test each branch of the weather advice."""
+        assert weather_advice(35, True) == ["It's hot outside!", "But it's raining, take an umbrella."]
+        assert weather_advice(25, False) == ["The weather is pleasant."]
+        assert weather_advice(5, True) == ["It's cold outside!"]
+    
+    def test_check_number(self):
+        """Test sign, parity and range messages."""
+        assert check_number(7) == ["7 is positive", "7 is odd", "7 is between 1 and 10"]
+        assert check_number(0)[0] == "0 is zero"
+        assert check_number(-4)[1:] == ["-4 is even", "-4 is outside the range 1-100"]
+
+
+
+class TestClassifyNumbers:
+    """Tests for the batch number classifier."""
+    
+    def test_matches_check_number(self):
+        """Test that every column agrees with check_number."""
+        classes = classify_numbers(NUMBERS, chunk_size=16)
+        assert_matches_check_number(NUMBERS, classes)
+        assert classes.sign.typecode == "b" and classes.bucket.typecode == "B"
+    
+    def test_chunks(self):
+        """Test that a generator is split into chunks of chunk_size."""
+        chunks = list(iter_classify_numbers((n for n in range(10)), chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        with pytest.raises(ValueError):
+            list(iter_classify_numbers([1], chunk_size=0))
+    
+    def test_empty(self):
+        """Test an empty input."""
+        classes = classify_numbers([])
+        assert isinstance(classes, NumberClasses) and len(classes) == 0
+    
+    def test_file_streaming(self, tmp_path):
+        """Test reading newline-delimited integers chunk by chunk."""
+        path = tmp_path / "numbers.txt"
+        path.write_text("".join(f"{n}\n" for n in NUMBERS) + "\n")
+        chunks = list(classify_numbers_file(path, chunk_size=50))
+        assert len(chunks) == 3
+        merged = [value for chunk in chunks for value in chunk.bucket]
+        assert merged == list(classify_numbers(NUMBERS).bucket)
+        assert merged[-1] == BUCKET_OUTSIDE
+    
+    def test_numpy(self):
+        """Test the vectorized path for NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        numbers = list(range(-15, 120))
+        classes = classify_numbers(np.array(numbers), chunk_size=16)
+        assert isinstance(classes.sign, np.ndarray)
+        assert_matches_check_number(numbers, classes)
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,177 @@
+"""
+Unit tests for expressions.py module
+=====================================
+Tests the tokenizer, the parser and its bytecode, the expression cache,
+batch evaluation over columns and the calculator built on top of them.
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from expressions import (
+    CONST, Expression, compile_expression, evaluate, evaluate_batch, tokenize,
+)
+from functions import calculator, calculator_naive
+from inputs import ScriptedInput
+
+SOURCES = [
+    "1 + 2 * 3", "(1 + 2) * 3", "2 ** 3 ** 2", "-2 ** 2", "2 ** -1",
+    "7 // 2 - 7 % 3", "-(3 - 5) * +4", "1.5e2 / .5", "10 - 4 - 3", "2 * -x + y ** 2",
+    "(x - y) / (x + y)", "x * x - 2 * x * y + y * y", "--x",
+]
+
+
+class TestParser:
+    """Tests for tokenizing and parsing."""
+    
+    def test_tokens(self):
+        """Test token kinds, text and positions."""
+        tokens = tokenize(" 12.5*(x_1 ** 2)")
+        assert [(t.kind, t.text) for t in tokens] == [
+            ("number", "12.5"), ("op", "*"), ("op", "("), ("name", "x_1"),
+            ("op", "**"), ("number", "2"), ("op", ")"), ("end", ""),
+        ]
+        assert tokens[0].position == 1
+        assert tokens[3].position == 7
+    
+    def test_matches_python(self):
+        """Test precedence, associativity and unary minus against eval()."""
+        for source in SOURCES:
+            values = {"x": 3, "y": -1.5}
+            assert evaluate(source, values) == eval(source, {}, values), source
+    
+    def test_random_expressions(self):
+        """Test randomly generated expressions against eval()."""
+        rng = random.Random(7)
+    
+        def generate(depth):
+            if depth == 0 or rng.random() < 0.3:
+                return rng.choice(["x", "y", str(rng.randint(1, 9))])
+            if rng.random() < 0.2:
+                return f"-{generate(depth - 1)}"
+            op = rng.choice(["+", "-", "*"])
+            return f"({generate(depth - 1)} {op} {generate(depth - 1)})"
+    
+        for _ in range(300):
+            source = generate(5)
+            assert evaluate(source, x=2, y=-3) == eval(source, {}, {"x": 2, "y": -3})
+    
+    def test_constant_folding(self):
+        """Test that constant subexpressions compile to one constant."""
+        assert Expression("2 * (3 + 4) - -1").code == ((CONST, 15),)
+        assert len(Expression("x * (60 * 60)").code) == 3
+        with pytest.raises(ZeroDivisionError):
+            evaluate("1 / (2 - 2)")
+    
+    def test_huge_constants_not_folded(self):
+        """Test that huge powers and products are left for evaluation."""
+        assert len(Expression("9 ** 9 ** 9").code) == 3
+        assert len(Expression("(10 ** 30) * (10 ** 30)").code) == 3
+        assert Expression("3 ** 40").code == ((CONST, 3 ** 40),)
+        with pytest.raises(OverflowError):
+            compile_expression("9 ** 9 ** 9").evaluate_bounded()
+        assert compile_expression("x ** 3").evaluate_bounded({"x": 5}) == 125
+    
+    def test_bounded_power_estimate(self):
+        """Test that small bases and results just under the limit are allowed."""
+        for source in ("1 ** 100000", "(-1) ** 100001", "0 ** 100000"):
+            assert compile_expression(source).evaluate_bounded() == eval(source)
+        assert Expression("2 ** 100").code == ((CONST, 2 ** 100),)
+        assert compile_expression("3 ** 40000").evaluate_bounded() == 3 ** 40000
+        assert compile_expression("2 ** 65535").evaluate_bounded() == 2 ** 65535
+        with pytest.raises(OverflowError):
+            compile_expression("2 ** 65536").evaluate_bounded()
+    
+    def test_names(self):
+        """Test that variable names are listed once, in order of use."""
+        assert Expression("b * a + b").names == ("b", "a")
+        with pytest.raises(KeyError):
+            evaluate("a + 1")
+    
+    @pytest.mark.parametrize("source", ["", "   ", "1 +", "(1 + 2", "1 2", "3 $ 4", "* 2", "()"])
+    def test_syntax_errors(self, source):
+        """Test that malformed expressions raise ValueError."""
+        with pytest.raises(ValueError):
+            Expression(source)
+    
+    def test_error_position(self):
+        """Test that errors point at the offending character."""
+        with pytest.raises(ValueError, match="position 4"):
+            Expression("1 + $")
+    
+    def test_deep_nesting(self):
+        """Test that very deep parentheses give ValueError, not RecursionError."""
+        assert evaluate("(" * 50 + "1" + ")" * 50) == 1
+        with pytest.raises(ValueError):
+            Expression("(" * 100000 + "1" + ")" * 100000)
+
+
+class TestCache:
+    """Tests for compile_expression."""
+    
+    def test_same_source_reused(self):
+        """Test that a repeated source returns the cached Expression."""
+        first = compile_expression("x + 41")
+        assert compile_expression("x + 41") is first
+        assert compile_expression.cache_info().hits >= 1
+
+
+class TestBatch:
+    """Tests for column-wise evaluation."""
+    
+    def test_matches_row_by_row(self):
+        """Test batch results against evaluating each row."""
+        rng = random.Random(3)
+        xs = [rng.uniform(-5, 5) for _ in range(200)]
+        ys = [rng.randint(1, 9) for _ in range(200)]
+        for source in SOURCES:
+            expression = compile_expression(source)
+            expected = [expression.evaluate(x=x, y=y) for x, y in zip(xs, ys)]
+            assert expression.evaluate_batch({"x": xs, "y": ys}) == expected
+    
+    def test_generators_and_constants(self):
+        """Test iterator columns and expressions without variables."""
+        assert evaluate_batch("x ** 2", {"x": iter(range(4))}) == [0, 1, 4, 9]
+        assert evaluate_batch("2 + 3", {"x": [1, 2]}) == [5, 5]
+        assert evaluate_batch("x", {"x": []}) == []
+    
+    def test_numpy_columns(self):
+        """Test evaluating over NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        x = np.arange(5.0)
+        result = evaluate_batch("-x ** 2 + 2 * y", {"x": x, "y": [1, 1, 1, 1, 1]})
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [2.0, 1.0, -2.0, -7.0, -14.0]
+
+
+class TestCalculator:
+    """Tests for the calculator in functions.py."""
+    
+    @pytest.mark.parametrize("answer, expected", [
+        ("2 * (3 + 4)", "Result: 2 * (3 + 4) = 14"),
+        ("7 / 2", "Result: 7 / 2 = 3.5"),
+        ("1 / 0", "Error: Division by zero!"),
+        ("2 +", "Error: Invalid expression"),
+        ("x + 1", "Error: Unknown name 'x'!"),
+        ("9 ** 9 ** 9", "Error: Invalid expression (integer result too large)!"),
+        ("1 ** 100000", "Result: 1 ** 100000 = 1"),
+    ])
+    def test_expressions(self, capsys, answer, expected):
+        """Test results and error messages."""
+        calculator(ScriptedInput([answer]))
+        assert expected in capsys.readouterr().out
+    
+    def test_naive_calculator(self, capsys):
+        """Test the original one-operation calculator."""
+        calculator_naive(ScriptedInput(["6", "*", "7"]))
+        assert "Result: 6.0 * 7.0 = 42.0" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,179 @@
+"""
+Unit tests for geometry.py module
+==================================
+Tests the batched distance functions on array('d') and NumPy points and
+the KD-tree point index.
+"""
+
+import pytest
+import random
+import sys
+from array import array
+from math import inf, isclose
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from geometry import (
+    distance, points_array, pairwise_distances, distances_from,
+    iter_distance_blocks, min_distances, PointIndex,
+)
+
+POINTS = [(0, 0), (3, 4), (6, 8), (-1, 2), (10, -5)]
+
+
+def brute_force_nearest(points):
+    return [min(distance(p, q) for j, q in enumerate(points) if j != i) for i, p in enumerate(points)]
+
+
+class TestDistance:
+    """Tests for the two-point distance and packing."""
+
+    def test_distance(self):
+        """Test a 3-4-5 triangle."""
+        assert distance((10, 20), (13, 24)) == 5.0
+
+    def test_points_array(self):
+        """Test packing tuples into an interleaved array."""
+        assert points_array([(1, 2), (3, 4)]) == array("d", [1, 2, 3, 4])
+        packed = array("d", [1, 2])
+        assert points_array(packed) is packed
+        with pytest.raises(ValueError):
+            points_array(array("d", [1, 2, 3]))
+
+
+class TestBatchedDistances:
+    """Tests for pairwise, one-to-many and blocked distances."""
+
+    def test_pairwise_distances(self):
+        """Test row-by-row distances."""
+        result = pairwise_distances(POINTS, list(reversed(POINTS)))
+        expected = [distance(p, q) for p, q in zip(POINTS, reversed(POINTS))]
+        assert list(result) == pytest.approx(expected)
+        with pytest.raises(ValueError):
+            pairwise_distances(POINTS, POINTS[:2])
+
+    def test_distances_from(self):
+        """Test one point against many."""
+        result = distances_from((0, 0), POINTS)
+        assert isinstance(result, array)
+        assert list(result) == pytest.approx([distance((0, 0), p) for p in POINTS])
+
+    def test_blocks_cover_matrix(self):
+        """Test that the tiles together form the full distance matrix."""
+        matrix = {}
+        for row, column, block in iter_distance_blocks(POINTS, block_size=2):
+            for i, distances in enumerate(block):
+                for j, value in enumerate(distances):
+                    matrix[row + i, column + j] = value
+        assert len(matrix) == len(POINTS) ** 2
+        for (i, j), value in matrix.items():
+            assert isclose(value, distance(POINTS[i], POINTS[j]))
+
+    def test_invalid_block_size(self):
+        """Test that the block size must be positive."""
+        with pytest.raises(ValueError):
+            next(iter_distance_blocks(POINTS, block_size=0))
+
+    def test_min_distances_self(self):
+        """Test nearest-other-point distances across block boundaries."""
+        for block_size in (1, 2, 3, 100):
+            result = min_distances(POINTS, block_size=block_size)
+            assert list(result) == pytest.approx(brute_force_nearest(POINTS))
+
+    def test_min_distances_other_set(self):
+        """Test nearest distances to a second set of points."""
+        assert list(min_distances([(0, 0), (5, 5)], [(1, 0), (5, 7)])) == [1.0, 2.0]
+        assert list(min_distances([(0, 0)], [])) == [inf]
+
+    def test_numpy_matches_fallback(self):
+        """Test that NumPy arrays give the same results."""
+        np = pytest.importorskip("numpy")
+        points = np.array(POINTS, dtype=float)
+        assert isinstance(distances_from((0, 0), points), np.ndarray)
+        assert list(pairwise_distances(points, points[::-1])) == pytest.approx(
+            list(pairwise_distances(POINTS, list(reversed(POINTS)))))
+        assert list(min_distances(points, block_size=2)) == pytest.approx(brute_force_nearest(POINTS))
+
+
+@pytest.fixture(scope="module")
+def grid_points():
+    """Integer points with many ties and repeated coordinates."""
+    rng = random.Random(7)
+    return {(rng.randint(0, 40), rng.randint(0, 40)): i for i in range(2000)}
+
+
+class TestPointIndex:
+    """Tests for the KD-tree point index."""
+
+    def test_dict_interface(self, grid_points):
+        """Test that lookups behave like the dict the index was built from."""
+        index = PointIndex(grid_points, leaf_size=4)
+        assert len(index) == len(grid_points)
+        assert set(index) == set(grid_points)
+        assert all(index[point] == value for point, value in grid_points.items())
+        assert (100, 100) not in index
+        with pytest.raises(KeyError):
+            index[(100, 100)]
+
+    def test_repeated_points_keep_last_value(self):
+        """Test that bulk loading keeps the last value of a repeated point."""
+        index = PointIndex([((1, 1), "a"), ((2, 2), "b"), ((1, 1), "c")])
+        assert len(index) == 2
+        assert index[(1, 1)] == "c"
+
+    def test_nearest_matches_brute_force(self, grid_points):
+        """Test k-nearest queries against sorting every distance."""
+        index = PointIndex(grid_points, leaf_size=4)
+        rng = random.Random(3)
+        for _ in range(50):
+            query = (rng.uniform(-5, 45), rng.uniform(-5, 45))
+            expected = sorted(distance(query, point) for point in grid_points)[:5]
+            found = index.nearest(query, 5)
+            assert [d for d, _, _ in found] == pytest.approx(expected)
+            assert all(grid_points[point] == value for _, point, value in found)
+
+    def test_within_matches_brute_force(self, grid_points):
+        """Test radius queries against a full scan."""
+        index = PointIndex(grid_points, leaf_size=4)
+        for query in [(0, 0), (20.5, 19.5), (40, 3)]:
+            expected = sorted(p for p in grid_points if distance(query, p) <= 3.5)
+            assert sorted(point for _, point, _ in index.within(query, 3.5)) == expected
+
+    def test_inserts_and_deletes(self, grid_points):
+        """Test updates through the pending buffer and rebuilds."""
+        index = PointIndex(grid_points)
+        expected = dict(grid_points)
+        rng = random.Random(5)
+        for i in range(1000):
+            point = (rng.uniform(0, 40), rng.uniform(0, 40))
+            index[point] = expected[point] = -i
+        for point in list(expected)[::3]:
+            del index[point]
+            del expected[point]
+        assert len(index) == len(expected)
+        assert set(index) == set(expected)
+        nearest = index.nearest((10, 10), 3)
+        assert [d for d, _, _ in nearest] == pytest.approx(
+            sorted(distance((10, 10), point) for point in expected)[:3])
+        index.rebuild()
+        assert dict(index.items()) == expected
+
+    def test_empty_and_invalid(self):
+        """Test queries on an empty index and invalid arguments."""
+        index = PointIndex()
+        assert index.nearest((0, 0)) == []
+        assert index.within((0, 0), 1) == []
+        with pytest.raises(ValueError):
+            index.nearest((0, 0), k=0)
+        with pytest.raises(ValueError):
+            index.within((0, 0), -1)
+        with pytest.raises(ValueError):
+            PointIndex(leaf_size=0)
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+"""
+Import-time tests for the exercises modules
+============================================
+Every module in exercises/ must be safe to import as a library: no demo
+output, no input() calls and a small import-time cost.
+"""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+exercises_path = Path(__file__).parent.parent / "exercises"
+
+MODULES = sorted(
+    path.stem for path in exercises_path.glob("*.py") if not path.stem.startswith("__")
+)
+
+# Generous budget so slow CI machines do not fail; a module that runs its
+# demos at import time takes far longer than this.
+IMPORT_TIME_BUDGET_US = 150_000
+
+
+def import_module(name: str) -> subprocess.CompletedProcess:
+    """Import a module in a fresh interpreter with -X importtime and no stdin."""
+    code = f"import sys; sys.path.insert(0, {str(exercises_path)!r}); import {name}"
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdin=subprocess.DEVNULL,  # input() raises EOFError instead of blocking
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def cumulative_import_time(stderr: str, name: str) -> int:
+    """Return the cumulative import time in microseconds for a module."""
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == name:
+            return int(line.split("|")[1])
+    raise AssertionError(f"no import time reported for {name}")
+
+
+@pytest.mark.parametrize("name", MODULES)
+class TestImportSafety:
+    """Tests that importing a module has no side effects."""
+    
+    def test_import_does_not_read_stdin_or_fail(self, name):
+        """Test that the import succeeds without any input."""
+        result = import_module(name)
+        assert result.returncode == 0, result.stderr[-500:]
+    
+    def test_import_prints_nothing(self, name):
+        """Test that no demo output is printed on import."""
+        assert import_module(name).stdout == ""
+    
+    def test_import_time_budget(self, name):
+        """Test that the import stays within the time budget."""
+        result = import_module(name)
+        elapsed = cumulative_import_time(result.stderr, name)
+        assert elapsed < IMPORT_TIME_BUDGET_US, f"{name} took {elapsed} us to import"
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
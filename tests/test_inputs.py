@@ -0,0 +1,135 @@
+"""
+Unit tests for inputs.py module
+================================
+Tests the input providers and the concurrent scripted-session runner,
+driving the interactive examples without a keyboard.
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from inputs import AsyncStreamInput, ScriptedInput, run_sessions, run_sessions_async
+from control_flow import number_checker
+from functions import calculator
+from lists import interactive_example as shopping_list
+import tuples
+import variables
+
+
+class TestScriptedInput:
+    """Tests for ScriptedInput."""
+    
+    def test_answers_in_order(self):
+        """Test that answers are returned in order and recorded."""
+        ask = ScriptedInput(["a", "b"])
+        assert ask("first? ") == "a"
+        assert ask("second? ") == "b"
+        assert ask.transcript == [("first? ", "a"), ("second? ", "b")]
+    
+    def test_eof_when_exhausted(self):
+        """Test that running out of answers raises EOFError like input()."""
+        ask = ScriptedInput(["only"])
+        ask()
+        with pytest.raises(EOFError):
+            ask("again? ")
+    
+    def test_from_file(self, tmp_path):
+        """Test replaying answers from a file, one per line."""
+        path = tmp_path / "answers.txt"
+        path.write_text("milk\nbread\ndone\n")
+        assert shopping_list(ScriptedInput.from_file(path)) == ["milk", "bread"]
+    
+    def test_drives_demo_directly(self, capsys):
+        """Test passing a ScriptedInput straight to an interactive example."""
+        number_checker(ScriptedInput(["7"]))
+        assert "7 is positive" in capsys.readouterr().out
+
+
+class TestRunSessions:
+    """Tests for run_sessions."""
+    
+    def test_results_in_script_order(self):
+        """Test that each session's output is captured separately."""
+        results = run_sessions(number_checker, [["7"], ["-4"], ["oops"]], concurrency=2)
+        assert "7 is odd" in results[0].output
+        assert "-4 is negative" in results[1].output
+        assert "-4 is even" in results[1].output
+        assert "valid integer" in results[2].output
+        assert "7 is" not in results[1].output
+        assert all(result.error is None and result.seconds >= 0 for result in results)
+    
+    def test_many_concurrent_sessions(self):
+        """Test thousands of sessions in one process."""
+        scripts = [[f"{n} + 1"] for n in range(2000)]
+        results = run_sessions(calculator, scripts, concurrency=50)
+        assert len(results) == 2000
+        assert "1999 + 1 = 2000" in results[-1].output
+        assert all("Result:" in result.output for result in results)
+    
+    def test_return_values(self):
+        """Test that the session's return value is kept."""
+        results = run_sessions(shopping_list, [["eggs", "done"], ["done"]])
+        assert [result.value for result in results] == [["eggs"], []]
+    
+    def test_errors_are_recorded(self):
+        """Test that a session that runs out of answers reports the error."""
+        result, = run_sessions(shopping_list, [["eggs"]])
+        assert isinstance(result.error, EOFError)
+        assert "Added 'eggs'" in result.output
+    
+    def test_whole_demos(self):
+        """Test running full demos, including their y/n prompts."""
+        results = run_sessions(tuples.main, [["n"], ["y", "to be or not to be"]])
+        assert "Tutorial completed" in results[0].output
+        assert "UNIQUE WORD COUNTER" not in results[0].output
+        assert "'be': 2 time(s)" in results[1].output
+        result, = run_sessions(variables.demonstrate_user_input, [["Ada", "36"]])
+        assert result.value == 36
+    
+    def test_stdout_restored(self, capsys):
+        """Test that printing works normally after the sessions finish."""
+        run_sessions(number_checker, [["1"]])
+        print("after")
+        assert capsys.readouterr().out == "after\n"
+    
+    def test_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            run_sessions(number_checker, [["1"]], concurrency=0)
+
+
+class TestAsyncStreamInput:
+    """Tests for AsyncStreamInput."""
+    
+    def test_reads_lines_from_stream(self):
+        """Test answering prompts from lines fed to a StreamReader."""
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"12 + 30\r\n")
+            reader.feed_eof()
+            return await run_sessions_async(calculator, [AsyncStreamInput(reader, loop)])
+    
+        result, = asyncio.run(scenario())
+        assert "12 + 30 = 42" in result.output
+    
+    def test_eof_raises(self):
+        """Test that a closed stream raises EOFError."""
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_eof()
+            ask = AsyncStreamInput(reader, asyncio.get_running_loop(), timeout=5)
+            return await asyncio.to_thread(ask, "name? ")
+    
+        with pytest.raises(EOFError):
+            asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
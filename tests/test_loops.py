@@ -12,7 +12,8 @@ from pathlib import Path
 exercises_path = Path(__file__).parent.parent / "exercises"
 sys.path.insert(0, str(exercises_path))
 
-from loops import sum_numbers, factorial, find_prime_numbers
+from loops import sum_numbers, sum_numbers_naive, factorial, find_prime_numbers
+import loops
 
 
 class TestSumNumbers:
@@ -34,6 +35,15 @@ class TestSumNumbers:
     def test_sum_large_number(self):
         """Test sum with larger number."""
         assert sum_numbers(100) == 5050
+    
+    def test_sum_huge_number(self):
+        """Test that very large n is fast and exact."""
+        assert sum_numbers(10 ** 9) == 500000000500000000
+    
+    def test_sum_matches_naive_loop(self):
+        """Test the closed form against the loop version."""
+        for n in range(-3, 50):
+            assert sum_numbers(n) == sum_numbers_naive(n)
 
 
 class TestFactorial:
@@ -87,6 +97,23 @@ class TestFindPrimeNumbers:
         """Test that correct number of primes are found."""
         primes = find_prime_numbers(100)
         assert len(primes) == 25  # There are 25 primes up to 100
+    
+    def test_array_output(self):
+        """Test the compact array output format."""
+        primes = find_prime_numbers(100, output="array")
+        assert primes.typecode == "I"
+        assert list(primes) == find_prime_numbers(100)
+    
+    def test_bitset_output(self):
+        """Test the bitset output format."""
+        primes = find_prime_numbers(100, output="bitset")
+        assert len(primes) == 25
+        assert list(primes) == find_prime_numbers(100)
+    
+    def test_unknown_output(self):
+        """Test that an unknown output format is rejected."""
+        with pytest.raises(ValueError):
+            find_prime_numbers(100, output="set")
 
 
 class TestLoopConcepts:
@@ -120,6 +147,18 @@ class TestLoopConcepts:
             assert len(divisors) == 0, f"{prime} is not prime!"
 
 
+class TestEngineExports:
+    """Tests for the engine functions loops.py exposes."""
+    
+    def test_all_names_exist(self):
+        """Test that every name in __all__ can be imported from loops."""
+        assert all(hasattr(loops, name) for name in loops.__all__)
+    
+    def test_iter_primes(self):
+        """Test the lazy prime generator next to find_prime_numbers."""
+        assert list(loops.iter_primes(10, 30)) == [11, 13, 17, 19, 23, 29]
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Unit tests for the exercises package facade
+============================================
+Tests the lazy, package-level API in exercises/__init__.py.
+"""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+import exercises
+from exercises.__main__ import main as cli_main
+
+project_root = Path(__file__).parent.parent
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the project root."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class TestLazyImports:
+    """Tests that submodules are imported only when needed."""
+    
+    def test_package_import_loads_no_submodules(self):
+        """Test that importing the package imports nothing else."""
+        result = run_python(
+            "import sys, exercises\n"
+            "print(sorted(m for m in sys.modules if m.startswith('exercises.')))"
+        )
+        assert result.stdout.strip() == "[]", result.stderr
+    
+    def test_name_loads_only_its_submodule(self):
+        """Test that using one name imports only its module and the helpers it needs."""
+        result = run_python(
+            "import sys, exercises\n"
+            "exercises.get_grade(95)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('exercises.')))"
+        )
+        assert result.stdout.strip() == "['exercises._optional', 'exercises.control_flow']", result.stderr
+
+
+class TestPackageApi:
+    """Tests for the names exposed by the package."""
+    
+    def test_functions_work(self):
+        """Test a few exported functions."""
+        assert exercises.factorial(5) == 120
+        assert exercises.sum_numbers(100) == 5050
+        assert exercises.find_prime_numbers(20) == [2, 3, 5, 7, 11, 13, 17, 19]
+        assert exercises.is_palindrome("Never odd or even")
+        assert exercises.get_min_max([3, 7, 1]) == (1, 7)
+        assert exercises.celsius_to_fahrenheit(100) == 212
+    
+    @pytest.mark.parametrize("name", exercises.__all__)
+    def test_every_export_resolves(self, name):
+        """Test that every name in __all__ can be loaded."""
+        assert getattr(exercises, name) is not None
+    
+    def test_submodules_are_attributes(self):
+        """Test that submodules can be reached from the package."""
+        assert exercises.loops.sum_numbers(10) == 55
+    
+    def test_unknown_name(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            exercises.does_not_exist
+    
+    def test_dir_lists_exports(self):
+        """Test that dir() shows the lazy names."""
+        assert "find_prime_numbers" in dir(exercises)
+
+
+class TestCommandLine:
+    """Tests for python -m exercises."""
+    
+    def test_calls_function(self, capsys):
+        """Test calling a function with literal arguments."""
+        assert cli_main(["factorial", "10"]) == 0
+        assert capsys.readouterr().out.strip() == "3628800"
+    
+    def test_unknown_function(self, capsys):
+        """Test usage output for an unknown function."""
+        assert cli_main(["nope"]) == 2
+        assert "Usage" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,278 @@
+"""
+Unit tests for primes.py module
+================================
+Tests the segmented sieve prime engine.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from itertools import islice
+
+from primes import (
+    simple_sieve, sieve_segment, iter_segments, segmented_sieve, iter_primes,
+    count_primes, prime_array, pack_flags, PrimeBitset, PrimeTable,
+)
+from loops import find_prime_numbers_naive
+
+
+class TestSimpleSieve:
+    """Tests for simple_sieve function."""
+    
+    def test_small_limits(self):
+        """Test limits below the first primes."""
+        assert simple_sieve(0) == []
+        assert simple_sieve(1) == []
+        assert simple_sieve(2) == [2]
+        assert simple_sieve(3) == [2, 3]
+    
+    def test_matches_trial_division(self):
+        """Test sieve against trial division."""
+        assert simple_sieve(1000) == find_prime_numbers_naive(1000)
+
+
+class TestSegmentedSieve:
+    """Tests for the segmented sieve."""
+    
+    @pytest.mark.parametrize("segment_size", [1, 2, 7, 64, 1000])
+    def test_segment_size_does_not_change_result(self, segment_size):
+        """Test that any segment size gives the same primes."""
+        assert segmented_sieve(2000, segment_size) == find_prime_numbers_naive(2000)
+    
+    def test_limit_is_inclusive(self):
+        """Test that a prime limit is included."""
+        assert segmented_sieve(97)[-1] == 97
+        assert segmented_sieve(96)[-1] == 89
+    
+    def test_prime_count_to_one_million(self):
+        """Test pi(10^6) = 78498."""
+        assert len(segmented_sieve(10 ** 6)) == 78498
+    
+    def test_invalid_segment_size(self):
+        """Test that a non-positive segment size is rejected."""
+        with pytest.raises(ValueError):
+            list(iter_segments(3, 100, 0))
+    
+    def test_segment_flags(self):
+        """Test the flags of a single segment far from zero."""
+        low = 1_000_001
+        flags = sieve_segment(low, low + 100, simple_sieve(1001))
+        found = [low + 2 * i for i, flag in enumerate(flags) if flag]
+        expected = [n for n in range(low, low + 100)
+                    if all(n % d for d in range(2, 1001))]
+        assert found == expected
+
+
+class TestIterPrimes:
+    """Tests for the lazy iter_primes generator."""
+    
+    def test_bounded_range_matches_sieve(self):
+        """Test that iter_primes(2, n) matches the full sieve."""
+        assert list(iter_primes(2, 10_001)) == segmented_sieve(10_000)
+    
+    def test_stop_is_exclusive(self):
+        """Test that stop is not included."""
+        assert list(iter_primes(2, 7)) == [2, 3, 5]
+        assert list(iter_primes(7, 8)) == [7]
+    
+    def test_first_k_primes_unbounded(self):
+        """Test taking the first primes from an unbounded stream."""
+        first = list(islice(iter_primes(), 10))
+        assert first == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    
+    def test_unbounded_stream_crosses_segments(self):
+        """Test that the unbounded stream is correct across many segments."""
+        stream = list(islice(iter_primes(segment_size=256), 78498))
+        assert stream == segmented_sieve(10 ** 6)
+    
+    def test_window_far_from_zero(self):
+        """Test a window near 10^12 without sieving from 2."""
+        primes = list(iter_primes(10 ** 12, 10 ** 12 + 100))
+        assert primes == [1000000000039, 1000000000061, 1000000000063, 1000000000091]
+    
+    def test_empty_ranges(self):
+        """Test ranges that contain no primes."""
+        assert list(iter_primes(0, 2)) == []
+        assert list(iter_primes(24, 29)) == []
+        assert list(iter_primes(100, 50)) == []
+
+
+class TestCountPrimes:
+    """Tests for count_primes (serial and process pool paths)."""
+    
+    @pytest.mark.parametrize("limit,expected", [
+        (0, 0), (1, 0), (2, 1), (3, 2), (10, 4), (100, 25), (10 ** 6, 78498)
+    ])
+    def test_known_values(self, limit, expected):
+        """Test known values of pi(n)."""
+        assert count_primes(limit, workers=1) == expected
+    
+    def test_parallel_matches_serial(self):
+        """Test that the process pool gives the same count."""
+        limit = 300_001
+        serial = count_primes(limit, workers=1, segment_size=512)
+        assert count_primes(limit, workers=2, segment_size=512) == serial
+        assert serial == len(segmented_sieve(limit))
+    
+    def test_invalid_workers(self):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            count_primes(100, workers=0)
+
+
+class TestPrimeArray:
+    """Tests for prime_array."""
+    
+    def test_matches_list(self):
+        """Test that the array holds the same primes as the list."""
+        assert prime_array(10_000).tolist() == segmented_sieve(10_000)
+    
+    def test_small_limits(self):
+        """Test limits with no primes and the 32-bit typecode."""
+        assert prime_array(1).tolist() == []
+        assert prime_array(10).typecode == "I"
+
+
+@pytest.fixture(scope="module")
+def bitset():
+    return PrimeBitset.build(200_000, segment_size=1000)
+
+
+@pytest.fixture(scope="module")
+def primes():
+    return segmented_sieve(200_000)
+
+
+class TestPrimeBitset:
+    """Tests for the odd-only PrimeBitset."""
+    
+    def test_pack_flags(self):
+        """Test bit order of pack_flags."""
+        assert pack_flags(bytes([1, 0, 0, 0, 0, 0, 0, 0, 1])) == bytes([1, 1])
+        assert pack_flags(b"") == b""
+    
+    def test_len_and_iter(self, bitset, primes):
+        """Test len() and iteration."""
+        assert len(bitset) == len(primes)
+        assert list(bitset) == primes
+    
+    def test_contains(self, bitset):
+        """Test membership queries."""
+        assert 2 in bitset
+        assert 199_999 in bitset
+        assert 1 not in bitset
+        assert 4 not in bitset
+        assert 200_003 not in bitset  # prime, but beyond the limit
+        assert "7" not in bitset
+    
+    def test_rank(self, bitset, primes):
+        """Test rank(n) == number of primes <= n."""
+        assert bitset.rank(1) == 0
+        assert bitset.rank(2) == 1
+        assert bitset.rank(100) == 25
+        assert bitset.rank(200_000) == len(primes)
+        for n in range(60_000, 70_000, 37):
+            assert bitset.rank(n) == len([p for p in primes if p <= n])
+    
+    def test_rank_beyond_limit(self, bitset):
+        """Test that rank past the limit is rejected."""
+        with pytest.raises(ValueError):
+            bitset.rank(200_001)
+    
+    def test_select(self, bitset, primes):
+        """Test select(k) == k-th prime."""
+        assert bitset.select(1) == 2
+        assert bitset.select(2) == 3
+        for k in range(1, len(primes) + 1, 97):
+            assert bitset.select(k) == primes[k - 1]
+        assert bitset.select(len(primes)) == primes[-1]
+    
+    def test_select_out_of_range(self, bitset, primes):
+        """Test select outside 1..len()."""
+        with pytest.raises(IndexError):
+            bitset.select(0)
+        with pytest.raises(IndexError):
+            bitset.select(len(primes) + 1)
+    
+    @pytest.mark.parametrize("limit", range(0, 40))
+    def test_small_limits(self, limit):
+        """Test every small limit, including partial bytes."""
+        assert list(PrimeBitset.build(limit)) == segmented_sieve(limit)
+    
+    def test_primes_in(self, bitset, primes):
+        """Test primes_in windows, including the ends of the range."""
+        assert list(bitset.primes_in(0, 30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert list(bitset.primes_in(3, 3)) == []
+        assert list(bitset.primes_in(150_000, 200_001)) == [
+            p for p in primes if p >= 150_000
+        ]
+
+
+class TestPrimeTable:
+    """Tests for the persistent, memory-mapped PrimeTable."""
+    
+    def test_create_and_query(self, tmp_path, primes):
+        """Test building a table and querying it."""
+        with PrimeTable(tmp_path / "primes.bin", 200_000) as table:
+            assert table.limit >= 200_000
+            assert table.is_prime(199_999)
+            assert not table.is_prime(200_001)  # 3 * 66_667
+            assert table.pi(200_000) == len(primes)
+            assert list(table.primes_in(1000, 1100)) == [
+                p for p in primes if 1000 <= p < 1100
+            ]
+            assert table.nth_prime(len(primes)) == primes[-1]
+    
+    def test_empty_table(self, tmp_path):
+        """Test that numbers below 2 can be queried before the table is built."""
+        with PrimeTable(tmp_path / "empty.bin") as table:
+            assert table.limit == 0
+            assert table.pi(1) == 0 and table.pi(-5) == 0
+            assert not table.is_prime(1) and not table.is_prime(0)
+            assert list(table.primes_in(0, 2)) == []
+            with pytest.raises(ValueError):
+                table.pi(2)
+    
+    def test_reopen_without_recomputing(self, tmp_path):
+        """Test that a reopened table keeps its data."""
+        path = tmp_path / "primes.bin"
+        with PrimeTable(path, 1000) as table:
+            limit = table.limit
+        with PrimeTable(path) as table:
+            assert table.limit == limit
+            assert table.pi(1000) == 168
+    
+    def test_grows_incrementally(self, tmp_path):
+        """Test that a larger limit extends an existing table."""
+        path = tmp_path / "primes.bin"
+        with PrimeTable(path, 1000) as table:
+            small_limit = table.limit
+        with PrimeTable(path, 10 ** 6) as table:
+            assert table.limit > small_limit
+            assert table.pi(10 ** 6) == 78498
+            assert list(table.primes_in(0, table.limit + 1)) == segmented_sieve(table.limit)
+    
+    def test_query_beyond_limit(self, tmp_path):
+        """Test that queries past the table limit are rejected."""
+        with PrimeTable(tmp_path / "primes.bin", 1000) as table:
+            with pytest.raises(ValueError):
+                table.is_prime(table.limit + 2)
+            with pytest.raises(ValueError):
+                table.pi(table.limit + 1)
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the magic trailer is rejected."""
+        path = tmp_path / "not_primes.bin"
+        path.write_bytes(b"hello world, this is not a prime table")
+        with pytest.raises(ValueError):
+            PrimeTable(path)
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
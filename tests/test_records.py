@@ -0,0 +1,135 @@
+"""
+Unit tests for records.py module
+=================================
+Tests the __slots__ record classes and the columnar RecordTable.
+"""
+
+import pytest
+import sys
+from array import array
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from records import Record, Point, Color, Person, Student, StringColumn, RecordTable
+
+PEOPLE = [("Alice", 25, "Engineer"), ("Bob", 31, "Teacher"), ("Cara", 25, "Engineer")]
+
+
+class TestRecords:
+    """Tests for the __slots__ record classes."""
+    
+    def test_unpacking_and_fields(self):
+        """Test that records unpack like tuples and name their fields."""
+        name, age, job = Person("Alice", 25, "Engineer")
+        assert (name, age, job) == PEOPLE[0]
+        point = Point(x=1, y=2)
+        assert (point.x, point.y) == (1, 2)
+        assert point[1] == 2 and len(point) == 2
+        assert Color(255, 0, 0).astuple() == (255, 0, 0)
+    
+    def test_no_instance_dict(self):
+        """Test that records use slots instead of a __dict__."""
+        point = Point(1, 2)
+        assert not hasattr(point, "__dict__")
+        with pytest.raises(AttributeError):
+            point.z = 3
+    
+    def test_wrong_fields(self):
+        """Test missing, extra and unknown fields."""
+        with pytest.raises(TypeError):
+            Point(1)
+        with pytest.raises(TypeError):
+            Point(1, 2, 3)
+        with pytest.raises(TypeError):
+            Point(1, 2, z=3)
+    
+    def test_compare_and_sort(self):
+        """Test equality, ordering and repr."""
+        students = [Student("Ana", 85), Student("Carlos", 92), Student("Diana", 78)]
+        assert max(students, key=lambda s: s.grade) == Student("Carlos", 92)
+        assert sorted(students)[0].name == "Ana"
+        assert Point(1, 2) != (1, 2)
+        assert repr(Student("Ana", 85)) == "Student(name='Ana', grade=85)"
+    
+    def test_hashable(self):
+        """Test that records can be dict keys and set members."""
+        locations = {Point(40.7, -74.0): "New York"}
+        assert locations[Point(40.7, -74.0)] == "New York"
+        assert hash(Color(1, 2, 3)) == hash((1, 2, 3))
+        assert len({Person("Ana", 30, "Chef"), Person("Ana", 30, "Chef")}) == 1
+    
+    def test_subclass_adds_fields(self):
+        """Test that a subclass extends its parent's fields."""
+        class Point3(Point):
+            __slots__ = ("z",)
+        assert tuple(Point3(1, 2, 3)) == (1, 2, 3)
+        assert issubclass(Point3, Record)
+
+
+class TestRecordTable:
+    """Tests for the columnar record table."""
+    
+    def make_people(self, **kwargs):
+        return RecordTable({"name": "str", "age": "B", "job": "str"}, PEOPLE, **kwargs)
+    
+    def test_rows_and_columns(self):
+        """Test indexing, iteration and column storage."""
+        table = self.make_people()
+        assert len(table) == 3
+        assert table[0] == PEOPLE[0] and table[-1] == PEOPLE[-1]
+        assert list(table) == PEOPLE
+        assert table.column("age") == array("B", [25, 31, 25])
+        with pytest.raises(IndexError):
+            table[3]
+    
+    def test_strings_are_dictionary_encoded(self):
+        """Test that repeated strings are stored once."""
+        jobs = self.make_people().column("job")
+        assert jobs.values == ["Engineer", "Teacher"]
+        assert list(jobs.codes) == [0, 1, 0]
+        assert list(StringColumn(["a", "b", "a"])) == ["a", "b", "a"]
+    
+    def test_record_type(self):
+        """Test returning rows as record instances."""
+        table = self.make_people(record_type=Person)
+        assert table[1] == Person("Bob", 31, "Teacher")
+        assert [person.name for person in table] == ["Alice", "Bob", "Cara"]
+        table.append(Person("Dan", 40, "Chef"))
+        assert table[3].job == "Chef"
+    
+    def test_sort(self):
+        """Test sorting by one field and by several fields."""
+        table = self.make_people()
+        table.sort("name", reverse=True)
+        assert [row[0] for row in table] == ["Cara", "Bob", "Alice"]
+        table.sort(("age", "name"))
+        assert list(table) == [PEOPLE[0], PEOPLE[2], PEOPLE[1]]
+    
+    def test_invalid_rows(self):
+        """Test rows with the wrong number of values and empty schemas."""
+        table = self.make_people()
+        with pytest.raises(ValueError):
+            table.append(("Eve", 30))
+        with pytest.raises(ValueError):
+            RecordTable({})
+    
+    @pytest.mark.parametrize("row", [
+        ("Bob", "x", "Dev"), ("Bob", 300, "Dev"), ("Bob", 30, 7), (None, 30, "Dev"),
+    ])
+    def test_bad_value_leaves_table_unchanged(self, row):
+        """Test that a row with a bad value is rejected as a whole."""
+        table = self.make_people()
+        with pytest.raises((TypeError, OverflowError)):
+            table.append(row)
+        assert len(table) == 3
+        assert list(table) == PEOPLE
+        assert all(len(column) == 3 for column in table._columns)
+        assert table.column("name").values == ["Alice", "Bob", "Cara"]
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+"""
+Unit tests for rules.py module
+===============================
+Tests the decision-table compiler against the hand-written conditionals
+in control_flow.py.
+"""
+
+import json
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from rules import DecisionTable, threshold_rules, age_table, weather_table, grade_table
+from control_flow import get_grade_naive, weather_advice
+
+
+class TestControlFlowTables:
+    """Tests that the tables reproduce control_flow's decisions."""
+    
+    def test_weather_table(self):
+        """Test every temperature band with and without rain."""
+        table = weather_table()
+        for temperature in [x / 2 for x in range(-20, 90)]:
+            for is_raining in (True, False):
+                advice = table.evaluate(temperature=temperature, is_raining=is_raining)
+                assert list(advice) == weather_advice(temperature, is_raining)
+    
+    def test_grade_table(self):
+        """Test single and batch grading against the if/elif chain."""
+        table = grade_table()
+        rng = random.Random(1)
+        scores = [rng.uniform(-10, 110) for _ in range(500)] + list(range(0, 101))
+        assert table.evaluate_many({"score": scores}) == [get_grade_naive(s) for s in scores]
+        assert table.evaluate({"score": 90}) == "A"
+    
+    def test_age_table(self):
+        """Test the adult/minor boundary."""
+        table = age_table()
+        assert [table.evaluate(age=a) for a in (17, 18, 40)] == ["minor", "adult", "adult"]
+
+
+class TestDecisionTable:
+    """Tests for rule compilation and evaluation."""
+    
+    def test_first_matching_rule_wins(self):
+        """Test that earlier rules take priority over later ones."""
+        table = DecisionTable([
+            ((("x", "<", 10),), "small"),
+            ((("x", "<=", 100), ("y", "==", 1)), "medium one"),
+            ((("x", "<=", 100),), "medium"),
+        ], default="large")
+        assert table.evaluate(x=5, y=1) == "small"
+        assert table.evaluate(x=10, y=1) == "medium one"
+        assert table.evaluate(x=100, y=0) == "medium"
+        assert table.evaluate(x=100.5, y=1) == "large"
+        assert table.evaluate_many({"x": [5, 50, 500], "y": [0, 1, 1]}) == ["small", "medium one", "large"]
+    
+    def test_replace_rules(self):
+        """Test changing thresholds at runtime."""
+        table = age_table()
+        assert table.evaluate(age=19) == "adult"
+        table.replace_rules([((("age", ">=", 21),), "adult")], default="minor")
+        assert table.evaluate(age=19) == "minor"
+    
+    def test_load_json(self, tmp_path):
+        """Test reading rules from a JSON file."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({
+            "default": "cold",
+            "rules": [{"when": [["temperature", ">", 25]], "then": "hot"}],
+        }))
+        table = DecisionTable.load(path)
+        assert table.fields == ("temperature",)
+        assert table.evaluate_many({"temperature": [20, 30]}) == ["cold", "hot"]
+    
+    def test_threshold_rules(self):
+        """Test building rules from a threshold table."""
+        assert threshold_rules("s", ((1, "low"), (5, "high"))) == [
+            ((("s", ">=", 5),), "high"), ((("s", ">=", 1),), "low"),
+        ]
+    
+    def test_no_rules(self):
+        """Test that a table without rules returns the default."""
+        table = DecisionTable(default="none")
+        assert table.evaluate(x=1) == "none"
+        assert table.evaluate_many({"x": [1, 2]}) == ["none", "none"]
+    
+    def test_invalid_rules(self, monkeypatch):
+        """Test unknown operators and tables that would be too large."""
+        with pytest.raises(ValueError):
+            DecisionTable([((("x", "!=", 1),), "a")])
+        import rules
+        monkeypatch.setattr(rules, "MAX_CELLS", 10)
+        with pytest.raises(ValueError):
+            DecisionTable([((("x", ">", i),), i) for i in range(10)])
+    
+    def test_numpy_columns(self):
+        """Test discretizing NumPy columns with searchsorted."""
+        np = pytest.importorskip("numpy")
+        scores = np.array([95, 89.5, 60, 12])
+        assert grade_table().evaluate_many({"score": scores}) == ["A", "B", "D", "F"]
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
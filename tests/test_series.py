@@ -0,0 +1,93 @@
+"""
+Unit tests for series.py module
+================================
+Tests the closed-form arithmetic series helpers.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from series import range_length, sum_range, bernoulli, sum_powers, sum_numbers_many
+from loops import sum_numbers, sum_numbers_naive
+
+
+class TestSumRange:
+    """Tests for sum_range and range_length."""
+    
+    @pytest.mark.parametrize("start,stop,step", [
+        (1, 11, 1), (0, 0, 1), (5, 1, 1), (1, 20, 3), (20, 1, -3),
+        (-10, 10, 4), (10, -10, -1), (3, 4, 100),
+    ])
+    def test_matches_builtin_sum(self, start, stop, step):
+        """Test against sum(range(...))."""
+        assert sum_range(start, stop, step) == sum(range(start, stop, step))
+        assert range_length(start, stop, step) == len(range(start, stop, step))
+    
+    def test_huge_range_is_exact(self):
+        """Test a range far beyond sys.maxsize."""
+        n = 10 ** 30
+        assert sum_range(1, n + 1) == n * (n + 1) // 2
+    
+    def test_zero_step(self):
+        """Test that a zero step is rejected like range()."""
+        with pytest.raises(ValueError):
+            sum_range(1, 10, 0)
+
+
+class TestSumPowers:
+    """Tests for Faulhaber's formula."""
+    
+    def test_bernoulli_numbers(self):
+        """Test a few known Bernoulli numbers."""
+        assert bernoulli(0) == 1
+        assert bernoulli(1) == pytest.approx(0.5)
+        assert str(bernoulli(12)) == "-691/2730"
+        assert bernoulli(13) == 0
+    
+    @pytest.mark.parametrize("p", range(0, 8))
+    def test_matches_loop(self, p):
+        """Test against a direct loop for small n."""
+        for n in range(0, 25):
+            assert sum_powers(n, p) == sum(k ** p for k in range(1, n + 1))
+    
+    def test_sum_of_cubes_identity(self):
+        """Test 1^3 + ... + n^3 == (1 + ... + n)^2 for a huge n."""
+        n = 10 ** 12
+        assert sum_powers(n, 3) == sum_numbers(n) ** 2
+    
+    def test_negative_power(self):
+        """Test that negative powers are rejected."""
+        with pytest.raises(ValueError):
+            sum_powers(10, -1)
+
+
+class TestSumNumbersMany:
+    """Tests for the batched sum_numbers_many."""
+    
+    def test_list_input(self):
+        """Test exact results for a list, including big ints."""
+        ns = [0, 1, 10, -4, 10 ** 20]
+        assert sum_numbers_many(ns) == [sum_numbers(n) for n in ns]
+    
+    def test_matches_loop_version(self):
+        """Test against the loop version."""
+        ns = range(0, 60)
+        assert sum_numbers_many(ns) == [sum_numbers_naive(n) for n in ns]
+    
+    def test_numpy_input(self):
+        """Test the vectorized NumPy path and its big-int fallback."""
+        np = pytest.importorskip("numpy")
+        result = sum_numbers_many(np.arange(100))
+        assert result.tolist() == [sum_numbers(n) for n in range(100)]
+        big = np.array([10, 2 ** 40], dtype=np.int64)
+        assert sum_numbers_many(big) == [55, sum_numbers(2 ** 40)]
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,221 @@
+"""
+Unit tests for sketches.py module
+==================================
+Tests HyperLogLog, Count-Min Sketch, the heavy-hitters tracker and the
+Bloom filter.
+"""
+
+import pytest
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from sketches import (
+    hash64, HyperLogLog, CountMinSketch, HeavyHitters, count_unique,
+    BloomFilter, dedup,
+)
+from words import sketch_word_stats, word_stats
+
+
+class TestHashing:
+    """Tests for the process-independent hash."""
+    
+    def test_hash_is_stable(self):
+        """Test that the hash does not depend on the process (known value)."""
+        assert hash64("apple") == 16118089804393287318
+        assert hash64("apple") == hash64(b"apple")
+        assert hash64("apple") != hash64("Apple")
+        assert 0 <= hash64("apple") < 2 ** 64
+
+
+class TestHyperLogLog:
+    """Tests for the HyperLogLog distinct counter."""
+    
+    def test_small_counts_are_close(self):
+        """Test small cardinalities (linear counting range)."""
+        sketch = HyperLogLog(0.01)
+        sketch.update(["a", "b", "c", "a", "b"])
+        assert sketch.count() == 3
+    
+    def test_large_count_within_error(self):
+        """Test a larger cardinality against its error bound."""
+        sketch = HyperLogLog(0.01)
+        sketch.update(f"user{i}@email.com" for i in range(50_000))
+        assert abs(sketch.count() - 50_000) / 50_000 < 5 * sketch.error_rate
+    
+    def test_merge_is_union(self):
+        """Test merging two overlapping shards."""
+        left, right = HyperLogLog(0.02), HyperLogLog(0.02)
+        left.update(range(0, 20_000))
+        right.update(range(10_000, 30_000))
+        left.merge(right)
+        assert abs(left.count() - 30_000) / 30_000 < 5 * left.error_rate
+    
+    def test_invalid_arguments(self):
+        """Test invalid error rate, precision and merge."""
+        with pytest.raises(ValueError):
+            HyperLogLog(error_rate=0)
+        with pytest.raises(ValueError):
+            HyperLogLog(precision=30)
+        with pytest.raises(ValueError):
+            HyperLogLog(precision=8).merge(HyperLogLog(precision=10))
+
+
+class TestCountMinSketch:
+    """Tests for the Count-Min Sketch."""
+    
+    def test_never_underestimates(self):
+        """Test that estimates are at least the true counts."""
+        sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+        rng = random.Random(1)
+        items = [rng.randrange(500) for _ in range(5_000)]
+        for item in items:
+            sketch.add(item)
+        for item, count in Counter(items).items():
+            assert count <= sketch.estimate(item) <= count + 0.01 * len(items) * 3
+    
+    def test_merge_adds_counts(self):
+        """Test merging two sketches."""
+        left, right = CountMinSketch(), CountMinSketch()
+        left.add("x", 3)
+        right.add("x", 4)
+        left.merge(right)
+        assert left.estimate("x") == 7
+        assert left.total == 7
+    
+    def test_merge_requires_same_dimensions(self):
+        """Test that different dimensions cannot be merged."""
+        with pytest.raises(ValueError):
+            CountMinSketch(epsilon=0.01).merge(CountMinSketch(epsilon=0.1))
+
+
+class TestHeavyHitters:
+    """Tests for the heavy-hitters tracker."""
+    
+    @pytest.fixture
+    def stream(self):
+        words = ["a"] * 500 + ["b"] * 300 + ["c"] * 200 + [f"w{i}" for i in range(3000)]
+        random.Random(7).shuffle(words)
+        return words
+    
+    def test_finds_most_frequent(self, stream):
+        """Test that the top items are found in order."""
+        tracker = HeavyHitters(k=3)
+        tracker.update(stream)
+        assert [item for item, _ in tracker.items()] == ["a", "b", "c"]
+    
+    def test_merge_shards(self, stream):
+        """Test merging trackers built on two halves of a stream."""
+        left, right = HeavyHitters(k=3), HeavyHitters(k=3)
+        left.update(stream[:1700])
+        right.update(stream[1700:])
+        left.merge(right)
+        top = dict(left.items())
+        assert list(top) == ["a", "b", "c"]
+        assert top["a"] >= 500
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter and streaming dedup."""
+    
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as seen."""
+        bloom = BloomFilter(capacity=1000, fp_rate=0.01)
+        assert all(bloom.add(f"item{i}") for i in range(500))
+        assert all(f"item{i}" in bloom for i in range(500))
+        assert not bloom.add("item7")
+        assert len(bloom) == 500
+    
+    def test_false_positive_rate(self):
+        """Test that the false positive rate is near the target at capacity."""
+        bloom = BloomFilter(capacity=2000, fp_rate=0.01)
+        for i in range(2000):
+            bloom.add(i)
+        false_positives = sum(f"other{i}" in bloom for i in range(5000))
+        assert false_positives / 5000 < 0.03
+    
+    def test_invalid_arguments(self):
+        """Test that capacity and fp_rate are validated."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(fp_rate=1.0)
+    
+    def test_merge(self):
+        """Test the union of two filters."""
+        left, right = BloomFilter(100, 0.01), BloomFilter(100, 0.01)
+        left.add("a")
+        right.add("b")
+        left.merge(right)
+        assert "a" in left and "b" in left
+        with pytest.raises(ValueError):
+            left.merge(BloomFilter(1000, 0.01))
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved filter loads with the same contents."""
+        bloom = BloomFilter(100, 0.01)
+        bloom.add("kept")
+        path = tmp_path / "seen.bloom"
+        bloom.save(path)
+        loaded = BloomFilter.load(path)
+        assert "kept" in loaded
+        assert (loaded.num_bits, loaded.num_hashes, len(loaded)) == (bloom.num_bits, bloom.num_hashes, 1)
+        path.write_bytes(b"junk")
+        with pytest.raises(ValueError):
+            BloomFilter.load(path)
+    
+    def test_dedup_keeps_first_seen_order(self):
+        """Test that dedup yields each item once, in first-seen order."""
+        emails = ["a@x.com", "b@x.com", "a@x.com", "c@x.com", "b@x.com"]
+        assert list(dedup(emails, capacity=100)) == ["a@x.com", "b@x.com", "c@x.com"]
+    
+    def test_dedup_verify_is_exact(self):
+        """Test that a verify set recovers items dropped by false positives."""
+        items = list(range(3000))
+        # A tiny filter has many false positives on its own
+        assert len(list(dedup(items, capacity=10, fp_rate=0.5))) < 3000
+        assert list(dedup(items + items, capacity=10, fp_rate=0.5, verify=set())) == items
+    
+    def test_dedup_resumes_from_disk(self, tmp_path):
+        """Test that a second run skips items the first run yielded."""
+        path = tmp_path / "emails.bloom"
+        assert list(dedup(["a", "b"], capacity=100, path=path)) == ["a", "b"]
+        assert list(dedup(["b", "c", "a", "d"], capacity=100, path=path)) == ["c", "d"]
+    
+    def test_dedup_resume_with_verify(self, tmp_path):
+        """Test resuming with a persistent verify store, and rejecting an empty one."""
+        path = tmp_path / "letters.bloom"
+        seen = set()
+        assert list(dedup(["a", "b", "c"], capacity=100, verify=seen, path=path)) == ["a", "b", "c"]
+        assert list(dedup(["a", "b", "c", "d"], capacity=100, verify=seen, path=path)) == ["d"]
+        with pytest.raises(ValueError):
+            list(dedup(["a", "b", "c", "d"], capacity=100, verify=set(), path=path))
+
+
+class TestApproximateCounting:
+    """Tests for count_unique and sketch_word_stats."""
+    
+    def test_count_unique_modes(self):
+        """Test exact and approximate unique counts."""
+        emails = ["user1@email.com", "user2@email.com", "user1@email.com"]
+        assert count_unique(emails) == 2
+        assert count_unique(emails, exact=False) == 2
+    
+    def test_sketch_word_stats(self):
+        """Test approximate word statistics against the exact ones."""
+        text = "the cat and the hat and the bat"
+        approximate = sketch_word_stats([text], top_k=2)
+        exact = word_stats(text, top_k=2)
+        assert approximate.total == exact.total
+        assert approximate.unique == exact.unique
+        assert approximate.top == exact.top
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+"""
+Unit tests for stats.py module
+===============================
+Tests the single-pass, mergeable RunningStats reducer and the chunked
+reader for binary numeric files.
+"""
+
+import pytest
+import statistics
+import sys
+from array import array
+from math import isnan
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from stats import RunningStats, stream_stats, merge_stats, chunk_stats, file_stats
+from functions import get_min_max
+
+DATA = [5, 10, 15, 20, -3, 7, 7, 42]
+
+
+class TestRunningStats:
+    """Tests for RunningStats."""
+    
+    def test_matches_statistics_module(self):
+        """Test every field against the statistics module."""
+        stats = stream_stats(DATA, chunk_size=3)
+        assert (stats.count, stats.total, stats.minimum, stats.maximum) == (8, 103, -3, 42)
+        assert stats.mean == pytest.approx(statistics.fmean(DATA))
+        assert stats.variance == pytest.approx(statistics.pvariance(DATA))
+        assert stats.sample_variance == pytest.approx(statistics.variance(DATA))
+        assert stats.stdev == pytest.approx(statistics.pstdev(DATA))
+    
+    def test_add_matches_update(self):
+        """Test that Welford's per-value update agrees with chunked updates."""
+        stats = RunningStats()
+        for value in DATA:
+            stats.add(value)
+        chunked = stream_stats(DATA)
+        assert (stats.count, stats.total, stats.minimum, stats.maximum) == (
+            chunked.count, chunked.total, chunked.minimum, chunked.maximum)
+        assert stats.variance == pytest.approx(chunked.variance)
+    
+    def test_generator_single_pass(self):
+        """Test a generator, which can only be read once."""
+        stats = stream_stats(x * 0.5 for x in range(10001))
+        assert stats.count == 10001
+        assert stats.total == pytest.approx(sum(x * 0.5 for x in range(10001)))
+        assert stats.maximum == 5000.0
+    
+    def test_int_sum_is_exact(self):
+        """Test that big int sums are not rounded to floats."""
+        assert stream_stats([10 ** 20, 1, 1]).total == 10 ** 20 + 2
+    
+    def test_merge_chunks(self):
+        """Test that merging per-chunk stats equals one pass over everything."""
+        parts = [stream_stats(DATA[:3]), stream_stats([]), stream_stats(DATA[3:])]
+        merged = merge_stats(parts)
+        whole = stream_stats(DATA)
+        assert (merged.count, merged.total, merged.minimum, merged.maximum) == (
+            whole.count, whole.total, whole.minimum, whole.maximum)
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.variance == pytest.approx(whole.variance)
+    
+    def test_empty(self):
+        """Test the stats of an empty stream."""
+        stats = stream_stats([])
+        assert stats.count == 0 and stats.minimum is None
+        assert isnan(stats.mean) and isnan(stats.variance)
+        with pytest.raises(ValueError):
+            stream_stats([1], chunk_size=0)
+    
+    def test_numpy_array(self):
+        """Test the vectorized path for NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        stats = stream_stats(np.array(DATA))
+        assert (stats.count, stats.total, stats.minimum, stats.maximum) == (8, 103, -3, 42)
+        assert stats.variance == pytest.approx(statistics.pvariance(DATA))
+    
+    def test_numpy_int_sum_is_exact(self):
+        """Test that int64/uint64 totals do not wrap around at 2**63."""
+        np = pytest.importorskip("numpy")
+        assert stream_stats(np.array([2 ** 62, 2 ** 62])).total == 2 ** 63
+        extremes = [-2 ** 63, -2 ** 63, 2 ** 63 - 1, 7]
+        assert stream_stats(np.array(extremes, dtype=np.int64)).total == sum(extremes)
+        big = [2 ** 64 - 1] * 3
+        assert stream_stats(np.array(big, dtype=np.uint64)).total == sum(big)
+        assert stream_stats(np.array([1, 2, 3], dtype=np.int8)).total == 6
+
+
+@pytest.fixture
+def int_file(tmp_path):
+    """A raw int64 file and the values written to it."""
+    values = array("q", [(i * 7919) % 1000 - 500 for i in range(10000)])
+    path = tmp_path / "values.i64"
+    with open(path, "wb") as f:
+        values.tofile(f)
+    return path, values
+
+
+class TestFileStats:
+    """Tests for stats over memory-mapped numeric files."""
+    
+    def test_int64_serial(self, int_file):
+        """Test that a file gives the same stats as the values in memory."""
+        path, values = int_file
+        stats = file_stats(path, "int64", chunk_size=8 * 999, workers=1)
+        expected = stream_stats(values)
+        assert (stats.count, stats.total, stats.minimum, stats.maximum) == (
+            expected.count, expected.total, expected.minimum, expected.maximum)
+        assert stats.variance == pytest.approx(expected.variance)
+    
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_float64_pools(self, tmp_path, executor):
+        """Test float64 files reduced in thread and process pools."""
+        values = array("d", [x / 3 for x in range(5000)])
+        path = tmp_path / "values.f64"
+        path.write_bytes(values.tobytes())
+        stats = file_stats(path, chunk_size=8 * 512, workers=2, executor=executor)
+        assert stats.count == 5000
+        assert stats.total == pytest.approx(sum(values))
+        assert stats.maximum == values[-1]
+        assert stats.variance == pytest.approx(statistics.pvariance(values))
+    
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_int64_total_near_limit(self, tmp_path, monkeypatch, use_numpy):
+        """Test exact totals near 2**63 with and without NumPy loaded."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        values = array("q", [2 ** 63 - 1, 2 ** 62, -2 ** 63, 2 ** 63 - 1, 2 ** 63 - 2] * 50)
+        path = tmp_path / "big.i64"
+        path.write_bytes(values.tobytes())
+        stats = file_stats(path, "int64", chunk_size=8 * 32, workers=1)
+        assert stats.total == sum(values)
+        assert (stats.minimum, stats.maximum) == (-2 ** 63, 2 ** 63 - 1)
+    
+    def test_chunk_stats_range(self, int_file):
+        """Test reducing one range of values."""
+        path, values = int_file
+        assert chunk_stats(path, "int64", 10, 20).total == sum(values[10:20])
+        assert chunk_stats(path, "int64", 5, 5).count == 0
+    
+    def test_empty_file(self, tmp_path):
+        """Test an empty file."""
+        path = tmp_path / "empty.f64"
+        path.write_bytes(b"")
+        assert file_stats(path).count == 0
+    
+    def test_invalid_arguments(self, tmp_path, int_file):
+        """Test bad dtypes, executors and partial values."""
+        path, _ = int_file
+        with pytest.raises(ValueError):
+            file_stats(path, "int32")
+        with pytest.raises(ValueError):
+            file_stats(path, executor="fiber")
+        with pytest.raises(ValueError):
+            file_stats(path, workers=0)
+        odd = tmp_path / "odd.bin"
+        odd.write_bytes(b"123")
+        with pytest.raises(ValueError):
+            file_stats(odd)
+
+
+class TestGetMinMax:
+    """Tests for the one-pass functions.get_min_max."""
+    
+    def test_iterables(self):
+        """Test lists and generators."""
+        assert get_min_max([3, 7, 1]) == (1, 7)
+        assert get_min_max(x % 7 for x in range(100)) == (0, 6)
+    
+    def test_non_numeric(self):
+        """Test comparable values that cannot be summed."""
+        assert get_min_max(["b", "a", "c"]) == ("a", "c")
+        assert get_min_max(iter([(2, "x"), (1, "y")])) == ((1, "y"), (2, "x"))
+    
+    def test_empty_raises(self):
+        """Test that an empty input raises ValueError like min()."""
+        with pytest.raises(ValueError):
+            get_min_max([])
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
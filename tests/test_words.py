@@ -0,0 +1,188 @@
+"""
+Unit tests for words.py module
+===============================
+Tests the single-pass word statistics engine.
+"""
+
+import io
+import pytest
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add exercises folder to path
+exercises_path = Path(__file__).parent.parent / "exercises"
+sys.path.insert(0, str(exercises_path))
+
+from words import (
+    count_words, top_words, word_stats, word_stats_stream, chunk_offsets,
+    count_chunk, merge_counters, count_words_in_files, word_stats_files,
+    count_tokens, decode_counts, count_words_mmap,
+)
+
+
+class TestWordStats:
+    """Tests for word_stats and word_stats_stream."""
+    
+    def test_counts(self):
+        """Test total, unique and duplicate counts."""
+        stats = word_stats("the cat and the hat and THE bat")
+        assert stats.total == 8
+        assert stats.unique == 5
+        assert stats.duplicates == 3
+        assert stats.counts["the"] == 3
+    
+    def test_top_words(self):
+        """Test that the most common words come first."""
+        stats = word_stats("a b b c c c d d d d", top_k=2)
+        assert stats.top == [("d", 4), ("c", 3)]
+    
+    def test_empty_text(self):
+        """Test an empty text."""
+        stats = word_stats("   ")
+        assert (stats.total, stats.unique, stats.duplicates, stats.top) == (0, 0, 0, [])
+    
+    def test_stream_matches_text(self):
+        """Test that streaming lines gives the same result as one text."""
+        text = "one two three\ntwo three\nthree\n"
+        streamed = word_stats_stream(io.StringIO(text))
+        assert streamed == word_stats(text)
+    
+    def test_stream_is_lazy(self):
+        """Test that a generator of lines is consumed one line at a time."""
+        def lines():
+            for i in range(10_000):
+                yield f"word{i % 7} common\n"
+        stats = word_stats_stream(lines(), top_k=1)
+        assert stats.total == 20_000
+        assert stats.top == [("common", 10_000)]
+
+
+class TestHelpers:
+    """Tests for count_words and top_words."""
+    
+    def test_count_words_matches_counter(self):
+        """Test against Counter over split words."""
+        lines = ["Hello world", "hello  Python\tworld"]
+        assert count_words(lines) == Counter(" ".join(lines).lower().split())
+    
+    def test_top_words_k_larger_than_vocabulary(self):
+        """Test k larger than the number of unique words."""
+        assert top_words(Counter({"x": 2, "y": 1}), 10) == [("x", 2), ("y", 1)]
+
+
+@pytest.fixture
+def text_dir(tmp_path):
+    """A directory tree with a few text files."""
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "a.txt").write_text("alpha beta\nbeta gamma\n" * 50)
+    (tmp_path / "logs" / "b.log").write_text("Beta DELTA\nalpha\n" * 30)
+    (tmp_path / "logs" / "empty.log").write_text("")
+    return tmp_path
+
+
+def expected_counts(directory):
+    counts = Counter()
+    for path in sorted(directory.rglob("*")):
+        if path.is_file():
+            counts.update(path.read_text().lower().split())
+    return counts
+
+
+class TestMapReduce:
+    """Tests for map-reduce word counting over files."""
+    
+    def test_chunk_offsets_end_on_newlines(self, tmp_path):
+        """Test that chunks cover the file and end after a newline."""
+        path = tmp_path / "lines.txt"
+        path.write_bytes(b"one two\nthree\nfour five six\nseven")
+        offsets = chunk_offsets(path, chunk_size=5)
+        data = path.read_bytes()
+        assert offsets[0][0] == 0 and offsets[-1][1] == len(data)
+        for (_, end), (start, _) in zip(offsets, offsets[1:]):
+            assert end == start
+            assert data[end - 1:end] == b"\n"
+    
+    def test_count_chunk(self, tmp_path):
+        """Test counting one byte range."""
+        path = tmp_path / "lines.txt"
+        path.write_bytes(b"a b\nb c\n")
+        assert count_chunk(path, 4, 8) == Counter({"b": 1, "c": 1})
+    
+    def test_merge_counters(self):
+        """Test the tree reduction with an odd number of counters."""
+        counters = [Counter({"x": i, "y": 1}) for i in range(1, 6)]
+        assert merge_counters(counters) == Counter({"x": 15, "y": 5})
+        assert merge_counters([]) == Counter()
+    
+    def test_serial_counts_directory(self, text_dir):
+        """Test counting a directory tree in one process."""
+        counts = count_words_in_files([text_dir], workers=1, chunk_size=64)
+        assert counts == expected_counts(text_dir)
+    
+    def test_parallel_matches_serial(self, text_dir):
+        """Test that the process pool gives the same counts."""
+        counts = count_words_in_files([text_dir], workers=2, chunk_size=100)
+        assert counts == expected_counts(text_dir)
+    
+    def test_word_stats_files(self, text_dir):
+        """Test the WordStats summary for files."""
+        stats = word_stats_files([text_dir], workers=1, top_k=1)
+        assert stats.top == [("beta", 130)]
+        assert stats.unique == 4
+
+
+
+class TestMmapTokenizer:
+    """Tests for the bytes tokenizer over memory maps."""
+    
+    def test_count_tokens_lowercases_ascii(self):
+        """Test that tokens are lowercased bytes split on whitespace."""
+        counts = count_tokens(b"The cat\tTHE\r\nhat  the")
+        assert counts == Counter({b"the": 3, b"cat": 1, b"hat": 1})
+    
+    def test_small_windows_do_not_split_words(self):
+        """Test that window cuts land on whitespace."""
+        data = b"alpha beta gamma delta " * 20
+        for window_size in (1, 3, 7, 64):
+            assert count_tokens(data, window_size=window_size) == count_tokens(data)
+    
+    def test_range_and_memoryview(self):
+        """Test counting part of a memoryview."""
+        data = memoryview(b"a b\nb c\n")
+        assert count_tokens(data, 4, 8) == Counter({b"b": 1, b"c": 1})
+    
+    def test_invalid_window_size(self):
+        """Test that the window size must be positive."""
+        with pytest.raises(ValueError):
+            count_tokens(b"a", window_size=0)
+    
+    def test_decode_counts(self):
+        """Test decoding keys, merging tokens that decode to the same text."""
+        counts = decode_counts(Counter({"café".encode(): 2, b"\xff": 1, b"\xfe": 1}))
+        assert counts == Counter({"café": 2, "\ufffd": 2})
+    
+    def test_matches_str_split_for_ascii(self, text_dir):
+        """Test that ASCII files count the same as str.lower().split()."""
+        path = text_dir / "a.txt"
+        expected = Counter(path.read_text().lower().split())
+        assert count_words_mmap(path, window_size=16) == expected
+    
+    @pytest.mark.parametrize("text", ["Café CAFÉ", "a\xa0b c\u2003d", "x\x1cy", "ΣΑΣ σας"])
+    def test_non_ascii_matches_word_stats(self, tmp_path, text):
+        """Test that non-ASCII text is tokenized like str.lower().split()."""
+        path = tmp_path / "unicode.txt"
+        path.write_text(f"plain ascii line\n{text}\n", encoding="utf-8")
+        expected = word_stats(path.read_text(encoding="utf-8")).counts
+        assert count_words_mmap(path, window_size=4) == expected
+        assert word_stats_files([path], workers=1).counts == expected
+    
+    def test_empty_file_and_range(self, text_dir):
+        """Test an empty file and an empty byte range."""
+        assert count_words_mmap(text_dir / "logs" / "empty.log") == Counter()
+        assert count_words_mmap(text_dir / "a.txt", 5, 5) == Counter()
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])